@@ -0,0 +1,248 @@
+"""Running totals of answer counts for constant-time window queries."""
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from metrics import VALUE_SUFFIX, WindowMetrics, answer_fields, value_matrix
+from snapshot import SheetSnapshot
+
+
+def _count_column(field: str, index: int) -> str:
+    return f"count:{field}:{index}"
+
+
+def _sum_column(field: str) -> str:
+    return f"sum:{field}{VALUE_SUFFIX}"
+
+
+def _seen_column(field: str) -> str:
+    return f"seen:{field}{VALUE_SUFFIX}"
+
+
+def _digest(rows: pd.DataFrame, columns: List[str], offset: int = 0) -> int:
+    """
+    Fingerprint of history rows, extendable one block of rows at a time.
+
+    Each row's hash is mixed with its position in the history, so the
+    digest of rows ``0..n`` is the digest of ``0..k`` plus that of
+    ``k..n`` (modulo 2**64) and moving, editing or dropping a row changes it.
+    """
+    hashes = pd.util.hash_pandas_object(rows[columns], index=False).to_numpy()
+    positions = np.arange(offset, offset + len(rows), dtype=np.uint64)
+    return int(pd.util.hash_array(hashes ^ positions).sum())
+
+
+class RunningAggregates:
+    """
+    Cumulative answer counts and value sums over a sheet's history.
+
+    Row ``i`` of the table holds the totals of history entries ``0..i``, so
+    the metrics of any window (a day, a week, a month or the last N
+    entries) are the difference of two table rows, however long the
+    history gets. New form rows are folded in by extending the table, and
+    the table is persisted as a :class:`SheetSnapshot` between runs.
+
+    The history must be sorted by timestamp (see ``sort_by_timestamp``).
+    Appended rows are folded in incrementally; if earlier rows changed
+    (a back-dated entry, an edited answer, a new column, a reset history),
+    the totals are rebuilt from scratch. Changes are detected from a digest
+    of the counted rows, which is recomputed on every update.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Initialize the aggregates.
+
+        Args:
+            directory: Where to persist the totals, or None for memory only
+        """
+        self.snapshot = SheetSnapshot(directory) if directory else None
+        self._table: Optional[pd.DataFrame] = None
+        self._info: Dict[str, Any] = {}
+        self._loaded = False
+
+    @property
+    def rows(self) -> int:
+        """Number of history entries folded into the totals."""
+        self._load()
+        return self._info.get("rows", 0)
+
+    def update(self, history: pd.DataFrame) -> "RunningAggregates":
+        """
+        Fold history rows that are not yet counted into the totals.
+
+        Args:
+            history: Full sheet history, sorted by timestamp
+
+        Returns:
+            self, for chaining
+        """
+        self._load()
+
+        # NaT sorts last, so the timestamped entries are a prefix
+        n_valid = int(history["timestamp"].notna().sum())
+        history = history.iloc[:n_valid]
+        fields = answer_fields(history)
+
+        # Totals are kept only while the rows they count are unchanged
+        columns = ["timestamp"] + fields
+        rows = self.rows
+        stale = (
+            set(fields) != set(self._info.get("fields", {}))
+            or n_valid < rows
+            or _digest(history.iloc[:rows], columns) != self._info.get("digest")
+        )
+        if stale:
+            rows = 0
+            self._table = None
+            self._info = {
+                "fields": {field: [] for field in fields},
+                "rows": 0,
+                "digest": 0,
+            }
+
+        if n_valid == rows:
+            return self
+
+        block = self._fold(history.iloc[rows:])
+        self._table = (
+            block
+            if self._table is None
+            else pd.concat([self._table, block], ignore_index=True, copy=False)
+        )
+        self._info["rows"] = n_valid
+        self._info["digest"] = (
+            self._info["digest"] + _digest(history.iloc[rows:], columns, rows)
+        ) % 2**64
+
+        if self.snapshot is not None:
+            try:
+                self.snapshot.save(self._table, self._info)
+            except OSError as e:
+                print(f"⚠️ Could not write running aggregates: {e}")
+        return self
+
+    def window(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        last: Optional[int] = None,
+    ) -> WindowMetrics:
+        """
+        Return the metrics of a window from two rows of the totals.
+
+        Args:
+            start: First timestamp to include (None = from the beginning)
+            end: Last timestamp to include (None = up to the latest entry)
+            last: Use the last N entries instead of a time range
+
+        Returns:
+            WindowMetrics of the window, equal to ``compute_metrics`` on the
+            same rows of the history
+        """
+        self._load()
+        fields: Dict[str, List[Any]] = self._info.get("fields", {})
+        n = self.rows
+
+        if n == 0:
+            lo = hi = 0
+        elif last is not None:
+            lo, hi = max(0, n - last), n
+        else:
+            timestamps = self._table["timestamp"]
+            lo = 0 if start is None else timestamps.searchsorted(pd.Timestamp(start))
+            hi = (
+                n
+                if end is None
+                else timestamps.searchsorted(pd.Timestamp(end), side="right")
+            )
+
+        if hi <= lo:
+            counts = {f: dict.fromkeys(answers, 0) for f, answers in fields.items()}
+            return WindowMetrics(0, counts)
+
+        # Totals of the window = running total at its end minus before its start
+        totals = self._table.iloc[hi - 1]
+        if lo > 0:
+            before = self._table.iloc[lo - 1]
+            totals = totals.drop("timestamp") - before.drop("timestamp")
+
+        counts = {
+            field: {
+                answer: int(totals[_count_column(field, j)])
+                for j, answer in enumerate(answers)
+            }
+            for field, answers in fields.items()
+        }
+        means = {}
+        for field in self._info.get("valued", []):
+            seen = totals[_seen_column(field)]
+            means[field] = totals[_sum_column(field)] / seen if seen else np.nan
+
+        return WindowMetrics(
+            hi - lo,
+            counts,
+            self._table["timestamp"].iloc[lo],
+            self._table["timestamp"].iloc[hi - 1],
+            means,
+        )
+
+    def _fold(self, rows: pd.DataFrame) -> pd.DataFrame:
+        """Compute the running totals of new rows on top of the current ones."""
+        previous = self._table.iloc[-1] if self._table is not None else None
+        block = {"timestamp": rows["timestamp"].to_numpy()}
+
+        def running(column: str, values: np.ndarray) -> np.ndarray:
+            start = previous[column] if previous is not None else 0
+            return np.cumsum(values) + start
+
+        for field, answers in self._info["fields"].items():
+            series = rows[field]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes = series.cat.codes.to_numpy()
+                uniques = list(series.cat.categories)
+            else:
+                codes, uniques = pd.factorize(series)
+                uniques = uniques.tolist()
+
+            # Give answers never seen before their own (zero so far) column
+            index = {answer: j for j, answer in enumerate(answers)}
+            for answer in uniques:
+                if answer not in index:
+                    index[answer] = len(answers)
+                    answers.append(answer)
+                    if self._table is not None:
+                        self._table[_count_column(field, index[answer])] = 0
+                        previous = self._table.iloc[-1]
+
+            remap = np.array([index[answer] for answer in uniques] + [-1])
+            answer_codes = remap[codes]
+            for j in range(len(answers)):
+                block[_count_column(field, j)] = running(
+                    _count_column(field, j), answer_codes == j
+                )
+
+        valued, values = value_matrix(rows)
+        self._info["valued"] = valued
+        present = ~np.isnan(values)
+        for k, field in enumerate(valued):
+            block[_sum_column(field)] = running(
+                _sum_column(field), np.where(present[:, k], values[:, k], 0)
+            )
+            block[_seen_column(field)] = running(_seen_column(field), present[:, k])
+
+        return pd.DataFrame(block)
+
+    def _load(self):
+        """Read the persisted totals once, on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.snapshot is None:
+            return
+
+        loaded = self.snapshot.load()
+        if loaded is not None:
+            self._table, self._info = loaded
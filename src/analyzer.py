@@ -1,19 +1,186 @@
 """Data analyzer for generating insights from daily tracking data."""
 
-import pandas as pd
+from __future__ import annotations
+
+import functools
+import math
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Tuple
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union
 from collections import Counter
+from config import REPORT_PERIODS, REPORT_THRESHOLDS, WEEKLY_DAY_THRESHOLDS
+from report import Report, period_words, render
+from window import WindowMetrics
+
+# pandas is only needed when analyzing a DataFrame; a metrics-only analyzer
+# (e.g. from compact entries) never loads it
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _memoized_section(method):
+    """Cache a section's result on the analyzer until its data changes."""
+
+    @functools.wraps(method)
+    def wrapper(self):
+        self._check_data()
+        name = method.__name__
+        if name not in self._sections:
+            self._sections[name] = method(self)
+        return self._sections[name]
+
+    return wrapper
+
+
+# Periods of at least this many days report week-by-week trends
+TREND_MIN_DAYS = 14
+
+
+def period_thresholds(
+    period: str = "week", days: Optional[int] = None
+) -> Dict[str, float]:
+    """
+    Insight thresholds of a report period.
+
+    Day-count thresholds (``WEEKLY_DAY_THRESHOLDS``) are scaled from a week
+    to the period's length; the period's own ``thresholds`` (see
+    ``REPORT_PERIODS``) override anything.
+
+    Args:
+        period: Period name (see ``REPORT_PERIODS``), or any name for a
+            custom range
+        days: Length of the period (default: the configured length;
+            required for a custom range)
+
+    Returns:
+        Dictionary of threshold name -> value
+    """
+    settings = REPORT_PERIODS.get(period, {})
+    days = days or settings.get("days")
+    if days is None:
+        raise ValueError(
+            f"Unknown period {period!r}, expected one of {list(REPORT_PERIODS)} "
+            "or the length of a custom range"
+        )
+
+    thresholds = dict(REPORT_THRESHOLDS)
+    for name, weekly in WEEKLY_DAY_THRESHOLDS.items():
+        thresholds[name] = max(1, round(weekly * days / 7))
+    thresholds.update(settings.get("thresholds", {}))
+    return thresholds
 
 
 class PersonalizationAnalyzer:
     """Analyzer for personal tracking data."""
 
-    def __init__(self, df: pd.DataFrame):
-        """Initialize analyzer with data."""
+    # Form fields read by the analysis; fetch only these for reports
+    REQUIRED_FIELDS = [
+        "timestamp",
+        "coding",
+        "focus",
+        "career_focus",
+        "protein",
+        "workout",
+        "sleep",
+        "sunshine",
+        "marriage",
+        "performance",
+        "happiness",
+        "day_overview",
+    ]
+
+    def __init__(
+        self,
+        df: Optional[pd.DataFrame] = None,
+        metrics: Optional[WindowMetrics] = None,
+        streaks: Optional[pd.DataFrame] = None,
+        period: str = "week",
+        days: Optional[int] = None,
+    ):
+        """
+        Initialize analyzer with data.
+
+        Args:
+            df: Daily entries to analyze
+            metrics: Metrics computed elsewhere (e.g. by
+                :func:`metrics.compute_grouped_metrics`); when given without
+                ``df`` the analyzer works from the metrics alone
+            streaks: Habit streaks computed elsewhere (see
+                :func:`habits.habit_streaks`, or a habit -> metrics dict
+                from :func:`entries.entry_streaks`), e.g. over the full
+                history so that current streaks can reach back before this
+                window
+            period: Period the data covers (see ``REPORT_PERIODS``); sets
+                the thresholds and wording of the insights
+            days: Length of the period in days (required for a custom
+                range, see :func:`period_thresholds`)
+        """
+        self.period = period
+        self.days = days or REPORT_PERIODS.get(period, {}).get("days")
+        self.thresholds = period_thresholds(period, self.days)
         self.df = df
-        self.total_days = len(df)
+        if df is None:
+            # Metrics-only analyzer: nothing here needs a DataFrame
+            self.total_days = metrics.total_days if metrics is not None else 0
+        self._metrics = metrics
+        self._streaks = streaks
+
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """The daily entries being analyzed (None for a metrics-only analyzer)."""
+        return self._df
+
+    @df.setter
+    def df(self, df: Optional[pd.DataFrame]):
+        self._df = df
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Drop cached metrics and section results.
+
+        Called automatically when ``df`` is replaced or changes shape; call
+        it yourself after editing values of the DataFrame in place.
+        """
+        self.total_days = len(self._df) if self._df is not None else 0
+        self._metrics: Optional[WindowMetrics] = None
+        self._streaks: Optional[pd.DataFrame] = None
+        self._sections: Dict[str, Any] = {}
+        self._fingerprint = self._data_fingerprint()
+
+    def _data_fingerprint(self) -> Tuple:
+        """Cheap identity of the data: object, shape and columns."""
+        if self._df is None:
+            return (None,)
+        return (id(self._df), self._df.shape, tuple(self._df.columns))
+
+    def _check_data(self):
+        """Invalidate caches if the DataFrame changed since they were built."""
+        if self._data_fingerprint() != self._fingerprint:
+            self.invalidate()
+
+    @property
+    def metrics(self) -> WindowMetrics:
+        """All answer counts for the data, computed once in a single pass."""
+        self._check_data()
+        if self._metrics is None:
+            from metrics import compute_metrics
+
+            self._metrics = (
+                compute_metrics(self.df) if self.df is not None else WindowMetrics(0, {})
+            )
+        return self._metrics
 
+    @property
+    def streaks(self) -> Union[pd.DataFrame, Dict[str, Dict[str, Any]]]:
+        """Streak metrics per binary habit, computed once from the data."""
+        self._check_data()
+        if self._streaks is None:
+            from habits import habit_streaks
+
+            self._streaks = habit_streaks(self.df) if self.df is not None else {}
+        return self._streaks
+
+    @_memoized_section
     def analyze_career(self) -> Dict[str, Any]:
         """Analyze career growth metrics (Priority #1)."""
         analysis = {
@@ -25,22 +192,25 @@ class PersonalizationAnalyzer:
             "has_data": False,
         }
 
-        if self.df.empty:
+        if self.total_days == 0:
             return analysis
 
+        m = self.metrics
+        t = self.thresholds
+
         # Coding days
-        if "coding" in self.df.columns:
+        if m.has("coding"):
             analysis["has_data"] = True
-            coding_yes = (self.df["coding"] == "Yes").sum()
+            coding_yes = m.count("coding", "Yes")
             coding_rate = coding_yes / self.total_days if self.total_days > 0 else 0
             analysis["metrics"]["coding_days"] = f"{coding_yes}/{self.total_days} days"
 
-            if coding_rate >= 0.85:
+            if coding_rate >= t["coding_excellent_rate"]:
                 analysis["insights"].append(
                     f"✅ Coded {coding_yes}/{self.total_days} days - Excellent!"
                 )
                 analysis["score"] += 35
-            elif coding_rate >= 0.7:
+            elif coding_rate >= t["coding_good_rate"]:
                 analysis["insights"].append(
                     f"✅ Coded {coding_yes}/{self.total_days} days - Good!"
                 )
@@ -52,11 +222,10 @@ class PersonalizationAnalyzer:
                 analysis["score"] += 10
 
         # Focus quality
-        if "focus" in self.df.columns:
+        if m.has("focus"):
             analysis["has_data"] = True
-            focus_counts = self.df["focus"].value_counts()
-            sharp_days = focus_counts.get("Good, razor sharp", 0)
-            multitask_days = focus_counts.get("I was multi-tasking, not good focus", 0)
+            sharp_days = m.count("focus", "Good, razor sharp")
+            multitask_days = m.count("focus", "I was multi-tasking, not good focus")
 
             analysis["metrics"][
                 "focus"
@@ -77,18 +246,17 @@ class PersonalizationAnalyzer:
                 analysis["score"] += 15
 
         # Career focus
-        if "career_focus" in self.df.columns:
+        if m.has("career_focus"):
             analysis["has_data"] = True
-            career_counts = self.df["career_focus"].value_counts()
-            good_days = career_counts.get("Good, achieved my today's goal", 0)
-            lazy_days = career_counts.get("Lazy, didn't wanted to work", 0)
+            good_days = m.count("career_focus", "Good, achieved my today's goal")
+            lazy_days = m.count("career_focus", "Lazy, didn't wanted to work")
 
-            if good_days >= 5:
+            if good_days >= t["goal_days"]:
                 analysis["insights"].append(
                     f"✅ Achieved daily goals {good_days} days - Fantastic!"
                 )
                 analysis["score"] += 30
-            elif lazy_days >= 3:
+            elif lazy_days >= t["lazy_days"]:
                 analysis["insights"].append(
                     f"⚠️ {lazy_days} lazy days - Let's fix this!"
                 )
@@ -101,6 +269,7 @@ class PersonalizationAnalyzer:
 
         return analysis
 
+    @_memoized_section
     def analyze_health(self) -> Dict[str, Any]:
         """Analyze health & fitness metrics (Priority #2)."""
         analysis = {
@@ -112,22 +281,25 @@ class PersonalizationAnalyzer:
             "has_data": False,
         }
 
-        if self.df.empty:
+        if self.total_days == 0:
             return analysis
 
+        m = self.metrics
+        t = self.thresholds
+
         # Protein intake
-        if "protein" in self.df.columns:
+        if m.has("protein"):
             analysis["has_data"] = True
-            protein_met = (self.df["protein"] == ">= 100g").sum()
+            protein_met = m.count("protein", ">= 100g")
             protein_rate = protein_met / self.total_days if self.total_days > 0 else 0
             analysis["metrics"]["protein"] = f"{protein_met}/{self.total_days} days"
 
-            if protein_rate >= 0.85:
+            if protein_rate >= t["protein_excellent_rate"]:
                 analysis["insights"].append(
                     f"✅ Protein: {protein_met}/{self.total_days} days >= 100g - Excellent!"
                 )
                 analysis["score"] += 25
-            elif protein_rate >= 0.6:
+            elif protein_rate >= t["protein_good_rate"]:
                 analysis["insights"].append(
                     f"✅ Protein: {protein_met}/{self.total_days} days >= 100g - Good!"
                 )
@@ -142,18 +314,18 @@ class PersonalizationAnalyzer:
                 analysis["score"] += 5
 
         # Workout
-        if "workout" in self.df.columns:
+        if m.has("workout"):
             analysis["has_data"] = True
-            workout_days = (self.df["workout"] == "Yes").sum()
+            workout_days = m.count("workout", "Yes")
             workout_rate = workout_days / self.total_days if self.total_days > 0 else 0
             analysis["metrics"]["workout"] = f"{workout_days}/{self.total_days} days"
 
-            if workout_rate >= 0.7:
+            if workout_rate >= t["workout_good_rate"]:
                 analysis["insights"].append(
                     f"✅ Workout: {workout_days}/{self.total_days} days - Great consistency!"
                 )
                 analysis["score"] += 25
-            elif workout_rate >= 0.5:
+            elif workout_rate >= t["workout_fair_rate"]:
                 analysis["insights"].append(
                     f"⚠️ Workout: {workout_days}/{self.total_days} days - Could be better"
                 )
@@ -166,30 +338,19 @@ class PersonalizationAnalyzer:
                 analysis["score"] += 5
 
         # Sleep analysis
-        if "sleep" in self.df.columns:
+        if m.has("sleep"):
             analysis["has_data"] = True
-            # Extract numeric hours from sleep strings
-            sleep_hours = []
-            for val in self.df["sleep"]:
-                if isinstance(val, str):
-                    if "hrs" in val or "hr" in val:
-                        # Extract first number from string like "7 hrs" or ">=10 hrs"
-                        import re
-
-                        match = re.search(r"(\d+)", val)
-                        if match:
-                            sleep_hours.append(int(match.group(1)))
-
-            if sleep_hours:
-                avg_sleep = sum(sleep_hours) / len(sleep_hours)
+            avg_sleep = m.avg_sleep
+
+            if avg_sleep is not None:
                 analysis["metrics"]["avg_sleep"] = f"{avg_sleep:.1f} hrs"
 
-                if avg_sleep >= 7 and avg_sleep <= 9:
+                if t["sleep_min_hours"] <= avg_sleep <= t["sleep_max_hours"]:
                     analysis["insights"].append(
                         f"✅ Sleep: Avg {avg_sleep:.1f} hrs - Perfect!"
                     )
                     analysis["score"] += 25
-                elif avg_sleep >= 6:
+                elif avg_sleep >= t["sleep_low_hours"]:
                     analysis["insights"].append(
                         f"⚠️ Sleep: Avg {avg_sleep:.1f} hrs (Target: 7-8 hrs)"
                     )
@@ -207,10 +368,10 @@ class PersonalizationAnalyzer:
                     analysis["score"] += 5
 
         # Sunshine
-        if "sunshine" in self.df.columns:
+        if m.has("sunshine"):
             analysis["has_data"] = True
-            sunshine_days = (self.df["sunshine"] == "Yes").sum()
-            if sunshine_days >= 5:
+            sunshine_days = m.count("sunshine", "Yes")
+            if sunshine_days >= t["sunshine_days"]:
                 analysis["insights"].append(
                     f"✅ Sunshine: {sunshine_days}/{self.total_days} days - Good!"
                 )
@@ -231,6 +392,7 @@ class PersonalizationAnalyzer:
 
         return analysis
 
+    @_memoized_section
     def analyze_marriage(self) -> Dict[str, Any]:
         """Analyze marriage goals (Priority #3)."""
         analysis = {
@@ -242,16 +404,16 @@ class PersonalizationAnalyzer:
             "has_data": False,
         }
 
-        if self.df.empty or "marriage" not in self.df.columns:
+        if self.total_days == 0 or not self.metrics.has("marriage"):
             analysis["insights"].append("ℹ️ Not tracking marriage/relationship data")
             return analysis
 
         analysis["has_data"] = True
 
-        marriage_counts = self.df["marriage"].value_counts()
-        good_days = marriage_counts.get("Good", 0)
-        okayish_days = marriage_counts.get("Okayish", 0)
-        not_good_days = marriage_counts.get("Not good", 0)
+        m = self.metrics
+        good_days = m.count("marriage", "Good")
+        okayish_days = m.count("marriage", "Okayish")
+        not_good_days = m.count("marriage", "Not good")
 
         analysis["metrics"][
             "status"
@@ -259,12 +421,12 @@ class PersonalizationAnalyzer:
 
         good_rate = good_days / self.total_days if self.total_days > 0 else 0
 
-        if good_rate >= 0.7:
+        if good_rate >= self.thresholds["marriage_strong_rate"]:
             analysis["insights"].append(
                 f"✅ Strong relationship focus: {good_days}/{self.total_days} good days"
             )
             analysis["score"] = 100
-        elif good_rate >= 0.4:
+        elif good_rate >= self.thresholds["marriage_moderate_rate"]:
             analysis["insights"].append(
                 f"⚠️ Moderate performance: {good_days} good, {okayish_days} okayish days"
             )
@@ -281,43 +443,46 @@ class PersonalizationAnalyzer:
 
         return analysis
 
+    @_memoized_section
     def analyze_overall_performance(self) -> Dict[str, Any]:
         """Analyze overall performance and happiness."""
         analysis = {"title": "📈 OVERALL PERFORMANCE", "metrics": {}, "insights": []}
 
-        if self.df.empty:
+        if self.total_days == 0:
             return analysis
 
+        m = self.metrics
+        t = self.thresholds
+        noun = period_words(self.period)["noun"].capitalize()
+
         # Performance trend
-        if "performance" in self.df.columns:
-            perf_counts = self.df["performance"].value_counts()
-            better = perf_counts.get("Yes, better than yesterday", 0)
-            same = perf_counts.get("Same as yesterday", 0)
-            worse = perf_counts.get("Worst than yesterday", 0)
+        if m.has("performance"):
+            better = m.count("performance", "Yes, better than yesterday")
+            same = m.count("performance", "Same as yesterday")
+            worse = m.count("performance", "Worst than yesterday")
 
             if better >= worse:
                 analysis["insights"].append(
-                    f"Week Trend: Better than yesterday on {better}/{self.total_days} days 🎉"
+                    f"{noun} Trend: Better than yesterday on {better}/{self.total_days} days 🎉"
                 )
             else:
                 analysis["insights"].append(
-                    f"Week Trend: {worse} worse days - Let's turn this around"
+                    f"{noun} Trend: {worse} worse days - Let's turn this around"
                 )
 
         # Happiness
-        if "happiness" in self.df.columns:
-            happy_counts = self.df["happiness"].value_counts()
-            happy = happy_counts.get("Yes, I am happy", 0)
-            neutral = happy_counts.get("Slightly Neutral, could do better", 0)
-            bad = happy_counts.get("No, I performed bad", 0)
+        if m.has("happiness"):
+            happy = m.count("happiness", "Yes, I am happy")
+            neutral = m.count("happiness", "Slightly Neutral, could do better")
+            bad = m.count("happiness", "No, I performed bad")
 
             analysis["metrics"]["happy_days"] = f"{happy}/{self.total_days} days"
 
-            if happy >= 5:
+            if happy >= t["happy_great_days"]:
                 analysis["insights"].append(
                     f"Happy Days: {happy}/{self.total_days} days - Great! 😊"
                 )
-            elif happy >= 3:
+            elif happy >= t["happy_good_days"]:
                 analysis["insights"].append(
                     f"Happy Days: {happy}/{self.total_days} days - Keep going! 💪"
                 )
@@ -328,84 +493,156 @@ class PersonalizationAnalyzer:
                 analysis["insights"].append("💡 Remember: Progress > Perfection")
 
         # Day overview
-        if "day_overview" in self.df.columns:
-            overview_counts = self.df["day_overview"].value_counts()
-            hard_enjoyed = overview_counts.get("Did hard work - enjoyed", 0)
-            procrastinated = overview_counts.get("Procrastinated", 0)
+        if m.has("day_overview"):
+            hard_enjoyed = m.count("day_overview", "Did hard work - enjoyed")
+            procrastinated = m.count("day_overview", "Procrastinated")
 
-            if hard_enjoyed >= 4:
+            if hard_enjoyed >= t["win_days"]:
                 analysis["insights"].append(
-                    f"🌟 This Week's Win: Did hard work & enjoyed it {hard_enjoyed} days!"
+                    f"🌟 This {noun}'s Win: Did hard work & enjoyed it {hard_enjoyed} days!"
                 )
-            if procrastinated >= 3:
+            if procrastinated >= t["procrastinated_days"]:
                 analysis["insights"].append(
                     f"⚠️ Procrastinated {procrastinated} days - Break tasks smaller"
                 )
 
         return analysis
 
-    def generate_weekly_report(self) -> str:
-        """Generate complete weekly report."""
-        if self.df.empty:
-            return "❌ No data available for this week"
+    @_memoized_section
+    def analyze_streaks(self) -> Dict[str, Any]:
+        """Analyze streaks of the binary habits (coding, workout, ...)."""
+        analysis = {"title": "🔥 STREAKS", "metrics": {}, "insights": []}
+
+        streaks = self.streaks
+        rows = streaks.iterrows() if hasattr(streaks, "iterrows") else streaks.items()
+        for habit, row in rows:
+            label = habit.replace("_", " ").capitalize()
+            current = int(row["current_streak"])
+            longest = int(row["longest_streak"])
+            analysis["metrics"][habit] = {
+                "current_streak": current,
+                "longest_streak": longest,
+                "completion_rate": float(row["completion_rate"]),
+            }
+
+            if current >= 2:
+                analysis["insights"].append(
+                    f"🔥 {label}: {current}-day streak (best: {longest} days)"
+                )
+            elif longest >= 3:
+                analysis["insights"].append(
+                    f"💡 {label}: best run was {longest} days - start a new streak today"
+                )
 
-        # Get date range
-        start_date = self.df["timestamp"].min()
-        end_date = self.df["timestamp"].max()
+        return analysis
 
-        report_lines = [
-            f"📊 Weekly Report ({start_date.strftime('%b %d')}-{end_date.strftime('%b %d, %Y')})",
-            "",
-        ]
+    @_memoized_section
+    def analyze_trends(self) -> Dict[str, Any]:
+        """Week-by-week trends of the main habits (periods of two weeks or more)."""
+        analysis = {"title": "📆 TRENDS", "metrics": {}, "insights": []}
+
+        df = self.df
+        if (
+            df is None
+            or self.total_days == 0
+            or "timestamp" not in df.columns
+            or (self.days or 0) < TREND_MIN_DAYS
+        ):
+            return analysis
 
-        # Analyze each goal area
-        career = self.analyze_career()
-        health = self.analyze_health()
-        marriage = self.analyze_marriage()
-        overall = self.analyze_overall_performance()
-
-        # Build report - only include sections with data
-        tracked_goals = []
-        for section in [career, health, marriage]:
-            if section.get("has_data", False) or section["insights"]:
-                tracked_goals.append(section["title"])
-                report_lines.append(section["title"])
-                for insight in section["insights"]:
-                    report_lines.append(insight)
-                report_lines.append("")
-
-        # Overall section
-        report_lines.append(overall["title"])
-        for insight in overall["insights"]:
-            report_lines.append(insight)
-        report_lines.append("")
-
-        # Calculate overall score (only from tracked areas)
-        tracked_sections = [
-            s for s in [career, health, marriage] if s.get("has_data", False)
-        ]
-        if tracked_sections:
-            total_score = sum(s["score"] for s in tracked_sections) / len(
-                tracked_sections
-            )
+        from trends import compute_trends
 
-            if total_score >= 70:
-                report_lines.append("🎉 Excellent week overall! Keep it up! 💪")
-            elif total_score >= 50:
-                report_lines.append("👍 Good week! Room for improvement 💪")
+        table = compute_trends(df)
+        stable = self.thresholds["stable_trend_days"]
+        for field in ["coding", "protein", "workout"]:
+            if field not in table.index or math.isnan(table.at[field, "slope"]):
+                continue
+
+            # Fitted change from the first to the last week, in days/week
+            change = round(float(table.at[field, "change"]) * 7, 1)
+            analysis["metrics"][field] = {
+                "weeks": int(table.at[field, "weeks"]),
+                "slope": float(table.at[field, "slope"]) * 7,
+                "change": change,
+            }
+
+            label = field.capitalize()
+            if change >= stable:
+                analysis["insights"].append(
+                    f"📈 {label}: +{change} days/week from start to end (Improving!)"
+                )
+            elif change <= -stable:
+                analysis["insights"].append(
+                    f"📉 {label}: {change} days/week from start to end (Declining)"
+                )
             else:
-                report_lines.append("⚠️ Tough week. Focus on one thing at a time 💪")
+                analysis["insights"].append(f"➡️ {label}: Stable throughout")
 
-        # Add tracking summary
-        if tracked_goals:
-            report_lines.append("")
-            report_lines.append(f"📋 Currently tracking: {len(tracked_goals)} goal(s)")
+        return analysis
 
-        return "\n".join(report_lines)
+    @_memoized_section
+    def report(self) -> Report:
+        """
+        All section results, the overall score and focus areas, computed once.
+
+        The report is read-only; render it with :meth:`render` or
+        :func:`report.render` as many times and formats as needed.
+        """
+        return Report(
+            self.period,
+            self.metrics.start,
+            self.metrics.end,
+            self.total_days,
+            {
+                "career": self.analyze_career(),
+                "health": self.analyze_health(),
+                "marriage": self.analyze_marriage(),
+                "overall": self.analyze_overall_performance(),
+                "streaks": self.analyze_streaks(),
+                "trends": self.analyze_trends(),
+            },
+            self.overall_score(),
+            self.get_focus_areas(),
+            self.verdict(),
+        )
+
+    def render(self, fmt: str = "text") -> str:
+        """Render the report in a registered format (e.g. "text", "json", "html")."""
+        return render(self.report(), fmt)
+
+    def generate_weekly_report(self) -> str:
+        """Generate complete report of the period (a week by default)."""
+        return self.render("text")
+
+    def overall_score(self) -> Optional[float]:
+        """Average score (0-100) of the goal areas that have data."""
+        sections = [
+            self.analyze_career(),
+            self.analyze_health(),
+            self.analyze_marriage(),
+        ]
+        tracked_sections = [s for s in sections if s.get("has_data", False)]
+        if not tracked_sections:
+            return None
+        return sum(s["score"] for s in tracked_sections) / len(tracked_sections)
+
+    def verdict(self) -> Optional[str]:
+        """One-line verdict on the overall score (None without tracked goals)."""
+        score = self.overall_score()
+        if score is None:
+            return None
+
+        noun = period_words(self.period)["noun"]
+        if score >= self.thresholds["excellent_score"]:
+            return f"🎉 Excellent {noun} overall! Keep it up! 💪"
+        if score >= self.thresholds["good_score"]:
+            return f"👍 Good {noun}! Room for improvement 💪"
+        return f"⚠️ Tough {noun}. Focus on one thing at a time 💪"
 
     def get_focus_areas(self) -> List[str]:
-        """Identify top 3 focus areas for next week."""
+        """Identify top 3 focus areas for the next period."""
         focus_areas = []
+        limit = self.thresholds["focus_area_score"]
 
         # Check each metric
         career = self.analyze_career()
@@ -413,17 +650,19 @@ class PersonalizationAnalyzer:
         marriage = self.analyze_marriage()
 
         # Prioritize based on scores
-        if career["score"] < 60:
+        if career["score"] < limit:
             focus_areas.append("Career: Improve coding consistency and focus")
-        if health["score"] < 60:
+        if health["score"] < limit:
             focus_areas.append("Health: Better sleep and workout routine")
-        if marriage["score"] < 60:
+        if marriage["score"] < limit:
             focus_areas.append("Marriage: More quality time together")
 
         return focus_areas[:3]  # Top 3
 
 
 if __name__ == "__main__":
+    import pandas as pd
+
     # Test with sample data
     sample_data = {
         "timestamp": pd.date_range("2026-01-05", periods=7),
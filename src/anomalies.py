@@ -0,0 +1,287 @@
+"""Streaming detection of unusual drops in the daily score."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+
+# Add src to path if needed
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import (
+    ANOMALY_DIR,
+    ANOMALY_EWMA_ALPHA,
+    ANOMALY_MIN_DAYS,
+    ANOMALY_Z_THRESHOLD,
+)
+from sheets_client import fetch_many
+from whatsapp_client import WhatsAppClient
+import config
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Consecutive below-normal days (z <= -1) that are flagged as a slump
+SLUMP_DAYS = 3
+
+# Smallest standard deviation (score points) used for z-scores, so a very
+# steady history does not turn a one-answer change into an alarm
+MIN_STD = 5.0
+
+
+class ScoreDetector:
+    """
+    Exponentially weighted mean and variance of the daily score.
+
+    Each new score is compared with the running mean before it is folded
+    in, so an update is O(1) and the whole state is a handful of numbers.
+    Flags a *drop* when a day scores ``z_threshold`` standard deviations
+    below normal, and a *slump* when ``SLUMP_DAYS`` days in a row are at
+    least one standard deviation below normal.
+    """
+
+    def __init__(
+        self,
+        alpha: float = ANOMALY_EWMA_ALPHA,
+        z_threshold: float = ANOMALY_Z_THRESHOLD,
+        min_days: int = ANOMALY_MIN_DAYS,
+        state: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            alpha: Weight of each new day in the running mean and variance
+            z_threshold: Standard deviations below the mean that count as a drop
+            min_days: Days folded in before anything is flagged
+            state: Saved state from :meth:`to_dict`, to resume
+        """
+        self.alpha = alpha
+        self.z_threshold = z_threshold
+        self.min_days = min_days
+        state = state or {}
+        self.days = state.get("days", 0)
+        self.mean = state.get("mean", 0.0)
+        self.var = state.get("var", 0.0)
+        self.low_run = state.get("low_run", 0)
+        self.last = state.get("last")
+
+    def update(self, score: float, timestamp: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Fold in one day's score.
+
+        Args:
+            score: Daily score (0-100)
+            timestamp: Entry time in nanoseconds, remembered as the last
+                entry seen
+
+        Returns:
+            Dictionary with the score, the expected (mean) score, its
+            z-score and ``anomaly`` (None, "drop" or "slump")
+        """
+        std = max(math.sqrt(self.var), MIN_STD)
+        z = (score - self.mean) / std if self.days else 0.0
+        warmed_up = self.days >= self.min_days
+
+        self.low_run = self.low_run + 1 if warmed_up and z <= -1 else 0
+        anomaly = None
+        if warmed_up and z <= -self.z_threshold:
+            anomaly = "drop"
+        elif self.low_run == SLUMP_DAYS:
+            anomaly = "slump"
+
+        result = {
+            "timestamp": timestamp,
+            "score": score,
+            "expected": self.mean if self.days else score,
+            "z": z,
+            "anomaly": anomaly,
+        }
+
+        # EWMA update (the first day seeds the mean)
+        if self.days == 0:
+            self.mean = score
+        else:
+            diff = score - self.mean
+            self.mean += self.alpha * diff
+            self.var = (1 - self.alpha) * (self.var + self.alpha * diff**2)
+        self.days += 1
+        if timestamp is not None:
+            self.last = timestamp
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the state to persist between runs."""
+        return {
+            "days": self.days,
+            "mean": self.mean,
+            "var": self.var,
+            "low_run": self.low_run,
+            "last": self.last,
+        }
+
+
+class ScoreMonitor:
+    """
+    A :class:`ScoreDetector` persisted for one tenant (sheet).
+
+    Every call folds in only the entries newer than the last one seen, so
+    checking after each submission never reprocesses the history.
+    """
+
+    def __init__(self, path: Optional[Path] = None, **detector_options: Any):
+        """
+        Initialize the monitor.
+
+        Args:
+            path: JSON file holding the detector state, or None for memory only
+            **detector_options: Extra keyword arguments for ScoreDetector
+        """
+        self.path = Path(path) if path else None
+        state = None
+        if self.path and self.path.exists():
+            try:
+                state = json.loads(self.path.read_text())
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable detector state {self.path}: {e}")
+        self.detector = ScoreDetector(state=state, **detector_options)
+
+    def observe(self, history: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Score the new entries of a history and return the flagged days.
+
+        Args:
+            history: Sheet history sorted by timestamp
+
+        Returns:
+            List of update results (see :meth:`ScoreDetector.update`) whose
+            ``anomaly`` is set
+        """
+        import pandas as pd
+        from metrics import daily_scores
+
+        history = history[history["timestamp"].notna()]
+        if self.detector.last is not None:
+            lo = history["timestamp"].searchsorted(
+                pd.Timestamp(self.detector.last), side="right"
+            )
+            history = history.iloc[lo:]
+        if history.empty:
+            return []
+
+        scores = daily_scores(history)
+        timestamps = history["timestamp"].to_numpy().astype("datetime64[ns]")
+        alerts = []
+        for score, timestamp in zip(scores.tolist(), timestamps.astype("int64").tolist()):
+            if math.isnan(score):
+                continue
+            result = self.detector.update(score, timestamp)
+            if result["anomaly"]:
+                alerts.append(result)
+
+        self.save()
+        return alerts
+
+    def save(self):
+        """Write the detector state (atomically) if the monitor has a path."""
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self.detector.to_dict()))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not write detector state: {e}")
+
+
+def check_tenants(
+    histories: Dict[str, Union[pd.DataFrame, Exception]],
+    directory: Optional[Path] = ANOMALY_DIR,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Fold the new entries of every tenant into its persisted detector.
+
+    Args:
+        histories: Tenant (sheet ID) -> history, e.g. from ``fetch_many``;
+            tenants whose fetch failed (an exception) are skipped
+        directory: Where detector states are kept, or None for memory only
+
+    Returns:
+        Dictionary mapping each tenant to its flagged days
+    """
+    alerts = {}
+    for tenant, history in histories.items():
+        if isinstance(history, Exception) or history.empty:
+            continue
+        path = Path(directory) / f"{tenant}.json" if directory else None
+        alerts[tenant] = ScoreMonitor(path).observe(history)
+    return alerts
+
+
+def format_alert(alert: Dict[str, Any]) -> str:
+    """Describe a flagged day in one line."""
+    import pandas as pd
+
+    day = pd.Timestamp(alert["timestamp"]).strftime("%a %d %b")
+    if alert["anomaly"] == "slump":
+        what = f"{SLUMP_DAYS} below-normal days in a row"
+    else:
+        what = "unusual drop"
+    return (
+        f"⚠️ {day}: {what} - score {alert['score']:.0f} "
+        f"(usual {alert['expected']:.0f})"
+    )
+
+
+def main(sheet_ids: Optional[Iterable[str]] = None, notify: bool = False):
+    """
+    Check every tenant's newest entries for unusual drops.
+
+    Args:
+        sheet_ids: Spreadsheets to check (default: GOOGLE_SHEET_ID)
+        notify: If True, send the alerts to WhatsApp
+    """
+    sheet_ids = list(sheet_ids or [config.GOOGLE_SHEET_ID])
+    print(f"🔍 Checking daily scores of {len(sheet_ids)} sheet(s)...")
+
+    alerts = check_tenants(fetch_many(sheet_ids))
+    lines = []
+    for sheet_id, found in alerts.items():
+        for alert in found:
+            prefix = f"[{sheet_id}] " if len(sheet_ids) > 1 else ""
+            lines.append(prefix + format_alert(alert))
+    if not lines:
+        print("✅ No unusual days")
+        return
+
+    message = "\n".join(["🚨 *Alpha-X Daily Check*", ""] + lines)
+    print(message)
+    if notify:
+        WhatsAppClient().send_message(message)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Flag unusual drops in the daily score"
+    )
+    parser.add_argument(
+        "--sheet-id",
+        action="append",
+        dest="sheet_ids",
+        help="Spreadsheet to check (repeat for several; default: GOOGLE_SHEET_ID)",
+    )
+    parser.add_argument(
+        "--notify",
+        action="store_true",
+        help="Send alerts to WhatsApp",
+    )
+
+    args = parser.parse_args()
+
+    main(sheet_ids=args.sheet_ids, notify=args.notify)
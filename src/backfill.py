@@ -0,0 +1,187 @@
+"""Backfill weekly or monthly metrics for the whole tracking history."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+# Add src to path if needed
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sheets_client import SheetsClient
+from analyzer import PersonalizationAnalyzer
+from window import WindowMetrics
+import config
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+PERIODS = ("week", "month")
+
+# (column, field, answer) of the day rates reported per period
+RATE_COLUMNS = [
+    ("coding_rate", "coding", "Yes"),
+    ("workout_rate", "workout", "Yes"),
+    ("protein_rate", "protein", ">= 100g"),
+    ("sunshine_rate", "sunshine", "Yes"),
+    ("sharp_focus_rate", "focus", "Good, razor sharp"),
+    ("good_marriage_rate", "marriage", "Good"),
+    ("happy_rate", "happiness", "Yes, I am happy"),
+]
+
+
+def period_keys(timestamps: pd.Series, period: str = "week") -> pd.Series:
+    """
+    Label each timestamp with its ISO week ("2026-W02") or month ("2026-01").
+
+    Labels sort in calendar order. Only the distinct periods are formatted
+    as strings; rows are mapped to them through integer codes.
+    """
+    import pandas as pd
+
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period {period!r}, expected one of {PERIODS}")
+
+    timestamps = pd.to_datetime(timestamps)
+    if period == "week":
+        iso = timestamps.dt.isocalendar()
+        numbers = iso["year"].astype("float") * 100 + iso["week"].astype("float")
+    else:
+        numbers = timestamps.dt.year * 100.0 + timestamps.dt.month
+
+    codes, uniques = pd.factorize(numbers, sort=True)
+    separator = "-W" if period == "week" else "-"
+    labels = [f"{int(n) // 100}{separator}{int(n) % 100:02d}" for n in uniques]
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=labels, validate=False),
+        index=timestamps.index,
+    )
+
+
+def _period_row(label: str, m: WindowMetrics, period: str) -> Dict[str, Any]:
+    """Summarize one period's metrics and section scores as a table row."""
+    analyzer = PersonalizationAnalyzer(metrics=m, period=period)
+    career = analyzer.analyze_career()
+    health = analyzer.analyze_health()
+    marriage = analyzer.analyze_marriage()
+
+    row = {
+        "period": label,
+        "start": m.start,
+        "end": m.end,
+        "days": m.total_days,
+        "career_score": career["score"] if career["has_data"] else None,
+        "health_score": health["score"] if health["has_data"] else None,
+        "marriage_score": marriage["score"] if marriage["has_data"] else None,
+        "overall_score": analyzer.overall_score(),
+        "avg_sleep": m.avg_sleep,
+    }
+    for column, field, answer in RATE_COLUMNS:
+        row[column] = m.rate(field, answer) if m.has(field) else None
+    return row
+
+
+def backfill(df: pd.DataFrame, period: str = "week") -> pd.DataFrame:
+    """
+    Compute metrics and scores for every week or month of the history.
+
+    All periods are counted together in one grouped pass over the data
+    (see :func:`metrics.compute_grouped_metrics`); the report sections
+    then score each period from its precomputed counts, with the
+    thresholds of that period (see ``REPORT_PERIODS``).
+
+    Args:
+        df: Full tracking history with a ``timestamp`` column
+        period: "week" (ISO weeks) or "month"
+
+    Returns:
+        One row per period with day counts, section scores, overall score,
+        average sleep and habit rates, in calendar order
+    """
+    import pandas as pd
+    from metrics import compute_grouped_metrics
+
+    if df.empty or "timestamp" not in df.columns:
+        return pd.DataFrame(columns=["period"])
+
+    grouped = compute_grouped_metrics(df, period_keys(df["timestamp"], period))
+    rows: List[Dict[str, Any]] = [
+        _period_row(label, m, period) for label, m in grouped.items()
+    ]
+    return pd.DataFrame(rows)
+
+
+def main(period: str = "week", output: Optional[str] = None):
+    """
+    Fetch the full history and print (or save) the backfilled time series.
+
+    Args:
+        period: "week" or "month"
+        output: Optional CSV path to write the table to
+    """
+    print("=" * 70)
+    print(f"🎯 Alpha-X - {period.capitalize()}ly Backfill")
+    print("=" * 70)
+    print(f"📅 Run Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 70)
+    print()
+
+    try:
+        print("🔍 Validating configuration...")
+        config.validate_config()
+        print("✅ Configuration valid\n")
+
+        print("📊 Fetching full history from Google Sheets...")
+        sheets_client = SheetsClient()
+        sheets_client.connect()
+        df = sheets_client.get_all_data(fields=PersonalizationAnalyzer.REQUIRED_FIELDS)
+
+        if df.empty:
+            print("❌ No data found in the sheet")
+            return
+
+        print(f"✅ Found {len(df)} entries\n")
+
+        table = backfill(df, period)
+        print(f"📈 Computed {len(table)} {period}s in one pass\n")
+
+        if output:
+            table.to_csv(output, index=False)
+            print(f"💾 Saved to {output}")
+        else:
+            import pandas as pd
+
+            with pd.option_context("display.max_rows", None, "display.width", 200):
+                print(table.to_string(index=False))
+
+        print("\n✨ Done!")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compute metrics for every past week or month in one pass"
+    )
+    parser.add_argument(
+        "--period",
+        choices=PERIODS,
+        default="week",
+        help="Bucket the history by ISO week or by calendar month",
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the table to this CSV file instead of printing it",
+    )
+
+    args = parser.parse_args()
+
+    main(period=args.period, output=args.output)
@@ -0,0 +1,238 @@
+"""Vectorized analysis of many users (and windows) at once."""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Sequence, Union
+from analyzer import PersonalizationAnalyzer, period_thresholds
+from config import HABIT_TARGETS
+from habits import HabitMatrix
+from metrics import GroupedMetrics, WindowMetrics
+
+
+class BatchAnalyzer:
+    """
+    Score many users' tracking data in one grouped pass.
+
+    Takes a single concatenated frame with one or more key columns (e.g.
+    ``user`` and a ``window`` label) and computes the same metrics, section
+    scores and focus areas as :class:`PersonalizationAnalyzer`, but as
+    column operations over all groups at once instead of one analyzer
+    object per user.
+
+    A group whose rows never answer a field is treated as not tracking it,
+    since concatenating users' frames fills their untracked columns with
+    blanks.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        by: Union[str, Sequence[str]] = "user",
+        period: str = "week",
+    ):
+        """
+        Count every group of the batch.
+
+        Args:
+            df: Concatenated daily entries of all users
+            by: Key column(s) identifying a group (user, or user and window)
+            period: Period each group covers (see ``REPORT_PERIODS``); sets
+                the scoring thresholds
+        """
+        self.period = period
+        self.thresholds = period_thresholds(period)
+        self.by = [by] if isinstance(by, str) else list(by)
+        keys = pd.MultiIndex.from_frame(df[self.by])
+        group_codes, groups = keys.factorize(sort=True)
+        self.groups = groups if len(self.by) > 1 else groups.get_level_values(0)
+
+        keep = group_codes >= 0
+        if not keep.all():
+            df, group_codes = df[keep], group_codes[keep]
+
+        self.metrics = GroupedMetrics(
+            df.drop(columns=self.by), group_codes, len(self.groups)
+        )
+        self.streaks = HabitMatrix.from_history(df, by=self.by).streaks()
+
+    def career_scores(self) -> Dict[str, np.ndarray]:
+        """Career score (0-100) per group; see ``analyze_career``."""
+        m = self.metrics
+        t = self.thresholds
+        has_coding = m.has("coding")
+        has_focus = m.has("focus")
+        has_career = m.has("career_focus")
+
+        coding_rate = m.rate("coding", "Yes")
+        coding = np.select(
+            [
+                coding_rate >= t["coding_excellent_rate"],
+                coding_rate >= t["coding_good_rate"],
+            ],
+            [35, 25],
+            10,
+        )
+
+        sharp = m.count("focus", "Good, razor sharp")
+        multitask = m.count("focus", "I was multi-tasking, not good focus")
+        focus = np.where(sharp >= multitask, 35, 15)
+
+        good = m.count("career_focus", "Good, achieved my today's goal")
+        lazy = m.count("career_focus", "Lazy, didn't wanted to work")
+        career = np.select(
+            [good >= t["goal_days"], lazy >= t["lazy_days"]], [30, 10], 0
+        )
+
+        return {
+            "score": coding * has_coding + focus * has_focus + career * has_career,
+            "has_data": has_coding | has_focus | has_career,
+        }
+
+    def health_scores(self) -> Dict[str, np.ndarray]:
+        """Health score (0-100) per group; see ``analyze_health``."""
+        m = self.metrics
+        t = self.thresholds
+        has_protein = m.has("protein")
+        has_workout = m.has("workout")
+        has_sleep = m.has("sleep")
+        has_sunshine = m.has("sunshine")
+
+        protein_rate = m.rate("protein", ">= 100g")
+        protein = np.select(
+            [
+                protein_rate >= t["protein_excellent_rate"],
+                protein_rate >= t["protein_good_rate"],
+            ],
+            [25, 15],
+            5,
+        )
+
+        workout_rate = m.rate("workout", "Yes")
+        workout = np.select(
+            [
+                workout_rate >= t["workout_good_rate"],
+                workout_rate >= t["workout_fair_rate"],
+            ],
+            [25, 15],
+            5,
+        )
+
+        avg_sleep = m.mean("sleep")
+        sleep = np.select(
+            [
+                np.isnan(avg_sleep),
+                (avg_sleep >= t["sleep_min_hours"])
+                & (avg_sleep <= t["sleep_max_hours"]),
+                avg_sleep >= t["sleep_low_hours"],
+            ],
+            [0, 25, 15],
+            5,
+        )
+
+        sunshine = np.where(m.count("sunshine", "Yes") >= t["sunshine_days"], 25, 0)
+
+        return {
+            "score": protein * has_protein
+            + workout * has_workout
+            + sleep * has_sleep
+            + sunshine * has_sunshine,
+            "has_data": has_protein | has_workout | has_sleep | has_sunshine,
+        }
+
+    def marriage_scores(self) -> Dict[str, np.ndarray]:
+        """Marriage score (0-100) per group; see ``analyze_marriage``."""
+        m = self.metrics
+        has_marriage = m.has("marriage")
+        good_rate = m.rate("marriage", "Good")
+        t = self.thresholds
+        score = np.select(
+            [
+                good_rate >= t["marriage_strong_rate"],
+                good_rate >= t["marriage_moderate_rate"],
+            ],
+            [100, 60],
+            30,
+        )
+        return {"score": score * has_marriage, "has_data": has_marriage}
+
+    def analyze(self) -> pd.DataFrame:
+        """
+        Compute metrics, section scores and focus areas for every group.
+
+        Returns:
+            DataFrame indexed by the key column(s), one row per group
+        """
+        m = self.metrics
+        career = self.career_scores()
+        health = self.health_scores()
+        marriage = self.marriage_scores()
+
+        # Overall score: average over the sections that have data
+        sections = [career, health, marriage]
+        tracked = np.stack([s["has_data"] for s in sections], axis=1)
+        scores = np.stack([s["score"] for s in sections], axis=1)
+        n_tracked = tracked.sum(axis=1)
+        overall = np.where(
+            n_tracked > 0,
+            (scores * tracked).sum(axis=1) / np.maximum(n_tracked, 1),
+            np.nan,
+        )
+
+        results = pd.DataFrame(
+            {
+                "days": m.total_days,
+                "start": m.start,
+                "end": m.end,
+                "coding_days": m.count("coding", "Yes"),
+                "protein_days": m.count("protein", ">= 100g"),
+                "workout_days": m.count("workout", "Yes"),
+                "happy_days": m.count("happiness", "Yes, I am happy"),
+                "avg_sleep": m.mean("sleep"),
+                "career_score": career["score"],
+                "health_score": health["score"],
+                "marriage_score": marriage["score"],
+                "overall_score": overall,
+            },
+            index=self.groups,
+        )
+        results["focus_areas"] = self._focus_areas(scores)
+
+        # Current streak of each binary habit
+        current = self.streaks["current_streak"].unstack("habit")
+        for habit in HABIT_TARGETS:
+            if habit in current.columns:
+                results[f"{habit}_streak"] = current[habit].reindex(results.index)
+        return results
+
+    def _focus_areas(self, scores: np.ndarray) -> List[List[str]]:
+        """Focus areas per group; see ``get_focus_areas``."""
+        areas = np.array(
+            [
+                "Career: Improve coding consistency and focus",
+                "Health: Better sleep and workout routine",
+                "Marriage: More quality time together",
+            ]
+        )
+        needs_focus = scores < self.thresholds["focus_area_score"]
+        return [areas[row].tolist() for row in needs_focus]
+
+    def analyzer(self, key: Any) -> PersonalizationAnalyzer:
+        """
+        Return a full analyzer for one group, e.g. to render its report.
+
+        Args:
+            key: Group key (a tuple when grouping by several columns)
+        """
+        window = self.metrics.window(self.groups.get_loc(key))
+
+        # Fields the group never answered are not tracked (the batch's
+        # other groups gave them a column of blanks)
+        counts = {f: c for f, c in window.counts.items() if any(c.values())}
+        metrics = WindowMetrics(
+            window.total_days, counts, window.start, window.end, window.means
+        )
+        return PersonalizationAnalyzer(
+            metrics=metrics,
+            streaks=self.streaks.loc[key],
+            period=self.period,
+        )
@@ -12,6 +12,42 @@ load_dotenv()
 BASE_DIR = Path(__file__).parent.parent
 CREDENTIALS_DIR = BASE_DIR / "credentials"
 
+# Local cache of fetched sheet data (override with ALPHAX_CACHE_DIR)
+CACHE_DIR = Path(os.getenv("ALPHAX_CACHE_DIR", BASE_DIR / ".cache"))
+SNAPSHOT_DIR = CACHE_DIR / "snapshots"
+TOKEN_CACHE_DIR = CACHE_DIR / "tokens"
+AGGREGATES_DIR = CACHE_DIR / "aggregates"
+ANOMALY_DIR = CACHE_DIR / "anomalies"
+
+# Seconds a fetched sheet is reused in-process before checking for new rows
+SHEETS_CACHE_TTL = float(os.getenv("SHEETS_CACHE_TTL", "300"))
+
+# Rows requested per call when reading the sheet
+FETCH_CHUNK_ROWS = int(os.getenv("SHEETS_CHUNK_ROWS", "2000"))
+
+# Sheets fetched at the same time by batch (multi-person) jobs
+SHEETS_MAX_WORKERS = int(os.getenv("SHEETS_MAX_WORKERS", "8"))
+
+# Sheets API read quota shared by all requests in a process, and how many
+# times a throttled (429) or failed (5xx) request is retried
+SHEETS_READS_PER_MINUTE = float(os.getenv("SHEETS_READS_PER_MINUTE", "60"))
+SHEETS_MAX_RETRIES = int(os.getenv("SHEETS_MAX_RETRIES", "5"))
+
+# Report windows of up to this many days are computed from compact
+# per-entry records instead of DataFrames (0 = always use DataFrames)
+LITE_WINDOW_DAYS = int(os.getenv("LITE_WINDOW_DAYS", "31"))
+
+# Import-time budget (milliseconds) of each CLI entry point, checked by
+# import_profile.py
+STARTUP_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "150"))
+
+# Daily score anomaly detection: weight of each new day in the running
+# average, how many standard deviations below it count as a drop, and how
+# many days are needed before anything is flagged
+ANOMALY_EWMA_ALPHA = float(os.getenv("ANOMALY_EWMA_ALPHA", "0.2"))
+ANOMALY_Z_THRESHOLD = float(os.getenv("ANOMALY_Z_THRESHOLD", "2.0"))
+ANOMALY_MIN_DAYS = int(os.getenv("ANOMALY_MIN_DAYS", "7"))
+
 
 # Helper function to extract Sheet ID from URL
 def extract_sheet_id_from_url(url):
@@ -69,6 +105,149 @@ COLUMN_MAPPING = {
     "Focused on Career ?": "career_focus",
 }
 
+# Known answers for each form question, in the order the form lists them.
+# Answers are stored as categoricals over this vocabulary; anything the form
+# returns that is not listed here is appended after the known answers.
+ANSWER_CHOICES = {
+    "protein": [">= 100g", "< 100g"],
+    "day": [
+        "Monday",
+        "Tuesday",
+        "Wednesday",
+        "Thursday",
+        "Friday",
+        "Saturday",
+        "Sunday",
+    ],
+    "coding": ["Yes", "No"],
+    "marriage": ["Good", "Okayish", "Not good"],
+    "workout": ["Yes", "No"],
+    "performance": [
+        "Yes, better than yesterday",
+        "Same as yesterday",
+        "Worst than yesterday",
+    ],
+    "sunshine": ["Yes", "No"],
+    "chewing_gum": ["Yes", "No"],
+    "happiness": [
+        "Yes, I am happy",
+        "Slightly Neutral, could do better",
+        "No, I performed bad",
+    ],
+    "sleep": ["<5 hrs", "5 hrs", "6 hrs", "7 hrs", "8 hrs", "9 hrs", ">=10 hrs"],
+    "day_overview": [
+        "Did hard work - enjoyed",
+        "Did hard work - burned out",
+        "Procrastinated",
+    ],
+    "focus": ["Good, razor sharp", "I was multi-tasking, not good focus"],
+    "career_focus": [
+        "Good, achieved my today's goal",
+        "Neutral, gave my best",
+        "Lazy, didn't wanted to work",
+    ],
+}
+
+# Binary habits tracked as streaks: field -> answer that counts as done
+HABIT_TARGETS = {
+    "coding": "Yes",
+    "workout": "Yes",
+    "sunshine": "Yes",
+    "protein": ">= 100g",
+}
+
+# Numeric value of each answer (1 = best day, 0 = worst; sleep in hours).
+# Ingestion adds a "<field>_value" column per field using this table, so
+# averages and thresholds never have to parse answer strings row by row.
+ANSWER_VALUES = {
+    "protein": {">= 100g": 1.0, "< 100g": 0.0},
+    "coding": {"Yes": 1.0, "No": 0.0},
+    "marriage": {"Good": 1.0, "Okayish": 0.5, "Not good": 0.0},
+    "workout": {"Yes": 1.0, "No": 0.0},
+    "performance": {
+        "Yes, better than yesterday": 1.0,
+        "Same as yesterday": 0.5,
+        "Worst than yesterday": 0.0,
+    },
+    "sunshine": {"Yes": 1.0, "No": 0.0},
+    "chewing_gum": {"Yes": 1.0, "No": 0.0},
+    "happiness": {
+        "Yes, I am happy": 1.0,
+        "Slightly Neutral, could do better": 0.5,
+        "No, I performed bad": 0.0,
+    },
+    "sleep": {
+        "<5 hrs": 5.0,
+        "5 hrs": 5.0,
+        "6 hrs": 6.0,
+        "7 hrs": 7.0,
+        "8 hrs": 8.0,
+        "9 hrs": 9.0,
+        ">=10 hrs": 10.0,
+    },
+    "day_overview": {
+        "Did hard work - enjoyed": 1.0,
+        "Did hard work - burned out": 0.5,
+        "Procrastinated": 0.0,
+    },
+    "focus": {"Good, razor sharp": 1.0, "I was multi-tasking, not good focus": 0.0},
+    "career_focus": {
+        "Good, achieved my today's goal": 1.0,
+        "Neutral, gave my best": 0.5,
+        "Lazy, didn't wanted to work": 0.0,
+    },
+}
+
+# Timestamp formats Google Forms writes, tried in order on the first row
+TIMESTAMP_FORMATS = [
+    "%m/%d/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%d.%m.%Y %H:%M:%S",
+]
+
+# Report periods: length in days and how reports name them. A period may
+# also hold a "thresholds" dict overriding any of the thresholds below.
+REPORT_PERIODS = {
+    "week": {"days": 7, "label": "Weekly", "noun": "week"},
+    "month": {"days": 30, "label": "Monthly", "noun": "month"},
+    "quarter": {"days": 91, "label": "Quarterly", "noun": "quarter"},
+    "year": {"days": 365, "label": "Yearly", "noun": "year"},
+}
+
+# Insight thresholds shared by every period: shares of the logged days
+# ("_rate"), average sleep ("_hours"), section scores (0-100) and the change
+# (days/week) below which a trend counts as stable
+REPORT_THRESHOLDS = {
+    "coding_excellent_rate": 0.85,
+    "coding_good_rate": 0.7,
+    "protein_excellent_rate": 0.85,
+    "protein_good_rate": 0.6,
+    "workout_good_rate": 0.7,
+    "workout_fair_rate": 0.5,
+    "marriage_strong_rate": 0.7,
+    "marriage_moderate_rate": 0.4,
+    "sleep_min_hours": 7,
+    "sleep_max_hours": 9,
+    "sleep_low_hours": 6,
+    "excellent_score": 70,
+    "good_score": 50,
+    "focus_area_score": 60,
+    "stable_trend_days": 0.5,
+}
+
+# Day-count thresholds for a week; longer periods scale them to their
+# length (a month needs 21 goal days where a week needs 5)
+WEEKLY_DAY_THRESHOLDS = {
+    "goal_days": 5,
+    "lazy_days": 3,
+    "sunshine_days": 5,
+    "happy_great_days": 5,
+    "happy_good_days": 3,
+    "win_days": 4,
+    "procrastinated_days": 3,
+}
+
 
 def validate_config():
     """Validate that all required configurations are set."""
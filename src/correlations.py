@@ -0,0 +1,211 @@
+"""Cross-habit correlations and lift over the tracking history."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Sequence, Union
+from metrics import value_matrix
+
+# Value from which an answer counts as a good day (default: the best answer)
+GOOD_DAY_THRESHOLDS = {"sleep": 7.0}
+DEFAULT_GOOD_DAY_THRESHOLD = 1.0
+
+# Results kept in memory, keyed by a hash of the data
+CACHE_SIZE = 32
+
+_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def _daily_grid(
+    df: pd.DataFrame, by: Optional[Union[str, Sequence[str]]]
+) -> Dict[str, Any]:
+    """
+    Lay the answer values out on a (group, calendar day, field) grid.
+
+    Days without an entry are NaN. When a day has several entries, the last
+    one wins.
+    """
+    df = df[df["timestamp"].notna()]
+    fields, values = value_matrix(df)
+
+    days = df["timestamp"].to_numpy().astype("datetime64[D]")
+    day_index = (days - days.min()).astype(np.int64) if len(days) else days
+    n_days = int(day_index.max()) + 1 if len(days) else 0
+
+    if by is None:
+        group_codes = np.zeros(len(df), dtype=np.int64)
+        n_groups = 1
+    else:
+        by = [by] if isinstance(by, str) else list(by)
+        group_codes, groups = pd.MultiIndex.from_frame(df[by]).factorize()
+        n_groups = len(groups)
+
+    grid = np.full((n_groups, n_days, len(fields)), np.nan)
+    keep = group_codes >= 0
+    grid[group_codes[keep], day_index[keep]] = values[keep]
+    return {"fields": fields, "grid": grid}
+
+
+def _data_hash(grid: np.ndarray, fields: List[str], lag: int) -> str:
+    """Hash of everything a correlation result depends on."""
+    digest = hashlib.sha1(np.ascontiguousarray(grid).tobytes())
+    digest.update(repr((grid.shape, fields, lag)).encode())
+    return digest.hexdigest()
+
+
+def _pairwise(x: np.ndarray, y: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Correlate every column of ``x`` with every column of ``y``.
+
+    Each pair uses the rows where both values are present; everything is a
+    handful of matrix products over the whole history.
+    """
+    mx = (~np.isnan(x)).astype(float)
+    my = (~np.isnan(y)).astype(float)
+    x0 = np.where(mx > 0, x, 0.0)
+    y0 = np.where(my > 0, y, 0.0)
+
+    # Pearson correlation over pairwise-complete rows
+    n = mx.T @ my
+    sx = x0.T @ my
+    sy = mx.T @ y0
+    sxx = (x0**2).T @ my
+    syy = mx.T @ (y0**2)
+    sxy = x0.T @ y0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx**2 / n
+        var_y = syy - sy**2 / n
+        corr = cov / np.sqrt(var_x * var_y)
+    corr[(n < 2) | (var_x <= 1e-12) | (var_y <= 1e-12)] = np.nan
+
+    return {"pairs": n, "corr": corr, "x_present": mx, "y_present": my}
+
+
+def _good_days(values: np.ndarray, fields: List[str]) -> np.ndarray:
+    """1 where a field had a good day, 0 otherwise (including missing)."""
+    thresholds = np.array(
+        [GOOD_DAY_THRESHOLDS.get(f, DEFAULT_GOOD_DAY_THRESHOLD) for f in fields]
+    )
+    with np.errstate(invalid="ignore"):
+        return (values >= thresholds).astype(float)
+
+
+def correlate(
+    df: pd.DataFrame,
+    lag: int = 0,
+    by: Optional[Union[str, Sequence[str]]] = None,
+) -> Dict[str, Any]:
+    """
+    Relate every tracked field to every other one.
+
+    Answers are turned into numbers (see ``ANSWER_VALUES``) and laid out
+    per calendar day. With ``lag`` > 0, each field on one day is related to
+    every field ``lag`` days later, e.g. yesterday's sleep vs today's focus.
+    Results are cached by a hash of the data.
+
+    Args:
+        df: Daily entries with a ``timestamp`` column
+        lag: Days between the first field (rows) and the second (columns)
+        by: Optional user column(s); days are never paired across users
+
+    Returns:
+        Dictionary (shared with the cache; treat as read-only) with
+        DataFrames indexed by field (rows = earlier day):
+        ``correlation`` (Pearson r), ``pairs`` (days compared),
+        ``conditional`` (rate of a good day in the column field given a good
+        day in the row field) and ``lift`` (conditional rate divided by the
+        column field's overall good-day rate)
+    """
+    layout = _daily_grid(df, by)
+    fields, grid = layout["fields"], layout["grid"]
+
+    key = _data_hash(grid, fields, lag)
+    with _CACHE_LOCK:
+        if key in _CACHE:
+            _CACHE.move_to_end(key)
+            return _CACHE[key]
+
+    # Pair day t (rows) with day t + lag (columns) within each group
+    days = grid.shape[1]
+    x = grid[:, : max(days - lag, 0)].reshape(-1, len(fields))
+    y = grid[:, lag:].reshape(-1, len(fields))
+    stats = _pairwise(x, y)
+
+    # Conditional good-day rates and lift, over days where both are present
+    good_x = _good_days(x, fields)
+    good_y = _good_days(y, fields)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        conditional = (good_x.T @ good_y) / (good_x.T @ stats["y_present"])
+        base_rate = good_y.sum(axis=0) / stats["y_present"].sum(axis=0)
+        lift = conditional / base_rate
+
+    def frame(matrix: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(matrix, index=fields, columns=fields)
+
+    result = {
+        "lag": lag,
+        "correlation": frame(stats["corr"]),
+        "pairs": frame(stats["pairs"]).astype(int),
+        "conditional": frame(conditional),
+        "lift": frame(lift),
+    }
+
+    with _CACHE_LOCK:
+        _CACHE[key] = result
+        while len(_CACHE) > CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return result
+
+
+def top_relationships(
+    result: Dict[str, Any], limit: int = 5, min_pairs: int = 7
+) -> List[Dict[str, Any]]:
+    """
+    Strongest relationships between two different fields.
+
+    Args:
+        result: Output of :func:`correlate`
+        limit: Number of relationships to return
+        min_pairs: Ignore pairs compared on fewer days than this
+
+    Returns:
+        List of dicts (cause, effect, correlation, lift, pairs), strongest
+        absolute correlation first
+    """
+    corr = result["correlation"]
+    pairs = result["pairs"]
+    fields = list(corr.index)
+
+    values = corr.to_numpy(copy=True)
+    values[pairs.to_numpy() < min_pairs] = np.nan
+    np.fill_diagonal(values, np.nan)
+    if result["lag"] == 0:
+        # Same-day correlations are symmetric; keep each pair once
+        values[np.tril_indices(len(fields))] = np.nan
+
+    order = np.argsort(-np.nan_to_num(np.abs(values), nan=-1.0), axis=None)
+    relationships = []
+    for flat in order[:limit]:
+        i, j = np.unravel_index(flat, values.shape)
+        if np.isnan(values[i, j]):
+            break
+        relationships.append(
+            {
+                "cause": fields[i],
+                "effect": fields[j],
+                "correlation": float(values[i, j]),
+                "lift": float(result["lift"].iat[i, j]),
+                "pairs": int(pairs.iat[i, j]),
+            }
+        )
+    return relationships
+
+
+def clear_cache():
+    """Drop all cached correlation results."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
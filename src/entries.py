@@ -0,0 +1,341 @@
+"""Compact daily entries for small windows, without pandas."""
+
+import math
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from config import ANSWER_VALUES, COLUMN_MAPPING, HABIT_TARGETS, TIMESTAMP_FORMATS
+from window import WindowMetrics, answer_value
+
+# Answer fields a DailyEntry can hold, in form order
+ENTRY_FIELDS = tuple(field for field in COLUMN_MAPPING.values() if field != "timestamp")
+
+# Streak metrics reported per habit
+STREAK_COLUMNS = [
+    "current_streak",
+    "longest_streak",
+    "gaps",
+    "longest_gap",
+    "done_days",
+    "logged_days",
+    "completion_rate",
+]
+
+# Timestamps used to detect the sheet's timestamp format
+SAMPLE_SIZE = 50
+
+
+class DailyEntry:
+    """
+    One form submission stored in slots instead of a DataFrame row.
+
+    Blank answers are None. Answers of columns the sheet does not have are
+    left unset, so ``hasattr(entry, field)`` tells whether a field is
+    tracked at all.
+    """
+
+    __slots__ = ("timestamp",) + ENTRY_FIELDS
+
+    def __init__(self, timestamp: Optional[datetime], **answers: Any):
+        """
+        Initialize an entry.
+
+        Args:
+            timestamp: When the form was submitted
+            **answers: Answer per field (``ENTRY_FIELDS``)
+        """
+        self.timestamp = timestamp
+        for field, answer in answers.items():
+            setattr(self, field, answer)
+
+    def __repr__(self) -> str:
+        answers = ", ".join(
+            f"{field}={getattr(self, field)!r}"
+            for field in ENTRY_FIELDS
+            if hasattr(self, field)
+        )
+        return f"DailyEntry({self.timestamp!r}, {answers})"
+
+
+def detect_timestamp_format(
+    samples: List[str], formats: Iterable[str] = TIMESTAMP_FORMATS
+) -> Optional[str]:
+    """Return the candidate format that parses the most samples."""
+    best_format, best_hits = None, 0
+    for fmt in formats:
+        hits = 0
+        for sample in samples:
+            try:
+                datetime.strptime(sample, fmt)
+                hits += 1
+            except ValueError:
+                pass
+        if hits > best_hits:
+            best_format, best_hits = fmt, hits
+    return best_format
+
+
+def parse_timestamp(
+    value: Any, formats: Iterable[str] = TIMESTAMP_FORMATS
+) -> Optional[datetime]:
+    """
+    Parse a form timestamp with the first matching format.
+
+    Values no format matches are inferred by ``dateutil``, like the pandas
+    engine's fallback, so a sheet with an unlisted format is still read.
+    Returns None for blank or unreadable values.
+    """
+    if isinstance(value, datetime):
+        return value
+    for fmt in formats:
+        try:
+            return datetime.strptime(str(value), fmt)
+        except ValueError:
+            pass
+    if value == "":
+        return None
+
+    from dateutil import parser
+
+    try:
+        return parser.parse(str(value))
+    except (ValueError, OverflowError):
+        return None
+
+
+def entries_from_rows(columns: List[str], rows: List[List[Any]]) -> List[DailyEntry]:
+    """
+    Build entries from raw sheet rows.
+
+    Columns are mapped with ``COLUMN_MAPPING``; columns the form mapping
+    does not know are ignored. Entries are returned sorted by timestamp and
+    rows without a readable timestamp are dropped.
+
+    Args:
+        columns: Sheet column names
+        rows: Rows of cell values, in column order
+
+    Returns:
+        List of DailyEntry, oldest first
+    """
+    mapped = [COLUMN_MAPPING.get(column) for column in columns]
+    positions = [
+        (i, field) for i, field in enumerate(mapped) if field in ENTRY_FIELDS
+    ]
+    stamp = mapped.index("timestamp") if "timestamp" in mapped else None
+
+    # Try the format that fits the first rows before the others
+    formats = list(TIMESTAMP_FORMATS)
+    if stamp is not None:
+        samples = [str(row[stamp]) for row in rows[:SAMPLE_SIZE] if row[stamp] != ""]
+        detected = detect_timestamp_format(samples, formats)
+        if detected:
+            formats.remove(detected)
+            formats.insert(0, detected)
+
+    entries = []
+    for row in rows:
+        timestamp = parse_timestamp(row[stamp], formats) if stamp is not None else None
+        if timestamp is None:
+            continue
+        answers = {field: (row[i] if row[i] != "" else None) for i, field in positions}
+        entries.append(DailyEntry(timestamp, **answers))
+
+    entries.sort(key=lambda entry: entry.timestamp)
+    return entries
+
+
+def select_window(
+    entries: List[DailyEntry],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> List[DailyEntry]:
+    """Entries from ``start`` to ``end`` (inclusive) of a sorted list."""
+    timestamps = [entry.timestamp for entry in entries]
+    lo = 0 if start is None else bisect_left(timestamps, start)
+    hi = len(entries) if end is None else bisect_right(timestamps, end)
+    return entries[lo:hi]
+
+
+def locate_window(
+    stamps: List[Any],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    last: Optional[int] = None,
+) -> Tuple[int, int]:
+    """
+    Positions of a time window in a column of raw timestamps.
+
+    The column must be in submission order, as Google Forms appends it.
+    Both bounds are found by binary search, so only O(log n) cells are
+    parsed; a blank or unreadable cell takes the time of the nearest
+    readable cell above it, so it never breaks the ordering.
+
+    Args:
+        stamps: Raw timestamp cells, oldest first
+        start: First timestamp to include (None = from the beginning)
+        end: Last timestamp to include (None = up to the latest cell)
+        last: Keep at most the last N cells of the window
+
+    Returns:
+        Tuple of (lo, hi): the window is ``stamps[lo:hi]``
+    """
+    formats = list(TIMESTAMP_FORMATS)
+    samples = [str(stamp) for stamp in stamps[:SAMPLE_SIZE] if stamp != ""]
+    detected = detect_timestamp_format(samples, formats)
+    if detected:
+        formats.remove(detected)
+        formats.insert(0, detected)
+
+    parsed: Dict[int, datetime] = {}
+
+    def when(i: int) -> datetime:
+        if i not in parsed:
+            j, value = i, None
+            while j >= 0 and value is None:
+                value = parse_timestamp(stamps[j], formats)
+                j -= 1
+            parsed[i] = value or datetime.min
+        return parsed[i]
+
+    def first_after(bound: datetime, inclusive: bool) -> int:
+        lo, hi = 0, len(stamps)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if when(mid) < bound or (not inclusive and when(mid) == bound):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    lo = 0 if start is None else first_after(start, inclusive=True)
+    hi = len(stamps) if end is None else first_after(end, inclusive=False)
+    if last is not None:
+        lo = max(lo, hi - last)
+    return lo, max(lo, hi)
+
+
+def _tracked_fields(entries: List[DailyEntry]) -> List[str]:
+    """Fields the sheet has, judging by the first entry."""
+    if not entries:
+        return []
+    return [field for field in ENTRY_FIELDS if hasattr(entries[0], field)]
+
+
+def entry_metrics(entries: List[DailyEntry]) -> WindowMetrics:
+    """
+    Compute the metrics of a window of entries in one pass.
+
+    Gives the same answer counts and means as ``metrics.compute_metrics``
+    on the equivalent DataFrame.
+    """
+    fields = _tracked_fields(entries)
+    counts = {field: Counter() for field in fields}
+    sums = {f: 0.0 for f in fields if f in ANSWER_VALUES or f == "sleep"}
+    seen = dict.fromkeys(sums, 0)
+
+    for entry in entries:
+        for field in fields:
+            answer = getattr(entry, field)
+            if answer is None:
+                continue
+            counts[field][answer] += 1
+            if field in sums:
+                value = answer_value(field, answer)
+                if value is not None:
+                    sums[field] += value
+                    seen[field] += 1
+
+    means = {f: sums[f] / seen[f] if seen[f] else math.nan for f in sums}
+    return WindowMetrics(
+        len(entries),
+        {field: dict(counter) for field, counter in counts.items()},
+        entries[0].timestamp if entries else None,
+        entries[-1].timestamp if entries else None,
+        means,
+    )
+
+
+def entry_streaks(
+    entries: List[DailyEntry],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    habits: Optional[Dict[str, str]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Streak metrics of each binary habit (see ``habits.HabitMatrix.streaks``).
+
+    Args:
+        entries: Entries sorted by timestamp; the current streak may reach
+            back before ``start`` as far as they go
+        start: First day of the window (None = first entry)
+        end: Last day of the window (None = last entry)
+        habits: Field -> answer that counts as done (default:
+            ``HABIT_TARGETS``)
+
+    Returns:
+        Dictionary of habit -> ``STREAK_COLUMNS`` values
+    """
+    habits = HABIT_TARGETS if habits is None else habits
+    tracked = _tracked_fields(entries)
+    fields = [field for field in habits if field in tracked]
+    if not entries:
+        return {}
+
+    first = entries[0].timestamp.toordinal()
+    last = entries[-1].timestamp.toordinal()
+
+    def day(when: Optional[datetime], default: int) -> int:
+        if when is None:
+            return default
+        return min(max(when.toordinal(), first - 1), last + 1)
+
+    lo = max(day(start, first), first)
+    hi = min(day(end, last), last)
+
+    if hi < lo:
+        # Empty window: nothing to count
+        return {field: dict.fromkeys(STREAK_COLUMNS, 0) for field in fields}
+
+    logged = {entry.timestamp.toordinal() for entry in entries}
+    logged_days = sum(1 for d in logged if lo <= d <= hi)
+
+    streaks = {}
+    for field in fields:
+        done = {
+            entry.timestamp.toordinal()
+            for entry in entries
+            if getattr(entry, field) == habits[field]
+        }
+
+        current = 0
+        d = hi
+        while d >= first and d in done:
+            current += 1
+            d -= 1
+
+        longest = gaps = longest_gap = done_days = run = gap = 0
+        for d in range(lo, hi + 1):
+            if d in done:
+                done_days += 1
+                run += 1
+                longest = max(longest, run)
+                gap = 0
+            else:
+                if gap == 0:
+                    gaps += 1
+                gap += 1
+                longest_gap = max(longest_gap, gap)
+                run = 0
+
+        streaks[field] = {
+            "current_streak": current,
+            "longest_streak": longest,
+            "gaps": gaps,
+            "longest_gap": longest_gap,
+            "done_days": done_days,
+            "logged_days": logged_days,
+            "completion_rate": done_days / logged_days if logged_days else 0.0,
+        }
+    return streaks
@@ -0,0 +1,237 @@
+"""Bit-packed daily habit matrix with streak analytics."""
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from config import HABIT_TARGETS
+from entries import STREAK_COLUMNS
+
+
+def _runs(bits: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run-length encode the True runs of every row at once.
+
+    Returns:
+        Tuple of (row, start column, end column) per run, end exclusive
+    """
+    padded = np.zeros((bits.shape[0], bits.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = bits
+    edges = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return rows, starts, ends
+
+
+def _longest(rows: np.ndarray, lengths: np.ndarray, n_rows: int) -> np.ndarray:
+    """Longest run per row (0 for rows without runs)."""
+    longest = np.zeros(n_rows, dtype=np.int64)
+    np.maximum.at(longest, rows, lengths)
+    return longest
+
+
+class HabitMatrix:
+    """
+    Daily done/not-done bits of binary habits, packed 8 days per byte.
+
+    Each row is one habit (of one user, when built per user) over the
+    calendar days from the first to the last entry of any user. A day
+    without an entry counts as not done. Streaks, gaps and completion rates for any window
+    are computed with vectorized run-length encoding over all rows at once.
+    """
+
+    def __init__(
+        self,
+        bits: np.ndarray,
+        logged: np.ndarray,
+        n_days: int,
+        first_day: np.datetime64,
+        index: pd.Index,
+        row_groups: np.ndarray,
+    ):
+        """
+        Initialize from packed bits (see :meth:`from_history`).
+
+        Args:
+            bits: Packed habit bits, one row per (group, habit)
+            logged: Packed bits of days with an entry, one row per group
+            n_days: Number of calendar days covered
+            first_day: Calendar day of column 0
+            index: Label of each habit row
+            row_groups: Group (row of ``logged``) of each habit row
+        """
+        self.bits = bits
+        self.logged = logged
+        self.n_days = n_days
+        self.first_day = first_day
+        self.index = index
+        self.row_groups = row_groups
+
+    @classmethod
+    def from_history(
+        cls,
+        df: pd.DataFrame,
+        habits: Optional[Dict[str, str]] = None,
+        by: Optional[Union[str, Sequence[str]]] = None,
+    ) -> "HabitMatrix":
+        """
+        Pack the habits of a tracking history.
+
+        Args:
+            df: Daily entries with a ``timestamp`` column
+            habits: Field -> answer that counts as done (default:
+                ``HABIT_TARGETS``); fields missing from ``df`` are skipped
+            by: Optional key column(s), e.g. the user, to get one row per
+                group and habit
+
+        Returns:
+            HabitMatrix of the history
+        """
+        habits = HABIT_TARGETS if habits is None else habits
+        fields = [field for field in habits if field in df.columns]
+        df = df[df["timestamp"].notna()]
+
+        days = df["timestamp"].to_numpy().astype("datetime64[D]")
+        first_day = days.min() if len(days) else np.datetime64("NaT", "D")
+        day_index = (days - first_day).astype(np.int64)
+        n_days = int(day_index.max()) + 1 if len(days) else 0
+
+        if by is None:
+            group_codes = np.zeros(len(df), dtype=np.int64)
+            groups: List = [None]
+        else:
+            by = [by] if isinstance(by, str) else list(by)
+            keys = pd.MultiIndex.from_frame(df[by])
+            group_codes, groups = keys.factorize(sort=True)
+            groups = list(groups)
+
+            # Rows without a key belong to no group
+            keep = group_codes >= 0
+            group_codes, day_index = group_codes[keep], day_index[keep]
+            df = df[keep]
+
+        n_groups, n_habits = len(groups), len(fields)
+        done = np.zeros((n_groups * n_habits, n_days), dtype=bool)
+        logged = np.zeros((n_groups, n_days), dtype=bool)
+        logged[group_codes, day_index] = True
+        for h, field in enumerate(fields):
+            hit = (df[field] == habits[field]).to_numpy(dtype=bool)
+            done[group_codes[hit] * n_habits + h, day_index[hit]] = True
+
+        if by is None:
+            index = pd.Index(fields, name="habit")
+        else:
+            index = pd.MultiIndex.from_tuples(
+                [(*group, field) for group in groups for field in fields],
+                names=[*by, "habit"],
+            )
+
+        return cls(
+            np.packbits(done, axis=1),
+            np.packbits(logged, axis=1),
+            n_days,
+            first_day,
+            index,
+            np.repeat(np.arange(n_groups), n_habits),
+        )
+
+    def _day(self, when: Optional[datetime], default: int) -> int:
+        """Column of a calendar day, clipped to the matrix."""
+        if when is None or self.n_days == 0:
+            return default
+        day = np.datetime64(pd.Timestamp(when).date(), "D")
+        return int(np.clip((day - self.first_day).astype(np.int64), -1, self.n_days))
+
+    @staticmethod
+    def _unpack(packed: np.ndarray, hi: int) -> np.ndarray:
+        """Unpack days ``0..hi-1`` of every row."""
+        return np.unpackbits(packed, axis=1, count=hi).astype(bool)
+
+    def streaks(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """
+        Streak metrics of every habit for the days from ``start`` to ``end``.
+
+        The current streak is the run of done days ending on ``end`` (the
+        last day by default) and may reach back before ``start``; the other
+        metrics only look at the window. Each group's window is also bounded
+        by its own first and last entry, so groups that stop logging on
+        different days are each measured up to their own last day.
+
+        Args:
+            start: First day of the window (None = first entry)
+            end: Last day of the window (None = last entry)
+
+        Returns:
+            DataFrame indexed by habit (or user and habit) with the columns
+            of ``STREAK_COLUMNS``
+        """
+        lo = max(self._day(start, 0), 0)
+        hi = min(self._day(end, self.n_days - 1) + 1, self.n_days)
+        n_rows = len(self.index)
+        if hi <= lo:
+            empty = np.zeros((n_rows, len(STREAK_COLUMNS)))
+            return pd.DataFrame(empty, index=self.index, columns=STREAK_COLUMNS)
+
+        # Days lo..hi-1 of each group, clipped to its first and last entry
+        logged = self._unpack(self.logged, self.n_days)
+        first = logged.argmax(axis=1)
+        last = self.n_days - logged[:, ::-1].argmax(axis=1)
+        group_lo = np.maximum(first, lo)
+        group_hi = np.minimum(last, hi)
+        logged = logged[:, :hi]
+        days = np.arange(hi)
+        in_group = (days >= group_lo[:, None]) & (days < group_hi[:, None])
+        logged_days = (logged & in_group).sum(axis=1)
+
+        row_lo = group_lo[self.row_groups]
+        row_hi = group_hi[self.row_groups]
+        history = self._unpack(self.bits, hi) & (days < row_hi[:, None])
+        inside = in_group[self.row_groups]
+        window = history & inside
+
+        # Current streak: the run that reaches the group's last day
+        rows, starts, ends = _runs(history)
+        current = np.zeros(n_rows, dtype=np.int64)
+        reaches_end = (ends == row_hi[rows]) & (row_hi[rows] > row_lo[rows])
+        current[rows[reaches_end]] = (ends - starts)[reaches_end]
+
+        # Longest streak and gaps inside the window
+        rows, starts, ends = _runs(window)
+        longest = _longest(rows, ends - starts, n_rows)
+        gap_rows, gap_starts, gap_ends = _runs(inside & ~window)
+        gaps = np.bincount(gap_rows, minlength=n_rows)
+        longest_gap = _longest(gap_rows, gap_ends - gap_starts, n_rows)
+
+        done_days = window.sum(axis=1)
+        logged = logged_days[self.row_groups]
+        completion = np.where(logged > 0, done_days / np.maximum(logged, 1), 0.0)
+
+        return pd.DataFrame(
+            {
+                "current_streak": current,
+                "longest_streak": longest,
+                "gaps": gaps,
+                "longest_gap": longest_gap,
+                "done_days": done_days,
+                "logged_days": logged,
+                "completion_rate": completion,
+            },
+            index=self.index,
+        )
+
+
+def habit_streaks(
+    df: pd.DataFrame,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """
+    Streak metrics of one user's habits (see :meth:`HabitMatrix.streaks`).
+
+    Returns an empty table when ``df`` has no timestamps or habits.
+    """
+    if "timestamp" not in df.columns or df.empty:
+        return pd.DataFrame(columns=STREAK_COLUMNS)
+    return HabitMatrix.from_history(df).streaks(start, end)
@@ -0,0 +1,152 @@
+"""Measure what each CLI entry point costs to import."""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Add src to path if needed
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import STARTUP_BUDGET_MS
+
+SRC_DIR = Path(__file__).parent
+
+# Modules run from the command line (or by cron)
+ENTRY_POINTS = [
+    "config",
+    "main",
+    "summarize_last_week",
+    "summarize_last_month",
+    "periods",
+    "scheduler",
+    "backfill",
+    "anomalies",
+]
+
+# Dependencies that must only load once a stage actually needs them
+HEAVY_MODULES = ["pandas", "numpy", "gspread", "google.oauth2", "twilio", "requests"]
+
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """
+    Parse the report of ``python -X importtime``.
+
+    Returns:
+        One dict per imported module: ``name``, ``self_ms`` and
+        ``cumulative_ms`` (including the modules it imported)
+    """
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        modules.append(
+            {
+                "name": parts[2].strip(),
+                "self_ms": int(parts[0]) / 1000,
+                "cumulative_ms": int(parts[1]) / 1000,
+            }
+        )
+    return modules
+
+
+def profile_import(module: str, repeat: int = 3) -> Dict[str, Any]:
+    """
+    Import a module in fresh interpreters and report its cost.
+
+    Args:
+        module: Module name (importable from ``src/``)
+        repeat: Fresh imports to run; the fastest one is reported
+
+    Returns:
+        Dictionary with the module, ``total_ms``, the imported ``modules``
+        (see :func:`parse_importtime`, costliest first) and the ``heavy``
+        dependencies it loaded
+    """
+    best: Optional[Dict[str, Any]] = None
+    for _ in range(max(1, repeat)):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        modules = parse_importtime(result.stderr)
+        total = next(m["cumulative_ms"] for m in modules if m["name"] == module)
+        if best is None or total < best["total_ms"]:
+            best = {"module": module, "total_ms": total, "modules": modules}
+
+    names = {m["name"] for m in best["modules"]}
+    best["heavy"] = [name for name in HEAVY_MODULES if name in names]
+    best["modules"].sort(key=lambda m: m["self_ms"], reverse=True)
+    return best
+
+
+def main(
+    modules: Optional[Iterable[str]] = None,
+    top: int = 5,
+    budget: float = STARTUP_BUDGET_MS,
+) -> bool:
+    """
+    Print the import cost of every entry point against the budget.
+
+    Args:
+        modules: Modules to profile (default: ``ENTRY_POINTS``)
+        top: Costliest imported modules to list per entry point
+        budget: Allowed import time per entry point, in milliseconds
+
+    Returns:
+        True if every entry point is within budget and loads no heavy
+        dependency at import time
+    """
+    print("=" * 70)
+    print(f"⏱️ Alpha-X - Import Time (budget {budget:.0f} ms per entry point)")
+    print("=" * 70)
+
+    ok = True
+    for module in modules or ENTRY_POINTS:
+        profile = profile_import(module)
+        within = profile["total_ms"] <= budget and not profile["heavy"]
+        ok = ok and within
+
+        print(f"\n{'✅' if within else '❌'} {module}: {profile['total_ms']:.1f} ms")
+        for m in profile["modules"][:top]:
+            print(f"   {m['self_ms']:7.1f} ms  {m['name']}")
+        if profile["heavy"]:
+            print(f"   ⚠️ Loads at import: {', '.join(profile['heavy'])}")
+
+    print()
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Report the import time of each CLI entry point"
+    )
+    parser.add_argument(
+        "--module",
+        action="append",
+        dest="modules",
+        help="Module to profile (repeat for several; default: all entry points)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        help="Costliest imported modules to list per entry point",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=STARTUP_BUDGET_MS,
+        help="Allowed import time per entry point, in milliseconds",
+    )
+
+    args = parser.parse_args()
+
+    sys.exit(0 if main(args.modules, args.top, args.budget) else 1)
@@ -4,17 +4,40 @@ import argparse
 from datetime import datetime
 from sheets_client import SheetsClient
 from analyzer import PersonalizationAnalyzer
+from report import render, write_report
 from whatsapp_client import WhatsAppClient
 import config
 
 
-def main(weeks_ago: int = 0, dry_run: bool = False):
+def load_week(sheets_client: SheetsClient, weeks_ago: int):
+    """
+    Get the metrics and habit streaks of one week.
+
+    The week comes from running totals of the DataFrame history, which is
+    fetched incrementally (and kept in the snapshot), so a weekly run only
+    downloads the rows added since the last one. Streaks read the same
+    history, since they can reach back before the week.
+
+    Returns:
+        Tuple of (WindowMetrics, streaks)
+    """
+    from habits import habit_streaks
+
+    fields = PersonalizationAnalyzer.REQUIRED_FIELDS
+    metrics = sheets_client.get_weekly_metrics(weeks_ago=weeks_ago, fields=fields)
+    history = sheets_client.get_all_data(fields=fields)
+    return metrics, habit_streaks(history, metrics.start, metrics.end)
+
+
+def main(weeks_ago: int = 0, dry_run: bool = False, outputs=None):
     """
     Main function to generate and send weekly insights.
 
     Args:
         weeks_ago: Number of weeks back to analyze (0 = current week)
         dry_run: If True, only print report without sending
+        outputs: Files to also write the report to; the format follows the
+            suffix (.txt, .json, .html)
     """
     print("=" * 60)
     print("🎯 Alpha-X - Weekly Insights Generator")
@@ -32,19 +55,20 @@ def main(weeks_ago: int = 0, dry_run: bool = False):
         sheets_client = SheetsClient()
         sheets_client.connect()
 
-        # Get weekly data
-        weekly_data = sheets_client.get_weekly_data(weeks_ago=weeks_ago)
+        # Get weekly metrics and habit streaks
+        weekly_metrics, streaks = load_week(sheets_client, weeks_ago)
 
-        if weekly_data.empty:
+        if weekly_metrics.total_days == 0:
             print("❌ No data found for the specified week")
             return
 
-        print(f"✅ Found {len(weekly_data)} entries for analysis\n")
+        print(f"✅ Found {weekly_metrics.total_days} entries for analysis\n")
 
         # Analyze data
         print("🔍 Analyzing your performance...")
-        analyzer = PersonalizationAnalyzer(weekly_data)
-        report = analyzer.generate_weekly_report()
+        analyzer = PersonalizationAnalyzer(metrics=weekly_metrics, streaks=streaks)
+        weekly = analyzer.report()
+        report = render(weekly, "text")
 
         print("\n" + "=" * 60)
         print("📊 WEEKLY REPORT")
@@ -53,13 +77,16 @@ def main(weeks_ago: int = 0, dry_run: bool = False):
         print("=" * 60)
 
         # Get focus areas
-        focus_areas = analyzer.get_focus_areas()
-        if focus_areas:
+        if weekly.focus_areas:
             print("\n🎯 Focus Areas for Next Week:")
-            for i, area in enumerate(focus_areas, 1):
+            for i, area in enumerate(weekly.focus_areas, 1):
                 print(f"   {i}. {area}")
             print()
 
+        # Other formats are rendered from the same analysis
+        for path in outputs or []:
+            print(f"💾 Report saved to {write_report(weekly, path)}")
+
         # Send via WhatsApp
         if not dry_run:
             print("\n📱 Sending report to WhatsApp...")
@@ -99,6 +126,13 @@ if __name__ == "__main__":
         help="Generate report without sending to WhatsApp",
     )
 
+    parser.add_argument(
+        "--output",
+        action="append",
+        dest="outputs",
+        help="Also write the report to a .txt, .json or .html file (repeatable)",
+    )
+
     args = parser.parse_args()
 
-    main(weeks_ago=args.weeks_ago, dry_run=args.dry_run)
+    main(weeks_ago=args.weeks_ago, dry_run=args.dry_run, outputs=args.outputs)
@@ -0,0 +1,320 @@
+"""Vectorized metrics engine for daily tracking data."""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Optional, Tuple
+from config import ANSWER_VALUES
+from window import WindowMetrics, answer_value, sleep_hours
+
+# Columns that hold form answers rather than metadata
+NON_ANSWER_COLUMNS = {"timestamp"}
+
+# Suffix of the numeric column derived from each answer column
+VALUE_SUFFIX = "_value"
+
+
+def value_column(field: str) -> str:
+    """Name of the numeric column derived from an answer column."""
+    return f"{field}{VALUE_SUFFIX}"
+
+
+def answer_fields(df: pd.DataFrame) -> List[str]:
+    """Return the columns of ``df`` that hold form answers."""
+    return [
+        c
+        for c in df.columns
+        if c not in NON_ANSWER_COLUMNS and not str(c).endswith(VALUE_SUFFIX)
+    ]
+
+
+def value_lookup(field: str, answers: List[Any]) -> np.ndarray:
+    """
+    Build a code -> value table for a field's answers.
+
+    The table has one extra trailing NaN entry so that missing answers
+    (code -1) index it directly.
+    """
+    values = [answer_value(field, answer) for answer in answers]
+    return np.array(
+        [np.nan if v is None else v for v in values] + [np.nan], dtype=float
+    )
+
+
+def add_value_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add a ``<field>_value`` column for every answer column with known values.
+
+    Each distinct answer is looked up once; rows are then mapped with a
+    single array take over their integer codes.
+    """
+    for field in answer_fields(df):
+        if field not in ANSWER_VALUES and field != "sleep":
+            continue
+        codes, answers = _encode(df[field])
+        df[value_column(field)] = value_lookup(field, answers)[codes]
+    return df
+
+
+def _encode(series: pd.Series) -> Tuple[np.ndarray, List[Any]]:
+    """Return integer codes (-1 = missing) and the answer for each code."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), list(series.cat.categories)
+    codes, uniques = pd.factorize(series)
+    return codes, list(uniques)
+
+
+def count_answers(
+    df: pd.DataFrame, fields: Optional[List[str]] = None
+) -> Dict[str, Dict[Any, int]]:
+    """
+    Count every answer of every field in a single vectorized pass.
+
+    The answer codes of all fields are shifted into one shared code space
+    and counted with one ``np.bincount`` call, instead of running a
+    ``value_counts()`` or ``== answer`` scan per field and per answer.
+
+    Args:
+        df: Daily entries, answers as categoricals or plain values
+        fields: Fields to count (default: every answer column)
+
+    Returns:
+        Dictionary mapping field -> {answer: count}; every known answer of
+        a categorical field is present, with 0 if it was never given
+    """
+    if fields is None:
+        fields = answer_fields(df)
+
+    encoded, offsets, shifted = _shared_codes(df, fields)
+    if shifted is None:
+        return _unpack_counts(fields, encoded, offsets, None)
+
+    counts = np.bincount(shifted.ravel(), minlength=_code_space(encoded) + 1)
+    return _unpack_counts(fields, encoded, offsets, counts)
+
+
+def _code_space(encoded: List[Tuple[np.ndarray, List[Any]]]) -> int:
+    """Number of answer codes across all fields (without the overflow bin)."""
+    return sum(len(answers) for _, answers in encoded)
+
+
+def _shared_codes(
+    df: pd.DataFrame, fields: List[str]
+) -> Tuple[List[Tuple[np.ndarray, List[Any]]], np.ndarray, Optional[np.ndarray]]:
+    """
+    Shift the answer codes of several fields into one shared code space.
+
+    Returns:
+        Tuple of (per-field codes and answers, per-field offsets, and a
+        rows x fields matrix of shared codes, or None when there is nothing
+        to count). Missing answers map to an overflow code past the end.
+    """
+    encoded = [_encode(df[field]) for field in fields]
+    widths = np.array([len(answers) for _, answers in encoded], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(widths)[:-1])).astype(np.int64)
+    if not encoded or len(df) == 0:
+        return encoded, offsets, None
+
+    total = int(widths.sum())
+    codes = np.stack([codes.astype(np.int64) for codes, _ in encoded], axis=1)
+    return encoded, offsets, np.where(codes >= 0, codes + offsets, total)
+
+
+def _unpack_counts(
+    fields: List[str],
+    encoded: List[Tuple[np.ndarray, List[Any]]],
+    offsets: np.ndarray,
+    counts: Optional[np.ndarray],
+) -> Dict[str, Dict[Any, int]]:
+    """Turn a flat shared-code histogram back into per-field answer counts."""
+    if counts is None:
+        return {
+            field: {answer: 0 for answer in answers}
+            for field, (_, answers) in zip(fields, encoded)
+        }
+    return {
+        field: dict(zip(answers, counts[offset : offset + len(answers)].tolist()))
+        for field, (_, answers), offset in zip(fields, encoded, offsets)
+    }
+
+
+def value_matrix(df: pd.DataFrame) -> Tuple[List[str], np.ndarray]:
+    """
+    Return the valued fields of ``df`` and a rows x fields matrix of values.
+
+    Uses the ``<field>_value`` columns added at ingestion; frames that were
+    not ingested get them derived on the fly.
+    """
+    fields = [
+        f for f in answer_fields(df) if f in ANSWER_VALUES or f == "sleep"
+    ]
+    if any(value_column(f) not in df.columns for f in fields):
+        df = add_value_columns(df[fields].copy())
+    columns = [value_column(f) for f in fields]
+    return fields, df[columns].to_numpy(dtype=float).reshape(len(df), len(fields))
+
+
+def _mean(sums: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Divide sums by counts, with NaN where there was nothing to average."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+
+def mean_values(df: pd.DataFrame) -> Dict[str, float]:
+    """Average every numeric answer column in one vectorized reduction."""
+    fields, values = value_matrix(df)
+    present = ~np.isnan(values)
+    means = _mean(np.where(present, values, 0).sum(axis=0), present.sum(axis=0))
+    return dict(zip(fields, means.tolist()))
+
+
+def daily_scores(df: pd.DataFrame) -> np.ndarray:
+    """
+    Composite score (0-100) of every entry: the average of its answer values.
+
+    Sleep counts fully for 7-9 hours and half for 6 or 10+ hours, like the
+    weekly health score. Entries without any scored answer get NaN.
+    """
+    fields, values = value_matrix(df)
+    if "sleep" in fields:
+        hours = values[:, fields.index("sleep")].copy()
+        values[:, fields.index("sleep")] = np.select(
+            [np.isnan(hours), (hours >= 7) & (hours <= 9), hours >= 6],
+            [np.nan, 1.0, 0.5],
+            0.0,
+        )
+    present = ~np.isnan(values)
+    return 100 * _mean(np.where(present, values, 0).sum(axis=1), present.sum(axis=1))
+
+
+def compute_metrics(df: pd.DataFrame) -> WindowMetrics:
+    """Compute all metrics for a window of daily entries in one pass."""
+    start = end = None
+    if "timestamp" in df.columns and len(df) > 0:
+        start = df["timestamp"].min()
+        end = df["timestamp"].max()
+
+    return WindowMetrics(len(df), count_answers(df), start, end, mean_values(df))
+
+
+class GroupedMetrics:
+    """
+    Answer counts and value averages for many windows, as arrays.
+
+    The vectorized counterpart of :class:`WindowMetrics`: every accessor
+    returns one value per window, so scores for thousands of windows (or
+    users) are plain array operations.
+    """
+
+    def __init__(self, df: pd.DataFrame, group_codes: np.ndarray, n_groups: int):
+        """
+        Count all windows in one pass.
+
+        Answer counts come from a single ``np.bincount`` over (window, shared
+        answer code) pairs and value averages from one scatter-add, instead
+        of slicing and re-counting the data once per window.
+
+        Args:
+            df: Daily entries
+            group_codes: Window index (0..n_groups-1) of each row
+            n_groups: Number of windows
+        """
+        self.n_groups = n_groups
+        self.total_days = np.bincount(group_codes, minlength=n_groups)
+
+        # Answer counts: offset each window into its own block of the code space
+        self.fields = answer_fields(df)
+        self._encoded, self._offsets, shifted = _shared_codes(df, self.fields)
+        width = _code_space(self._encoded) + 1
+        if shifted is None:
+            self._counts = np.zeros((n_groups, width), dtype=np.int64)
+        else:
+            flat = shifted + (group_codes * width)[:, None]
+            counts = np.bincount(flat.ravel(), minlength=n_groups * width)
+            self._counts = counts.reshape(n_groups, width)
+        self._columns = {
+            field: (offset, {answer: j for j, answer in enumerate(answers)})
+            for field, (_, answers), offset in zip(
+                self.fields, self._encoded, self._offsets
+            )
+        }
+
+        # Value averages: per-window sums and non-missing counts
+        self.valued, values = value_matrix(df)
+        present = ~np.isnan(values)
+        sums = np.zeros((n_groups, len(self.valued)))
+        seen = np.zeros((n_groups, len(self.valued)))
+        np.add.at(sums, group_codes, np.where(present, values, 0))
+        np.add.at(seen, group_codes, present)
+        self._means = _mean(sums, seen)
+
+        # Window bounds
+        self.start = self.end = [None] * n_groups
+        if "timestamp" in df.columns:
+            bounds = (
+                df["timestamp"]
+                .groupby(group_codes, sort=True)
+                .agg(["min", "max"])
+                .reindex(range(n_groups))
+            )
+            self.start = bounds["min"].tolist()
+            self.end = bounds["max"].tolist()
+
+    def has(self, field: str) -> np.ndarray:
+        """Whether each window answered the field at least once."""
+        if field not in self._columns:
+            return np.zeros(self.n_groups, dtype=bool)
+        offset, answers = self._columns[field]
+        return self._counts[:, offset : offset + len(answers)].sum(axis=1) > 0
+
+    def count(self, field: str, answer: Any) -> np.ndarray:
+        """Days per window on which the field had the given answer."""
+        offset, answers = self._columns.get(field, (0, {}))
+        if answer not in answers:
+            return np.zeros(self.n_groups, dtype=np.int64)
+        return self._counts[:, offset + answers[answer]]
+
+    def rate(self, field: str, answer: Any) -> np.ndarray:
+        """Share of days (0-1) per window with the given answer."""
+        return self.count(field, answer) / np.maximum(self.total_days, 1)
+
+    def mean(self, field: str) -> np.ndarray:
+        """Average answer value per window (NaN when nothing to average)."""
+        if field not in self.valued:
+            return np.full(self.n_groups, np.nan)
+        return self._means[:, self.valued.index(field)]
+
+    def window(self, i: int) -> WindowMetrics:
+        """Return the metrics of window ``i`` as a :class:`WindowMetrics`."""
+        return WindowMetrics(
+            int(self.total_days[i]),
+            _unpack_counts(self.fields, self._encoded, self._offsets, self._counts[i]),
+            self.start[i],
+            self.end[i],
+            dict(zip(self.valued, self._means[i].tolist())),
+        )
+
+
+def compute_grouped_metrics(
+    df: pd.DataFrame, keys: Any
+) -> Dict[Any, WindowMetrics]:
+    """
+    Compute metrics for many windows of the same data in one pass.
+
+    Rows are assigned to windows by ``keys`` (one label per row, e.g. an
+    ISO week); rows with a missing key are ignored. See
+    :class:`GroupedMetrics` for how the windows are counted.
+
+    Args:
+        df: Daily entries
+        keys: Window label of each row (array-like, same length as ``df``)
+
+    Returns:
+        Dictionary mapping window label -> WindowMetrics, in label order
+    """
+    group_codes, groups = pd.factorize(np.asarray(keys), sort=True)
+    keep = group_codes >= 0
+    if not keep.all():
+        df, group_codes = df[keep], group_codes[keep]
+
+    grouped = GroupedMetrics(df, group_codes, len(groups))
+    return {group: grouped.window(i) for i, group in enumerate(groups)}
@@ -0,0 +1,268 @@
+"""Reports over any period: week, month, quarter, year or a custom range."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+
+# Add src to path if needed
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analyzer import PersonalizationAnalyzer
+from config import REPORT_PERIODS
+from report import Report, period_words, render, write_report
+from sheets_client import SheetsClient, slice_time_range
+from whatsapp_client import WhatsAppClient
+import config
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from window import WindowMetrics
+
+# Name of a report over an explicit start/end
+CUSTOM = "custom"
+
+# Longest WhatsApp message sent in one piece, and the size of each part of
+# a longer one (leaving room for the part header)
+MESSAGE_LIMIT = 1600
+PART_SIZE = 1500
+
+
+def period_range(
+    period: str = "week",
+    end: Optional[datetime] = None,
+    start: Optional[datetime] = None,
+) -> Tuple[datetime, datetime]:
+    """
+    Start and end of the period that ends at ``end``.
+
+    Args:
+        period: Period name (see ``REPORT_PERIODS``), or ``CUSTOM``
+        end: Last moment of the period (default: now)
+        start: First moment of the period (required for ``CUSTOM``;
+            default: ``end`` minus the period's length)
+
+    Returns:
+        Tuple of (start, end)
+    """
+    end = end or datetime.now()
+    if period == CUSTOM:
+        if start is None:
+            raise ValueError("A custom period needs a start")
+        return start, end
+    if period not in REPORT_PERIODS:
+        raise ValueError(
+            f"Unknown period {period!r}, expected one of {list(REPORT_PERIODS)} "
+            f"or {CUSTOM!r}"
+        )
+    return start or end - timedelta(days=REPORT_PERIODS[period]["days"]), end
+
+
+def period_report(
+    history: pd.DataFrame,
+    period: str = "week",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    metrics: Optional[WindowMetrics] = None,
+) -> Report:
+    """
+    Analyze one period of the history.
+
+    Every period goes through the same analysis; only the thresholds and
+    wording change (see :func:`analyzer.period_thresholds`). The window is
+    a binary-search slice of the history, its metrics one aggregation
+    (or the running totals passed as ``metrics``), so a quarter or a year
+    cost about the same as a week.
+
+    Args:
+        history: Full tracking history sorted by timestamp; habit streaks
+            can reach back before the period
+        period: Period name (see ``REPORT_PERIODS``), or ``CUSTOM``
+        start: First moment of the period (default: from ``period``)
+        end: Last moment of the period (default: now)
+        metrics: Metrics of the window if already aggregated (e.g.
+            :meth:`SheetsClient.get_window_metrics`)
+
+    Returns:
+        The period's read-only Report
+    """
+    from habits import habit_streaks
+    from metrics import compute_metrics
+
+    start, end = period_range(period, end, start)
+    days = (end.date() - start.date()).days + 1 if period == CUSTOM else None
+
+    window = slice_time_range(history, start=start, end=end)
+    if metrics is None:
+        metrics = compute_metrics(window)
+    streaks = None
+    if metrics.total_days:
+        streaks = habit_streaks(history, metrics.start, metrics.end)
+
+    analyzer = PersonalizationAnalyzer(
+        window, metrics=metrics, streaks=streaks, period=period, days=days
+    )
+    return analyzer.report()
+
+
+def send_to_whatsapp(report: str, period: str = "week") -> bool:
+    """
+    Send a report to WhatsApp, in parts if it is too long for one message.
+
+    Args:
+        report: Rendered report text
+        period: Period of the report (picks the message header)
+
+    Returns:
+        True if every message was sent
+    """
+    print("\n📱 Sending report to WhatsApp...")
+
+    whatsapp_client = WhatsAppClient()
+    label = period_words(period)["label"]
+
+    if len(report) <= MESSAGE_LIMIT:
+        if period == "week":
+            return whatsapp_client.send_weekly_report(report)
+        if period == "month":
+            return whatsapp_client.send_monthly_report(report)
+        return whatsapp_client.send_message(f"🎯 Your {label} Insights\n\n{report}")
+
+    print("⚠️ Report is long, sending in parts...")
+
+    # Split on line breaks
+    parts = []
+    current_part = []
+    current_length = 0
+    for line in report.split("\n"):
+        if current_length + len(line) + 1 > PART_SIZE:
+            parts.append("\n".join(current_part))
+            current_part = [line]
+            current_length = len(line)
+        else:
+            current_part.append(line)
+            current_length += len(line) + 1
+    if current_part:
+        parts.append("\n".join(current_part))
+
+    for i, part in enumerate(parts, 1):
+        print(f"Sending part {i}/{len(parts)}...")
+        message = f"📊 {label} Report (Part {i}/{len(parts)})\n\n{part}"
+        if not whatsapp_client.send_message(message):
+            return False
+    return True
+
+
+def main(
+    period: str = "week",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    dry_run: bool = False,
+    outputs: Optional[Iterable[str]] = None,
+):
+    """
+    Generate (and send) the report of a period.
+
+    Args:
+        period: Period name (see ``REPORT_PERIODS``)
+        start: First day of a custom range (overrides ``period``)
+        end: Last day of the period (default: now)
+        dry_run: If True, only print the report without sending
+        outputs: Files to also write the report to (.txt, .json, .html)
+    """
+    if start is not None:
+        period = CUSTOM
+    label = period_words(period)["label"]
+    print("=" * 70)
+    print(f"🎯 Alpha-X - {label} Report")
+    print("=" * 70)
+    print(f"📅 Run Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 70)
+    print()
+
+    try:
+        print("🔍 Validating configuration...")
+        config.validate_config()
+        print("✅ Configuration valid\n")
+
+        print("📊 Fetching data from Google Sheets...")
+        sheets_client = SheetsClient()
+        sheets_client.connect()
+
+        fields = PersonalizationAnalyzer.REQUIRED_FIELDS
+        start, end = period_range(period, end, start)
+        history = sheets_client.get_all_data(fields=fields)
+        metrics = sheets_client.get_window_metrics(start, end, fields=fields)
+        print(f"📅 Period: {start.date()} to {end.date()}")
+        print(f"✅ Found {metrics.total_days} entries for analysis")
+
+        report = period_report(history, period, start, end, metrics=metrics)
+        text = render(report, "summary")
+
+        print("\n" + "=" * 70)
+        print(text)
+        print("=" * 70)
+
+        for path in outputs or []:
+            print(f"💾 Report saved to {write_report(report, path)}")
+
+        if dry_run:
+            print("\n⚠️ Dry run mode - Report not sent")
+            return
+        if report.days == 0:
+            return
+
+        if send_to_whatsapp(text, report.period):
+            print("✅ Report sent successfully!")
+        else:
+            print("❌ Failed to send report")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate the report of a week, month, quarter, year or date range"
+    )
+    parser.add_argument(
+        "--period",
+        choices=list(REPORT_PERIODS),
+        default="week",
+        help="Length of the period, ending today (or at --end)",
+    )
+    parser.add_argument(
+        "--start",
+        type=datetime.fromisoformat,
+        help="First day of a custom range (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--end",
+        type=datetime.fromisoformat,
+        help="Last day of the period (YYYY-MM-DD, default: now)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Generate report without sending to WhatsApp",
+    )
+    parser.add_argument(
+        "--output",
+        action="append",
+        dest="outputs",
+        help="Also write the report to a .txt, .json or .html file (repeatable)",
+    )
+
+    args = parser.parse_args()
+
+    # Include the whole last day
+    end = args.end + timedelta(days=1, microseconds=-1) if args.end else None
+
+    main(args.period, args.start, end, args.dry_run, args.outputs)
@@ -0,0 +1,166 @@
+"""Request budgeting for the Google Sheets API."""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+# HTTP statuses worth retrying: quota exhaustion and transient server errors
+THROTTLED_STATUSES = {429}
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """Return the HTTP status behind an API error, if there is one."""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Return the server's Retry-After hint in seconds, if it sent one."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RequestBudget:
+    """
+    Token bucket shared by every Sheets API call, with adaptive backoff.
+
+    Calls are admitted at up to ``requests_per_minute``. When Google answers
+    429, the admitted rate is halved and the call is retried after an
+    exponential delay with full jitter. Each success raises the rate again
+    by a small step until the configured maximum, so the budget settles at
+    the highest rate the quota actually allows.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 60,
+        burst: int = 10,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 64.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the budget.
+
+        Args:
+            requests_per_minute: Maximum sustained request rate
+            burst: Requests that may be sent back-to-back after idling
+            max_retries: Retries per call before the error is raised
+            base_delay: First backoff delay in seconds
+            max_delay: Upper bound for a single backoff delay
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.max_rate = requests_per_minute / 60.0
+        self.min_rate = self.max_rate / 16
+        self.rate = self.max_rate
+        self.burst = max(1, burst)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._counters = {
+            "requests": 0,
+            "throttled": 0,
+            "retried": 0,
+            "failed": 0,
+            "waited_seconds": 0.0,
+        }
+
+    def acquire(self):
+        """Block until the bucket admits one request."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._counters["requests"] += 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+                self._counters["waited_seconds"] += wait
+            self._sleep(wait)
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run one API call within the budget, retrying throttled attempts.
+
+        Raises:
+            The last error once ``max_retries`` retries are used up, or
+            immediately for errors that are not worth retrying
+        """
+        import requests
+
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                result = func(*args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error, status = e, None
+            except Exception as e:
+                status = _status_code(e)
+                if status not in RETRYABLE_STATUSES:
+                    raise
+                error = e
+            else:
+                self._on_success()
+                return result
+
+            if attempt >= self.max_retries:
+                with self._lock:
+                    self._counters["failed"] += 1
+                raise error
+
+            delay = self._on_failure(error, status, attempt)
+            attempt += 1
+            self._sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters of sent, throttled and retried requests."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["requests_per_minute"] = round(self.rate * 60, 1)
+        return stats
+
+    def _on_success(self):
+        """Creep the admitted rate back up after a successful call."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+    def _on_failure(
+        self, error: Exception, status: Optional[int], attempt: int
+    ) -> float:
+        """Record a failed attempt and return how long to back off."""
+        with self._lock:
+            self._counters["retried"] += 1
+            if status in THROTTLED_STATUSES:
+                self._counters["throttled"] += 1
+                self.rate = max(self.min_rate, self.rate / 2)
+
+            delay = random.uniform(
+                0, min(self.max_delay, self.base_delay * 2**attempt)
+            )
+            hint = _retry_after(error)
+            if hint is not None:
+                delay = max(delay, min(hint, self.max_delay))
+            self._counters["waited_seconds"] += delay
+
+        print(f"⚠️ Sheets API error ({status or error}), retrying in {delay:.1f}s")
+        return delay
@@ -0,0 +1,334 @@
+"""Immutable analysis results and the renderers that present them."""
+
+import html
+import json
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+from config import REPORT_PERIODS
+
+# Goal areas, in priority order
+GOAL_SECTIONS = ("career", "health", "marriage")
+
+# Renderer name -> function turning a Report into a string
+RENDERERS: Dict[str, Callable[["Report"], str]] = {}
+
+# File suffix -> renderer, for write_report
+FORMAT_SUFFIXES = {".txt": "text", ".json": "json", ".html": "html"}
+
+# Wording of a custom date range
+CUSTOM_PERIOD = {"label": "Period", "noun": "period"}
+
+
+def period_words(period: str) -> Dict[str, str]:
+    """How reports name a period: ``label`` ("Weekly") and ``noun`` ("week")."""
+    return REPORT_PERIODS.get(period, CUSTOM_PERIOD)
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of nested dicts (mapping proxies) and lists (tuples)."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Plain dicts and lists from a frozen value."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class Report:
+    """
+    Everything one analysis found, computed once and read-only.
+
+    Holds the section results of ``PersonalizationAnalyzer`` (title,
+    metrics, insights and, for goal areas, score and ``has_data``), the
+    overall score and its verdict, and the focus areas. Renderers only
+    read it, so one analysis can be rendered to several formats, and
+    ``to_dict`` / ``from_dict`` let it be cached apart from any
+    presentation.
+    """
+
+    __slots__ = (
+        "period",
+        "start",
+        "end",
+        "days",
+        "sections",
+        "score",
+        "focus_areas",
+        "verdict",
+    )
+
+    def __init__(
+        self,
+        period: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        days: int,
+        sections: Mapping[str, Mapping[str, Any]],
+        score: Optional[float] = None,
+        focus_areas: Sequence[str] = (),
+        verdict: Optional[str] = None,
+    ):
+        """
+        Initialize a report.
+
+        Args:
+            period: Period the report covers (see ``REPORT_PERIODS``; any
+                other name is a custom range)
+            start: First entry of the window
+            end: Last entry of the window
+            days: Number of entries in the window
+            sections: Section key -> section result, in report order
+            score: Average score (0-100) of the tracked goal areas, or None
+            focus_areas: Areas to focus on next
+            verdict: One-line verdict on the score
+        """
+        values = {
+            "period": period,
+            "start": start,
+            "end": end,
+            "days": days,
+            "sections": sections,
+            "score": score,
+            "focus_areas": focus_areas,
+            "verdict": verdict,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, _freeze(value))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"Report is read-only (cannot set {name!r})")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"Report is read-only (cannot delete {name!r})")
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Report) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return (
+            f"Report({self.period!r}, {self.start!r}, {self.end!r}, "
+            f"days={self.days})"
+        )
+
+    @property
+    def goals(self) -> Tuple[Mapping[str, Any], ...]:
+        """Goal area sections (career, health, marriage) of the report."""
+        return tuple(
+            self.sections[key] for key in GOAL_SECTIONS if key in self.sections
+        )
+
+    @property
+    def extras(self) -> Tuple[Tuple[str, Mapping[str, Any]], ...]:
+        """(key, section) of the other sections with something to say."""
+        return tuple(
+            (key, section)
+            for key, section in self.sections.items()
+            if key not in GOAL_SECTIONS and key != "overall" and section["insights"]
+        )
+
+    @property
+    def shown_goals(self) -> Tuple[Mapping[str, Any], ...]:
+        """Goal areas worth showing: tracked, or with a note about them."""
+        return tuple(g for g in self.goals if g.get("has_data", False) or g["insights"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly copy of the report (timestamps as ISO strings)."""
+        return {
+            "period": self.period,
+            "start": self.start.isoformat() if self.start is not None else None,
+            "end": self.end.isoformat() if self.end is not None else None,
+            "days": self.days,
+            "sections": _thaw(self.sections),
+            "score": self.score,
+            "focus_areas": _thaw(self.focus_areas),
+            "verdict": self.verdict,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Report":
+        """Rebuild a report from :meth:`to_dict` output."""
+
+        def when(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value is not None else None
+
+        return cls(
+            data["period"],
+            when(data["start"]),
+            when(data["end"]),
+            data["days"],
+            data["sections"],
+            data.get("score"),
+            data.get("focus_areas", ()),
+            data.get("verdict"),
+        )
+
+
+def renderer(name: str) -> Callable:
+    """Register a function ``(Report) -> str`` as the renderer ``name``."""
+
+    def register(function: Callable[[Report], str]) -> Callable[[Report], str]:
+        RENDERERS[name] = function
+        return function
+
+    return register
+
+
+def render(report: Report, fmt: str = "text") -> str:
+    """
+    Render a report with a registered renderer.
+
+    Args:
+        report: Report to render
+        fmt: Renderer name (see ``RENDERERS``)
+
+    Returns:
+        The rendered report
+    """
+    if fmt not in RENDERERS:
+        raise ValueError(
+            f"Unknown report format {fmt!r}, expected one of {sorted(RENDERERS)}"
+        )
+    return RENDERERS[fmt](report)
+
+
+def write_report(report: Report, path: Path) -> Path:
+    """
+    Render a report to a file, picking the format from its suffix.
+
+    Args:
+        report: Report to write
+        path: Output file (``.txt``, ``.json`` or ``.html``)
+
+    Returns:
+        The path written
+    """
+    path = Path(path)
+    if path.suffix not in FORMAT_SUFFIXES:
+        raise ValueError(
+            f"Unknown report file type {path.suffix!r}, expected one of "
+            f"{sorted(FORMAT_SUFFIXES)}"
+        )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render(report, FORMAT_SUFFIXES[path.suffix]), encoding="utf-8")
+    return path
+
+
+def _heading(report: Report) -> str:
+    """Report title with its date range (when the entries have timestamps)."""
+    heading = f"📊 {period_words(report.period)['label']} Report"
+    if report.start is None or report.end is None:
+        return heading
+    return (
+        f"{heading} ({report.start.strftime('%b %d')}-"
+        f"{report.end.strftime('%b %d, %Y')})"
+    )
+
+
+def _no_data(report: Report) -> str:
+    return f"❌ No data available for this {period_words(report.period)['noun']}"
+
+
+@renderer("text")
+def render_text(report: Report) -> str:
+    """Plain text report, as sent to WhatsApp."""
+    if report.days == 0:
+        return _no_data(report)
+
+    lines = [_heading(report), ""]
+
+    # Goal areas - only those with data (or a note about them)
+    for section in report.shown_goals:
+        lines.append(section["title"])
+        lines.extend(section["insights"])
+        lines.append("")
+
+    overall = report.sections["overall"]
+    lines.append(overall["title"])
+    lines.extend(overall["insights"])
+    lines.append("")
+
+    # Streaks, trends, ... only when there is something worth mentioning
+    for _, section in report.extras:
+        lines.append(section["title"])
+        lines.extend(section["insights"])
+        lines.append("")
+
+    if report.verdict:
+        lines.append(report.verdict)
+
+    if report.shown_goals:
+        lines.append("")
+        lines.append(f"📋 Currently tracking: {len(report.shown_goals)} goal(s)")
+
+    return "\n".join(lines)
+
+
+@renderer("summary")
+def render_summary(report: Report) -> str:
+    """Text report followed by the focus areas for the next period."""
+    text = render_text(report)
+    if report.days and report.focus_areas:
+        noun = period_words(report.period)["noun"].capitalize()
+        text += f"\n\n🎯 Focus Areas for Next {noun}:"
+        for i, area in enumerate(report.focus_areas, 1):
+            text += f"\n   {i}. {area}"
+    return text
+
+
+@renderer("json")
+def render_json(report: Report) -> str:
+    """The report's data as JSON, e.g. for a dashboard or a cache."""
+    return json.dumps(report.to_dict(), ensure_ascii=False, indent=2)
+
+
+@renderer("html")
+def render_html(report: Report) -> str:
+    """Self-contained HTML fragment, e.g. for an email."""
+    escape = html.escape
+
+    if report.days == 0:
+        return f'<article class="report"><p>{escape(_no_data(report))}</p></article>'
+
+    def section_html(section: Mapping[str, Any], key: str) -> str:
+        items = "".join(f"<li>{escape(i)}</li>" for i in section["insights"])
+        score = ""
+        if section.get("has_data", False):
+            score = f' <span class="score">{section["score"]}/100</span>'
+        return (
+            f'<section class="{key}"><h2>{escape(section["title"])}{score}</h2>'
+            f"<ul>{items}</ul></section>"
+        )
+
+    parts = [
+        '<article class="report">',
+        f"<h1>{escape(_heading(report))}</h1>",
+    ]
+    shown = [
+        (key, report.sections[key])
+        for key in GOAL_SECTIONS
+        if key in report.sections and report.sections[key] in report.shown_goals
+    ]
+    shown.append(("overall", report.sections["overall"]))
+    for key, section in shown + list(report.extras):
+        parts.append(section_html(section, key))
+
+    if report.verdict:
+        parts.append(f'<p class="verdict">{escape(report.verdict)}</p>')
+    if report.focus_areas:
+        items = "".join(f"<li>{escape(a)}</li>" for a in report.focus_areas)
+        parts.append(
+            '<section class="focus"><h2>🎯 Focus Areas</h2>'
+            f"<ol>{items}</ol></section>"
+        )
+    parts.append("</article>")
+    return "\n".join(parts)
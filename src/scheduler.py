@@ -3,16 +3,25 @@
 import schedule
 import time
 from datetime import datetime
-from summarize_last_week import main as summarize_main
 
 
 def send_weekly_summary():
     """Job function to send weekly summary of last 7 days."""
     print(f"\n⏰ Scheduled job triggered at {datetime.now()}")
     print("📊 Generating summary of last 7 days...")
+    from summarize_last_week import main as summarize_main
+
     summarize_main()
 
 
+def check_daily_scores():
+    """Job function to flag unusual drops in the newest entries."""
+    print(f"\n⏰ Daily score check triggered at {datetime.now()}")
+    from anomalies import main as anomalies_main
+
+    anomalies_main(notify=True)
+
+
 def run_scheduler():
     """Run the scheduler for automated weekly summaries."""
     print("=" * 70)
@@ -21,6 +30,7 @@ def run_scheduler():
     print()
     print("📅 Schedule: Every Sunday at 1:00 PM")
     print("📊 Action: Summarize last 7 days and send to WhatsApp")
+    print("🚨 Hourly: Check new entries for unusual score drops")
     print("⏰ Current time:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     print()
     print("💡 Tip: Run this in the background or as a system service")
@@ -31,6 +41,9 @@ def run_scheduler():
     # Schedule: Every Sunday at 1:00 PM (13:00)
     schedule.every().sunday.at("13:00").do(send_weekly_summary)
 
+    # Every hour: fold new entries into the daily score detector
+    schedule.every().hour.do(check_daily_scores)
+
     # For testing: uncomment to run every minute
     # schedule.every(1).minutes.do(send_weekly_summary)
 
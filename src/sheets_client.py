@@ -1,97 +1,976 @@
 """Google Sheets client for fetching form responses."""
 
-import gspread
-from google.oauth2.service_account import Credentials
-import pandas as pd
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from config import GOOGLE_SHEET_ID, GOOGLE_CREDENTIALS_PATH, COLUMN_MAPPING
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    List,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    Tuple,
+    FrozenSet,
+    Union,
+)
+from config import (
+    GOOGLE_SHEET_ID,
+    GOOGLE_CREDENTIALS_PATH,
+    COLUMN_MAPPING,
+    SNAPSHOT_DIR,
+    AGGREGATES_DIR,
+    SHEETS_CACHE_TTL,
+    ANSWER_CHOICES,
+    TIMESTAMP_FORMATS,
+    FETCH_CHUNK_ROWS,
+    TOKEN_CACHE_DIR,
+    SHEETS_MAX_WORKERS,
+    SHEETS_READS_PER_MINUTE,
+    SHEETS_MAX_RETRIES,
+)
+from entries import (
+    DailyEntry,
+    detect_timestamp_format,
+    entries_from_rows,
+    locate_window,
+    select_window,
+)
+from quota import RequestBudget
+from window import WindowMetrics
+
+# gspread, google-auth and pandas are imported by the functions that need
+# them, so short jobs (and --help) do not pay for them at startup
+if TYPE_CHECKING:
+    import gspread
+    import pandas as pd
+    from google.oauth2.service_account import Credentials
+    from aggregates import RunningAggregates
+    from snapshot import SheetSnapshot
+
+
+SCOPES = [
+    "https://spreadsheets.google.com/feeds",
+    "https://www.googleapis.com/auth/drive",
+]
+
+# Process-wide pool of authorized clients and opened worksheets, so every
+# SheetsClient (and every scheduled job) shares one HTTP session and token
+_POOL_LOCK = threading.Lock()
+_AUTHORIZED_CLIENTS: Dict[str, gspread.Client] = {}
+_WORKSHEETS: Dict[Tuple[str, str], Any] = {}
+
+# Process-wide request budget shared by every Sheets API call
+REQUEST_BUDGET = RequestBudget(
+    requests_per_minute=SHEETS_READS_PER_MINUTE, max_retries=SHEETS_MAX_RETRIES
+)
+
+
+def get_request_stats() -> Dict[str, Any]:
+    """Return counters of Sheets API requests, throttles and retries."""
+    return REQUEST_BUDGET.stats()
+
+
+def _token_cache_path(credentials_path: Path) -> Optional[Path]:
+    """Return where the access token for these credentials is cached."""
+    if not TOKEN_CACHE_DIR:
+        return None
+    key = hashlib.sha1(str(Path(credentials_path).resolve()).encode()).hexdigest()
+    return Path(TOKEN_CACHE_DIR) / f"{key}.json"
+
+
+def _load_cached_token(creds: Credentials, credentials_path: Path):
+    """Reuse an access token from a previous run if it is not near expiry."""
+    path = _token_cache_path(credentials_path)
+    if path is None or not path.exists():
+        return
+
+    try:
+        cached = json.loads(path.read_text())
+        creds.token = cached["token"]
+        creds.expiry = datetime.fromisoformat(cached["expiry"])
+    except (OSError, ValueError, KeyError):
+        return
+
+    if creds.expired:
+        creds.token = None
+        creds.expiry = None
+
+
+def _store_token(creds: Credentials, credentials_path: Path):
+    """Persist the current access token (owner-readable only) for later runs."""
+    path = _token_cache_path(credentials_path)
+    if path is None or not creds.token or not creds.expiry:
+        return
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"token": creds.token, "expiry": creds.expiry.isoformat()}, f)
+    except OSError as e:
+        print(f"⚠️ Could not cache access token: {e}")
+
+
+def get_authorized_client(credentials_path: Path) -> gspread.Client:
+    """
+    Return the process-wide authorized gspread client for a credentials file.
+
+    The service-account file is read and authorized once per process. The
+    client's session keeps HTTP connections alive between requests, and
+    google-auth only refreshes the access token when it is about to expire.
+    Tokens are also cached on disk so short-lived runs can skip the token
+    exchange entirely.
+    """
+    import gspread
+    from google.oauth2.service_account import Credentials
+    from requests.adapters import HTTPAdapter
+
+    key = str(credentials_path)
+    with _POOL_LOCK:
+        client = _AUTHORIZED_CLIENTS.get(key)
+        if client is None:
+            creds = Credentials.from_service_account_file(
+                credentials_path, scopes=SCOPES
+            )
+            _load_cached_token(creds, credentials_path)
+            client = gspread.authorize(creds)
+            # Keep enough connections alive for concurrent batch fetches
+            client.session.mount(
+                "https://", HTTPAdapter(pool_maxsize=max(SHEETS_MAX_WORKERS, 10))
+            )
+            _AUTHORIZED_CLIENTS[key] = client
+        return client
+
+
+def _open_worksheet(client: gspread.Client, credentials_path: Path, sheet_id: str):
+    """Open (or reuse) the first worksheet of a spreadsheet."""
+    key = (str(credentials_path), sheet_id)
+    with _POOL_LOCK:
+        worksheet = _WORKSHEETS.get(key)
+    if worksheet is None:
+        spreadsheet = REQUEST_BUDGET.call(client.open_by_key, sheet_id)
+        # Get the first worksheet (you can change this to specific sheet name)
+        worksheet = REQUEST_BUDGET.call(spreadsheet.get_worksheet, 0)
+        with _POOL_LOCK:
+            worksheet = _WORKSHEETS.setdefault(key, worksheet)
+
+    _store_token(client.auth, credentials_path)
+    return worksheet
+
+
+def clear_session_pool():
+    """Drop pooled clients and worksheets (e.g. after rotating credentials)."""
+    with _POOL_LOCK:
+        for client in _AUTHORIZED_CLIENTS.values():
+            client.session.close()
+        _AUTHORIZED_CLIENTS.clear()
+        _WORKSHEETS.clear()
+
+
+def _hash_header(header: List[str]) -> str:
+    """Return a stable fingerprint of the sheet's header row."""
+    return hashlib.sha1("\x1f".join(header).encode("utf-8")).hexdigest()
+
+
+def _hash_column(values: List[Any]) -> str:
+    """Return a stable fingerprint of a column of raw cells."""
+    return _hash_header([str(value) for value in values])
+
+
+def _column_letter(col: int) -> str:
+    """Convert a 1-based column index to its A1 letter (1 -> A, 27 -> AA)."""
+    from gspread.utils import rowcol_to_a1
+
+    return rowcol_to_a1(1, col).rstrip("0123456789")
+
+
+def _column_spans(indices: List[int]) -> List[Tuple[int, int]]:
+    """Group sorted 0-based column indices into contiguous (first, last) spans."""
+    spans = []
+    for index in indices:
+        if spans and spans[-1][1] == index - 1:
+            spans[-1] = (spans[-1][0], index)
+        else:
+            spans.append((index, index))
+    return spans
+
+
+class TimestampParser:
+    """
+    Parse form timestamps with a format detected once per sheet.
+
+    The first batch of timestamps is used to pick an explicit format from
+    ``TIMESTAMP_FORMATS``; every later batch is parsed with that format
+    instead of pandas' per-call inference. Parsed strings are remembered so
+    a refetch of the same rows costs a dictionary lookup per row.
+    """
+
+    SAMPLE_SIZE = 50
+    MAX_SEEN = 100_000
+
+    def __init__(self, formats: Optional[List[str]] = None):
+        """Initialize the parser with candidate formats."""
+        self.formats = TIMESTAMP_FORMATS if formats is None else formats
+        self.format: Optional[str] = None
+        self._detected = False
+        self._seen: Dict[Any, pd.Timestamp] = {}
+
+    def detect_format(self, samples: List[str]) -> Optional[str]:
+        """Return the candidate format that parses the most samples."""
+        return detect_timestamp_format(samples, self.formats)
+
+    def parse(self, values: pd.Series) -> pd.Series:
+        """Parse a column of timestamp strings into datetime64 values."""
+        import pandas as pd
+
+        codes, uniques = pd.factorize(values)
+        new = [value for value in uniques if value not in self._seen]
+
+        if new:
+            if not self._detected:
+                samples = [str(v) for v in new[: self.SAMPLE_SIZE] if v != ""]
+                if samples:
+                    self.format = self.detect_format(samples)
+                    self._detected = True
+
+            self._seen.update(zip(new, self._parse_new(new)))
+
+        parsed = pd.DatetimeIndex([self._seen[value] for value in uniques])
+        if len(self._seen) > self.MAX_SEEN:
+            # Evict after the lookup, keeping only this batch (if it fits),
+            # which a refetch is likely to read again
+            fits = len(uniques) <= self.MAX_SEEN
+            self._seen = dict(zip(uniques, parsed)) if fits else {}
+        return pd.Series(
+            parsed.take(codes, allow_fill=True, fill_value=pd.NaT),
+            index=values.index,
+            name=values.name,
+        )
+
+    def _parse_new(self, values: List[Any]) -> pd.DatetimeIndex:
+        """Parse values not seen before, falling back to inference on misses."""
+        import pandas as pd
+
+        raw = pd.Series(values, dtype=object)
+        if self.format is None:
+            return pd.DatetimeIndex(pd.to_datetime(raw, errors="coerce"))
+
+        parsed = pd.to_datetime(raw, format=self.format, errors="coerce")
+        misses = parsed.isna() & (raw != "")
+        if misses.any():
+            parsed[misses] = [
+                pd.to_datetime(value, errors="coerce") for value in raw[misses]
+            ]
+        return pd.DatetimeIndex(parsed)
+
+
+def encode_answers(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store each form answer column as a categorical over a fixed vocabulary.
+
+    Known answers come from ``ANSWER_CHOICES`` so that codes are stable
+    across fetches; unexpected answers are appended after them rather than
+    dropped. Blank answers become missing values.
+    """
+    import pandas as pd
+
+    for field in COLUMN_MAPPING.values():
+        if field == "timestamp" or field not in df.columns:
+            continue
+        if isinstance(df[field].dtype, pd.CategoricalDtype):
+            continue
+
+        known = ANSWER_CHOICES.get(field, [])
+        known_set = set(known)
+        unknown = [
+            value
+            for value in pd.unique(df[field])
+            if value not in known_set and value != "" and not pd.isna(value)
+        ]
+        categories = list(known) + sorted(unknown, key=str)
+        df[field] = pd.Categorical(df[field], categories=categories)
+
+    return df
+
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate typed frames without losing categorical dtypes.
+
+    Each categorical column is first given the union of the categories seen
+    across all frames (in order of first appearance), so the result stays
+    integer-coded instead of decaying to objects.
+    """
+    import pandas as pd
+
+    if len(frames) == 1:
+        return frames[0]
+
+    frames = [frame.copy(deep=False) for frame in frames]
+    columns = set().union(*(frame.columns for frame in frames))
+
+    for column in columns:
+        parts = [frame[column] for frame in frames if column in frame.columns]
+        if not all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            continue
+
+        union = list(parts[0].cat.categories)
+        known = set(union)
+        for part in parts[1:]:
+            for category in part.cat.categories:
+                if category not in known:
+                    union.append(category)
+                    known.add(category)
+
+        for frame in frames:
+            if column in frame.columns:
+                values = frame[column]
+                if len(values.cat.categories) != len(union):
+                    frame[column] = values.cat.set_categories(union)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def sort_by_timestamp(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return ``df`` ordered by timestamp, with unparseable timestamps last.
+
+    Already-sorted frames are returned unchanged, so this is cheap to call
+    after every append.
+    """
+    if "timestamp" not in df.columns or df["timestamp"].is_monotonic_increasing:
+        return df
+    return df.sort_values(
+        "timestamp", kind="stable", na_position="last", ignore_index=True
+    )
+
+
+def slice_time_range(
+    df: pd.DataFrame,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """
+    Select rows with ``start <= timestamp <= end`` from a sorted DataFrame.
+
+    The bounds are located by binary search on the timestamp column, so the
+    cost does not grow with the length of the history, and the result is a
+    positional slice of ``df`` rather than a copy. Treat it as read-only.
+
+    Args:
+        df: DataFrame sorted with :func:`sort_by_timestamp`
+        start: First timestamp to include (None = from the beginning)
+        end: Last timestamp to include (None = up to the latest row)
+
+    Returns:
+        DataFrame slice for the requested window
+    """
+    import pandas as pd
+
+    timestamps = df["timestamp"]
+    start = pd.Timestamp.min if start is None else pd.Timestamp(start)
+    end = pd.Timestamp.max if end is None else pd.Timestamp(end)
+
+    # NaT sorts after every real timestamp, so it never falls inside [lo, hi)
+    lo = timestamps.searchsorted(start, side="left")
+    hi = timestamps.searchsorted(end, side="right")
+    return df.iloc[lo:hi]
+
+
+def week_bounds(weeks_ago: int) -> Tuple[datetime, datetime]:
+    """Return (Monday, Sunday) of the week ``weeks_ago`` weeks back."""
+    today = datetime.now()
+    start_of_current_week = today - timedelta(days=today.weekday())  # Monday
+    start_of_target_week = start_of_current_week - timedelta(weeks=weeks_ago)
+    end_of_target_week = start_of_target_week + timedelta(days=6)  # Sunday
+    return start_of_target_week, end_of_target_week
 
 
 class SheetsClient:
     """Client for interacting with Google Sheets."""
 
-    def __init__(self):
-        """Initialize the Google Sheets client."""
-        self.sheet_id = GOOGLE_SHEET_ID
+    def __init__(
+        self,
+        sheet_id: Optional[str] = None,
+        incremental: bool = True,
+        snapshot_dir: Optional[Path] = SNAPSHOT_DIR,
+        cache_ttl: float = SHEETS_CACHE_TTL,
+        chunk_size: int = FETCH_CHUNK_ROWS,
+        aggregates_dir: Optional[Path] = AGGREGATES_DIR,
+    ):
+        """
+        Initialize the Google Sheets client.
+
+        Args:
+            sheet_id: Spreadsheet to read (default: GOOGLE_SHEET_ID)
+            incremental: If True, repeated fetches only download rows appended
+                since the last fetch and merge them into the history held by
+                this client. If False, every fetch downloads the whole sheet.
+            snapshot_dir: Directory for on-disk snapshots of the sheet history,
+                or None to keep the history in memory only
+            cache_ttl: Seconds a fetched DataFrame is reused without contacting
+                the sheet at all (0 disables the in-process cache)
+            chunk_size: Rows requested per call when reading the sheet
+            aggregates_dir: Directory for the running totals behind
+                :meth:`get_window_metrics`, or None to keep them in memory
+        """
+        self.sheet_id = sheet_id or GOOGLE_SHEET_ID
         self.credentials_path = GOOGLE_CREDENTIALS_PATH
         self.client = None
+        self.spreadsheet = None
         self.worksheet = None
+        self.incremental = incremental
+        self.snapshot_dir = snapshot_dir
+        self.cache_ttl = cache_ttl
+        self.chunk_size = chunk_size
+        self.aggregates_dir = aggregates_dir
+        self._aggregates: Optional[RunningAggregates] = None
+
+        # Incremental fetch state
+        self._history: Optional[pd.DataFrame] = None
+        self._header_hash: Optional[str] = None
+        self._last_row = 1  # Last sheet row ingested (row 1 is the header)
+        self._stamps_hash: Optional[str] = None  # Timestamp cells ingested
+        self._revision: Optional[str] = None
+        self._revision_supported = True
+        self._fetched_at: Optional[float] = None
+        self._fields: Optional[FrozenSet[str]] = None  # None = every column
+        # Header row and raw timestamp column, reused within cache_ttl
+        self._columns: Dict[str, Any] = {}
+        self._columns_at: Optional[float] = None
+        self._timestamp_parser = TimestampParser()
 
     def connect(self):
-        """Establish connection to Google Sheets."""
+        """
+        Establish connection to Google Sheets.
+
+        Authorization and the opened worksheet come from a process-wide pool,
+        so constructing many clients (or running many scheduled jobs) does not
+        repeat the auth handshake or the spreadsheet lookup.
+        """
         try:
-            # Define the scope
-            scope = [
-                "https://spreadsheets.google.com/feeds",
-                "https://www.googleapis.com/auth/drive",
-            ]
+            # Authenticate (pooled)
+            self.client = get_authorized_client(self.credentials_path)
 
-            # Authenticate
-            creds = Credentials.from_service_account_file(
-                self.credentials_path, scopes=scope
+            # Open the spreadsheet (pooled)
+            self.worksheet = _open_worksheet(
+                self.client, self.credentials_path, self.sheet_id
             )
-            self.client = gspread.authorize(creds)
-
-            # Open the spreadsheet
-            spreadsheet = self.client.open_by_key(self.sheet_id)
+            self.spreadsheet = self.worksheet.spreadsheet
 
-            # Get the first worksheet (you can change this to specific sheet name)
-            self.worksheet = spreadsheet.get_worksheet(0)
-
-            print(f"✅ Connected to Google Sheets: {spreadsheet.title}")
+            print(f"✅ Connected to Google Sheets: {self.spreadsheet.title}")
             return True
 
         except Exception as e:
             print(f"❌ Error connecting to Google Sheets: {e}")
             raise
 
-    def get_all_data(self) -> pd.DataFrame:
-        """Fetch all data from the sheet and return as DataFrame."""
+    def get_all_data(self, fields: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Fetch all data from the sheet and return as DataFrame.
+
+        Args:
+            fields: Logical field names (``COLUMN_MAPPING`` values) the caller
+                needs, or None for every column. Only the matching sheet
+                columns are downloaded; ``timestamp`` is always included.
+                The returned DataFrame may hold more columns than requested
+                if an earlier call asked for them.
+
+        In incremental mode only the rows below the last ingested row are
+        requested and appended to the history already held by the client.
+        Before that, the timestamp column (one narrow read) is checked
+        against the rows already ingested. The history is discarded and
+        refetched in full whenever the header row changes, since column
+        positions can no longer be trusted, and whenever rows were removed
+        or edited: the ingested timestamps no longer match, or the sheet
+        changed (new revision) without any row being appended.
+
+        The history is kept sorted by timestamp so that windows can be cut
+        out of it with :func:`slice_time_range`.
+
+        When snapshots are enabled the history survives across runs: a cold
+        start opens the on-disk snapshot and, if the spreadsheet revision is
+        unchanged, returns it without fetching or parsing any rows. A new
+        revision puts the snapshot through the same row check as a held
+        history, so a rebuilt history replaces it on disk.
+
+        Within ``cache_ttl`` seconds of the last fetch the held DataFrame is
+        returned without any request, so window queries made in one process
+        (e.g. a multi-week backfill) share a single fetch. Callers must treat
+        the returned DataFrame as read-only.
+        """
+        if fields is not None:
+            fields = frozenset(fields) | {"timestamp"}
+
+        if self._is_cache_fresh() and self._holds(fields):
+            return self._history
+
         if not self.worksheet:
             self.connect()
 
-        # Get all records as list of dictionaries
-        records = self.worksheet.get_all_records()
+        if self.incremental and self._history is None:
+            self._load_snapshot()
+
+        if self._history is not None and not self._holds(fields):
+            # Columns are missing from the history; refetch with the union
+            if fields is not None and self._fields is not None:
+                fields = fields | self._fields
+            else:
+                fields = None
+            self.reset_history()
+        elif self._history is not None:
+            fields = self._fields
 
-        if not records:
+        revision = self._get_revision()
+        if (
+            self.incremental
+            and self._history is not None
+            and revision is not None
+            and revision == self._revision
+        ):
+            self._fetched_at = time.monotonic()
+            return self._history
+
+        header, stamps = self._sheet_columns(refresh=True)
+        if not header:
             raise ValueError("No data found in the sheet")
 
-        # Convert to DataFrame
-        df = pd.DataFrame(records)
+        header_hash = _hash_header(header)
+        if (
+            not self.incremental
+            or self._history is None
+            or header_hash != self._header_hash
+        ):
+            self.reset_history()
+        elif stamps is None or not self._rows_unchanged(stamps, revision):
+            if stamps is not None:
+                print("🔄 Sheet rows were edited or removed, refetching history")
+            self.reset_history()
+        self._header_hash = header_hash
+        self._fields = fields
+
+        # Only fetch the rows (and columns) we have not seen yet, one
+        # bounded chunk at a time, up to the last row checked above
+        frames = [] if self._history is None else [self._history]
+        end_row = None if stamps is None else len(stamps) + 1
+        n_new = 0
+        for n_rows, chunk in self._iter_chunks(
+            header, fields, self._last_row + 1, end_row=end_row
+        ):
+            frames.append(chunk)
+            n_new += n_rows
+
+        if n_new:
+            self._history = sort_by_timestamp(concat_frames(frames))
+            self._last_row += n_new
+
+            print(f"📥 Fetched {n_new} new row(s) from the sheet")
+        if stamps is not None:
+            self._stamps_hash = _hash_column(stamps[: self._last_row - 1])
+
+        if self._history is None or self._history.empty:
+            raise ValueError("No data found in the sheet")
+
+        if n_new or revision != self._revision:
+            self._revision = revision
+            self._save_snapshot()
+
+        self._fetched_at = time.monotonic()
+        return self._history
+
+    def invalidate_cache(self):
+        """Make the next fetch check the sheet for new rows regardless of TTL."""
+        self._fetched_at = None
+        self._columns_at = None
+
+    def reset_history(self):
+        """Forget locally held rows so the next fetch downloads the full sheet."""
+        self._history = None
+        self._header_hash = None
+        self._last_row = 1
+        self._stamps_hash = None
+        self._revision = None
+        self._fetched_at = None
+        self._fields = None
+
+    def _rows_unchanged(self, stamps: List[Any], revision: Optional[str]) -> bool:
+        """
+        Check that the rows already ingested are still in the sheet as read.
+
+        Args:
+            stamps: Current timestamp column of the sheet (rows 2 onwards)
+            revision: Current spreadsheet revision, if known
+
+        Returns:
+            True if only new rows can have been added since the last fetch
+        """
+        held = self._last_row - 1
+        if len(stamps) < held or _hash_column(stamps[:held]) != self._stamps_hash:
+            return False
+        # Same rows, yet the sheet changed: an answer was edited in place
+        edited = revision is not None and revision != self._revision
+        return not (len(stamps) == held and edited)
+
+    def _holds(self, fields: Optional[FrozenSet[str]]) -> bool:
+        """Check whether the held history includes every requested field."""
+        if self._fields is None:
+            return True
+        return fields is not None and fields <= self._fields
+
+    def _is_cache_fresh(self) -> bool:
+        """Check whether the held history is within its TTL."""
+        return (
+            self._history is not None
+            and self._fetched_at is not None
+            and time.monotonic() - self._fetched_at < self.cache_ttl
+        )
+
+    def _get_snapshot(self) -> Optional[SheetSnapshot]:
+        """Return the snapshot store for this sheet, if snapshots are enabled."""
+        if not self.snapshot_dir or not self.sheet_id:
+            return None
+        from snapshot import SheetSnapshot
+
+        return SheetSnapshot(Path(self.snapshot_dir) / self.sheet_id)
+
+    def _load_snapshot(self):
+        """Seed the incremental history from the on-disk snapshot."""
+        snapshot = self._get_snapshot()
+        loaded = snapshot.load() if snapshot else None
+        if loaded is None:
+            return
+
+        df, info = loaded
+        if "stamps_hash" not in info:
+            # Written before rows were fingerprinted: its rows cannot be checked
+            print("⚠️ Ignoring local snapshot without a row fingerprint")
+            return
+
+        self._history = sort_by_timestamp(df)
+        self._header_hash = info["header_hash"]
+        self._last_row = info["last_row"]
+        self._stamps_hash = info.get("stamps_hash")
+        self._revision = info.get("revision")
+        fields = info.get("fields")
+        self._fields = frozenset(fields) if fields is not None else None
+
+        print(f"💾 Loaded {len(df)} rows from local snapshot")
+
+    def _save_snapshot(self):
+        """Persist the current history so the next run can skip the fetch."""
+        snapshot = self._get_snapshot()
+        if snapshot is None:
+            return
+
+        try:
+            snapshot.save(
+                self._history,
+                {
+                    "sheet_id": self.sheet_id,
+                    "revision": self._revision,
+                    "header_hash": self._header_hash,
+                    "last_row": self._last_row,
+                    "stamps_hash": self._stamps_hash,
+                    "fields": (
+                        sorted(self._fields) if self._fields is not None else None
+                    ),
+                },
+            )
+        except OSError as e:
+            print(f"⚠️ Could not write local snapshot: {e}")
+
+    def _get_revision(self) -> Optional[str]:
+        """
+        Return the spreadsheet's last modification time from Drive.
+
+        Returns None when the revision cannot be read (e.g. the Drive API is
+        not enabled for the service account); fetches then fall back to the
+        header hash and incremental tail reads.
+        """
+        if self.spreadsheet is None or not self._revision_supported:
+            return None
+
+        try:
+            return REQUEST_BUDGET.call(self.spreadsheet.get_lastUpdateTime)
+        except Exception as e:
+            print(f"⚠️ Spreadsheet revision unavailable, checking rows instead: {e}")
+            self._revision_supported = False
+            return None
+
+    def iter_chunks(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        chunk_size: Optional[int] = None,
+        start_row: int = 2,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream the sheet as typed DataFrames of at most ``chunk_size`` rows.
+
+        Each chunk is normalized like :meth:`get_all_data` (mapped column
+        names, parsed timestamps, categorical answers), but nothing is kept
+        between chunks, so aggregations that consume them run in memory
+        bounded by the chunk size rather than the length of the history.
+        The held history and the TTL cache are neither used nor updated.
+
+        Args:
+            fields: Fields to fetch (see :meth:`get_all_data`)
+            chunk_size: Rows requested per call (default: the client's)
+            start_row: First sheet row to read (row 1 is the header)
+
+        Yields:
+            DataFrame per chunk, in sheet order
+        """
+        if not self.worksheet:
+            self.connect()
+
+        header = REQUEST_BUDGET.call(self.worksheet.row_values, 1)
+        if fields is not None:
+            fields = frozenset(fields) | {"timestamp"}
 
-        # Rename columns using mapping
-        df = df.rename(columns=COLUMN_MAPPING)
+        for _, chunk in self._iter_chunks(header, fields, start_row, chunk_size):
+            yield chunk
+
+    def _iter_chunks(
+        self,
+        header: List[str],
+        fields: Optional[FrozenSet[str]],
+        start_row: int,
+        chunk_size: Optional[int] = None,
+        end_row: Optional[int] = None,
+    ) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """
+        Yield (raw row count, typed chunk) pairs from ``start_row`` onwards.
+
+        Reading stops at ``end_row`` (if given) or at the first chunk that
+        comes back short, i.e. at the end of the sheet's data.
+        """
+        chunk_size = chunk_size or self.chunk_size
+        while end_row is None or start_row <= end_row:
+            chunk_end = start_row + chunk_size - 1
+            if end_row is not None:
+                chunk_end = min(chunk_end, end_row)
+            columns, rows = self._fetch_rows(start_row, header, fields, chunk_end)
+            if not rows:
+                return
+
+            n_rows = len(rows)
+            chunk = self._to_dataframe(columns, rows)
+            del rows  # Only the typed chunk outlives this iteration
+            yield n_rows, chunk
+
+            if n_rows < chunk_end - start_row + 1:
+                return
+            start_row = chunk_end + 1
+
+    def _fetch_rows(
+        self,
+        start_row: int,
+        header: List[str],
+        fields: Optional[FrozenSet[str]] = None,
+        end_row: Optional[int] = None,
+    ) -> Tuple[List[str], List[List[Any]]]:
+        """
+        Fetch rows ``start_row`` to ``end_row`` (default: end of the sheet).
+
+        Only the columns whose mapped names are in ``fields`` are requested,
+        as one batched call with a range per run of adjacent columns. Rows
+        are padded to the requested width and numericised the same way
+        ``get_all_records()`` does, so tail fetches merge cleanly with
+        earlier ones.
+
+        Returns:
+            Tuple of (sheet column names, rows)
+        """
+        indices = [
+            i
+            for i, name in enumerate(header)
+            if fields is None or COLUMN_MAPPING.get(name, name) in fields
+        ]
+        spans = _column_spans(indices or list(range(len(header))))
+        end = "" if end_row is None else str(end_row)
+        ranges = [
+            f"{_column_letter(first + 1)}{start_row}:{_column_letter(last + 1)}{end}"
+            for first, last in spans
+        ]
+        results = REQUEST_BUDGET.call(self.worksheet.batch_get, ranges)
+
+        # Ranges are trimmed independently, so pad them to a common height
+        n_rows = max((len(values) for values in results), default=0)
+        rows = [[] for _ in range(n_rows)]
+        for (first, last), values in zip(spans, results):
+            width = last - first + 1
+            for i, row in enumerate(rows):
+                cells = list(values[i]) if i < len(values) else []
+                row.extend(cells + [""] * (width - len(cells)))
+
+        columns = [header[i] for first, last in spans for i in range(first, last + 1)]
+        from gspread.utils import numericise_all
+
+        return columns, [numericise_all(row) for row in rows]
+
+    def _to_dataframe(self, columns: List[str], rows: List[List[Any]]) -> pd.DataFrame:
+        """Convert raw sheet rows into a normalized, typed DataFrame."""
+        import pandas as pd
+        from metrics import add_value_columns
+
+        df = pd.DataFrame(rows, columns=columns)
+
+        # Rename columns using mapping (in place, without copying the data)
+        df.columns = [COLUMN_MAPPING.get(column, column) for column in columns]
 
         # Parse timestamp
         if "timestamp" in df.columns:
-            df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+            df["timestamp"] = self._timestamp_parser.parse(df["timestamp"])
 
-        return df
+        # Encode answers as integer-coded categoricals, then map each answer
+        # to its numeric value once for the whole chunk
+        return add_value_columns(encode_answers(df))
+
+    def locate_rows(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        last: Optional[int] = None,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Find the sheet rows of a time window from the timestamp column alone.
+
+        Only the timestamp column is downloaded, and it is reused for
+        ``cache_ttl`` seconds; the window's bounds are then found by binary
+        search (see :func:`entries.locate_window`), relying on the form
+        appending rows in submission order.
+
+        Args:
+            start: First timestamp to include (None = from the beginning)
+            end: Last timestamp to include (None = up to the latest row)
+            last: Keep at most the last N rows of the window
+
+        Returns:
+            Tuple of (first, last) sheet rows, 1-based and inclusive (first
+            is past last for an empty window), or None if the sheet has no
+            timestamp column
+        """
+        _, stamps = self._sheet_columns()
+        if stamps is None:
+            return None
+
+        lo, hi = locate_window(stamps, start, end, last)
+        return lo + 2, hi + 1
+
+    def _sheet_columns(
+        self, stamps: bool = True, refresh: bool = False
+    ) -> Tuple[List[str], Optional[List[Any]]]:
+        """
+        Read the header row and the raw timestamp column (rows 2 onwards).
+
+        Both are reused for ``cache_ttl`` seconds, so window queries made in
+        one process share a single read of them.
 
-    def get_weekly_data(self, weeks_ago: int = 0) -> pd.DataFrame:
+        Args:
+            stamps: Also read the timestamp column
+            refresh: Read them again even if they are within the TTL
+
+        Returns:
+            Tuple of (header, timestamp cells in sheet order); the cells are
+            None if not requested or if the sheet has no timestamp column
+        """
+        if not self.worksheet:
+            self.connect()
+
+        if (
+            refresh
+            or self._columns_at is None
+            or time.monotonic() - self._columns_at >= self.cache_ttl
+        ):
+            header = REQUEST_BUDGET.call(self.worksheet.row_values, 1)
+            self._columns = {"header": header}
+            self._columns_at = time.monotonic()
+
+        header = self._columns["header"]
+        if stamps and "stamps" not in self._columns:
+            self._columns["stamps"] = None
+            if "timestamp" in (COLUMN_MAPPING.get(name, name) for name in header):
+                _, rows = self._fetch_rows(2, header, frozenset({"timestamp"}))
+                self._columns["stamps"] = [row[0] for row in rows]
+        return header, self._columns.get("stamps")
+
+    def get_entries(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        last: Optional[int] = None,
+    ) -> List[DailyEntry]:
+        """
+        Fetch the sheet as compact DailyEntry records, without a DataFrame.
+
+        Meant for small windows (see ``LITE_WINDOW_DAYS``): the rows are
+        read in one batched request and kept as slotted records, skipping
+        DataFrame construction, categorical encoding and the snapshot.
+
+        When a window is given, its rows are located first (see
+        :meth:`locate_rows`) and only those rows are downloaded.
+
+        Args:
+            fields: Fields to fetch (see :meth:`get_all_data`)
+            start: First timestamp to include (None = from the beginning)
+            end: Last timestamp to include (None = up to the latest entry)
+            last: Keep only the last N entries of the window
+
+        Returns:
+            Entries sorted by timestamp
+        """
+        header, _ = self._sheet_columns(stamps=False)
+        if not header:
+            raise ValueError("No data found in the sheet")
+        if fields is not None:
+            fields = frozenset(fields) | {"timestamp"}
+
+        first, last_row = 2, None
+        if start is not None or end is not None or last is not None:
+            rows = self.locate_rows(start, end, last)
+            if rows is not None:
+                first, last_row = rows
+                if first > last_row:
+                    print("📥 Fetched 0 entries")
+                    return []
+
+        columns, rows = self._fetch_rows(first, header, fields, last_row)
+        entries = select_window(entries_from_rows(columns, rows), start, end)
+        if last is not None:
+            entries = entries[-last:] if last else []
+        print(f"📥 Fetched {len(entries)} entries")
+        return entries
+
+    def get_weekly_data(
+        self, weeks_ago: int = 0, fields: Optional[Iterable[str]] = None
+    ) -> pd.DataFrame:
         """
         Get data for a specific week.
 
         Args:
             weeks_ago: Number of weeks back from current week (0 = current week)
+            fields: Fields to fetch (see :meth:`get_all_data`)
 
         Returns:
-            DataFrame with filtered data for that week
+            DataFrame with filtered data for that week (a read-only slice of
+            the history)
         """
-        df = self.get_all_data()
+        df = self.get_all_data(fields=fields)
 
-        # Calculate date range for the week
-        today = datetime.now()
-        start_of_current_week = today - timedelta(days=today.weekday())  # Monday
-        start_of_target_week = start_of_current_week - timedelta(weeks=weeks_ago)
-        end_of_target_week = start_of_target_week + timedelta(days=6)  # Sunday
+        start_of_target_week, end_of_target_week = week_bounds(weeks_ago)
 
-        # Filter data for the week
-        mask = (df["timestamp"] >= start_of_target_week) & (
-            df["timestamp"] <= end_of_target_week
-        )
-        weekly_df = df[mask].copy()
+        # Slice out the week
+        weekly_df = slice_time_range(df, start_of_target_week, end_of_target_week)
 
         print(
             f"📅 Data for week: {start_of_target_week.date()} to {end_of_target_week.date()}"
@@ -100,22 +979,125 @@ class SheetsClient:
 
         return weekly_df
 
+    def get_window_metrics(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        fields: Optional[Iterable[str]] = None,
+        last: Optional[int] = None,
+    ) -> WindowMetrics:
+        """
+        Get the metrics of a window from running totals of the history.
+
+        Rows fetched since the last call are folded into persisted running
+        aggregates, and the window is answered from two rows of the totals,
+        so the cost does not grow with the length of the history.
+
+        Args:
+            start: First timestamp to include (None = from the beginning)
+            end: Last timestamp to include (None = up to the latest entry)
+            fields: Fields to fetch (see :meth:`get_all_data`)
+            last: Use the last N entries instead of a time range
+
+        Returns:
+            WindowMetrics for the window
+        """
+        from aggregates import RunningAggregates
+
+        df = self.get_all_data(fields=fields)
+
+        if self._aggregates is None:
+            directory = None
+            if self.aggregates_dir and self.sheet_id:
+                directory = Path(self.aggregates_dir) / self.sheet_id
+            self._aggregates = RunningAggregates(directory)
+
+        if df.empty:
+            return WindowMetrics(0, {})
+        return self._aggregates.update(df).window(start, end, last=last)
+
+    def get_weekly_metrics(
+        self, weeks_ago: int = 0, fields: Optional[Iterable[str]] = None
+    ) -> WindowMetrics:
+        """
+        Get the metrics of a specific week (see :meth:`get_weekly_data`).
+
+        Args:
+            weeks_ago: Number of weeks back from current week (0 = current week)
+            fields: Fields to fetch (see :meth:`get_all_data`)
+
+        Returns:
+            WindowMetrics for that week
+        """
+        start_of_target_week, end_of_target_week = week_bounds(weeks_ago)
+        metrics = self.get_window_metrics(
+            start_of_target_week, end_of_target_week, fields=fields
+        )
+
+        print(
+            f"📅 Data for week: {start_of_target_week.date()} to {end_of_target_week.date()}"
+        )
+        print(f"📊 Found {metrics.total_days} entries")
+
+        return metrics
+
     def get_date_range_data(
-        self, start_date: datetime, end_date: datetime
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        fields: Optional[Iterable[str]] = None,
+        last: Optional[int] = None,
     ) -> pd.DataFrame:
         """
         Get data for a specific date range.
 
+        A history already held by the client is brought up to date (see
+        :meth:`get_all_data`) and sliced. Otherwise the range's rows are
+        located from the timestamp column (see :meth:`locate_rows`) and only
+        they are downloaded, so a short window of a long sheet costs one
+        narrow column read, shared by the queries made within ``cache_ttl``,
+        plus its own rows. A sheet without a timestamp column is fetched
+        whole.
+
         Args:
-            start_date: Start date (inclusive)
-            end_date: End date (inclusive)
+            start_date: Start date (inclusive, None = from the beginning)
+            end_date: End date (inclusive, None = up to the latest entry)
+            fields: Fields to fetch (see :meth:`get_all_data`)
+            last: Keep only the last N rows of the range
 
         Returns:
-            DataFrame with filtered data
+            DataFrame with filtered data (read-only)
         """
-        df = self.get_all_data()
-        mask = (df["timestamp"] >= start_date) & (df["timestamp"] <= end_date)
-        return df[mask].copy()
+        if fields is not None:
+            fields = frozenset(fields) | {"timestamp"}
+
+        if self._history is not None and self._holds(fields):
+            df = self.get_all_data(fields=fields)
+        else:
+            header, _ = self._sheet_columns(stamps=False)
+            if not header:
+                raise ValueError("No data found in the sheet")
+
+            rows = self.locate_rows(start_date, end_date, last)
+            if rows is None:
+                df = self.get_all_data(fields=fields)
+                return df if last is None else df.tail(last)
+
+            first, last_row = rows
+            if first > last_row:
+                columns = [
+                    name
+                    for name in header
+                    if fields is None or COLUMN_MAPPING.get(name, name) in fields
+                ]
+                df = self._to_dataframe(columns, [])
+            else:
+                columns, rows = self._fetch_rows(first, header, fields, last_row)
+                df = sort_by_timestamp(self._to_dataframe(columns, rows))
+                print(f"📥 Fetched {len(df)} row(s) of the range")
+
+        window = slice_time_range(df, start_date, end_date)
+        return window if last is None else window.tail(last)
 
     def get_summary_stats(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Get summary statistics from the data."""
@@ -134,6 +1116,52 @@ class SheetsClient:
         return stats
 
 
+def fetch_many(
+    sheet_ids: Iterable[str],
+    fields: Optional[Iterable[str]] = None,
+    max_workers: int = SHEETS_MAX_WORKERS,
+    **client_options: Any,
+) -> Dict[str, Union[pd.DataFrame, Exception]]:
+    """
+    Fetch several spreadsheets concurrently.
+
+    Each sheet is read by its own :class:`SheetsClient` on a bounded thread
+    pool; all of them share the pooled authorized session. A failing sheet
+    does not abort the batch.
+
+    Args:
+        sheet_ids: Spreadsheet IDs to fetch (e.g. one per person)
+        fields: Fields to fetch (see :meth:`SheetsClient.get_all_data`)
+        max_workers: Maximum number of sheets fetched at the same time
+        **client_options: Extra keyword arguments for each SheetsClient
+
+    Returns:
+        Dictionary mapping each sheet ID to its DataFrame, or to the
+        exception raised while fetching it
+    """
+    sheet_ids = list(dict.fromkeys(sheet_ids))
+
+    def fetch(sheet_id: str) -> pd.DataFrame:
+        return SheetsClient(sheet_id, **client_options).get_all_data(fields=fields)
+
+    results: Dict[str, Union[pd.DataFrame, Exception]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {sheet_id: pool.submit(fetch, sheet_id) for sheet_id in sheet_ids}
+        for sheet_id, future in futures.items():
+            try:
+                results[sheet_id] = future.result()
+            except Exception as e:
+                print(f"❌ Error fetching sheet {sheet_id}: {e}")
+                results[sheet_id] = e
+
+    stats = get_request_stats()
+    print(
+        f"📈 Sheets API: {stats['requests']} requests, "
+        f"{stats['throttled']} throttled, {stats['retried']} retried"
+    )
+    return results
+
+
 def test_connection():
     """Test function to verify connection and data fetching."""
     try:
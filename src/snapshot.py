@@ -0,0 +1,138 @@
+"""On-disk columnar snapshots of normalized sheet history."""
+
+import json
+import os
+import uuid
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+
+META_FILE = "meta.json"
+
+
+def _smallest_code_dtype(n_categories: int) -> np.dtype:
+    """Pick the narrowest signed integer type that can hold the codes."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _json_scalar(value: Any) -> Any:
+    """Convert a category value into something JSON can round-trip."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class SheetSnapshot:
+    """
+    Columnar snapshot of one sheet's normalized DataFrame.
+
+    Every column is stored as its own ``.npy`` file so that reads can be
+    memory-mapped instead of parsed:
+
+    - timestamps as int64 nanoseconds
+    - text answers as integer codes, with the categories kept in the
+      metadata file
+    - numeric columns as-is
+
+    ``meta.json`` is written last and names the files of the current
+    generation, so a reader never sees a half-written snapshot.
+    """
+
+    def __init__(self, directory: Path):
+        """Initialize a snapshot stored under ``directory``."""
+        self.directory = Path(directory)
+        self.meta_path = self.directory / META_FILE
+
+    def load(self) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """
+        Open the snapshot memory-mapped.
+
+        Returns:
+            Tuple of (DataFrame, metadata), or None if there is no usable
+            snapshot on disk
+        """
+        try:
+            meta = json.loads(self.meta_path.read_text())
+            columns = {}
+            for column in meta["columns"]:
+                values = np.load(self.directory / column["file"], mmap_mode="r")
+                if column["kind"] == "datetime":
+                    columns[column["name"]] = pd.Series(
+                        values.view("datetime64[ns]"), copy=False
+                    )
+                elif column["kind"] == "category":
+                    columns[column["name"]] = pd.Categorical.from_codes(
+                        values, categories=column["categories"]
+                    )
+                else:
+                    columns[column["name"]] = values
+        except (OSError, ValueError, KeyError) as e:
+            if self.meta_path.exists():
+                print(f"⚠️ Ignoring unreadable snapshot in {self.directory}: {e}")
+            return None
+
+        df = pd.DataFrame(columns, copy=False)
+        return df, meta["info"]
+
+    def save(self, df: pd.DataFrame, info: Dict[str, Any]):
+        """
+        Write ``df`` as the new snapshot.
+
+        Args:
+            df: Normalized sheet history
+            info: Invalidation metadata (revision, header hash, last row, ...)
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        generation = uuid.uuid4().hex[:8]
+
+        columns = []
+        for i, name in enumerate(df.columns):
+            series = df[name]
+            column = {"name": name, "file": f"{generation}_{i}.npy"}
+
+            if pd.api.types.is_datetime64_any_dtype(series):
+                column["kind"] = "datetime"
+                values = series.to_numpy(dtype="datetime64[ns]").view("int64")
+            elif series.dtype.kind in "biuf":
+                column["kind"] = "numeric"
+                values = series.to_numpy()
+            else:
+                if isinstance(series.dtype, pd.CategoricalDtype):
+                    codes = series.cat.codes.to_numpy()
+                    categories = series.cat.categories
+                else:
+                    codes, categories = pd.factorize(series, sort=False)
+                column["kind"] = "category"
+                column["categories"] = [_json_scalar(c) for c in categories]
+                values = codes.astype(_smallest_code_dtype(len(categories)))
+
+            np.save(self.directory / column["file"], values, allow_pickle=False)
+            columns.append(column)
+
+        # Publish the new generation atomically, then drop the old files
+        tmp_path = self.directory / f"{META_FILE}.{generation}.tmp"
+        tmp_path.write_text(json.dumps({"columns": columns, "info": info}))
+        os.replace(tmp_path, self.meta_path)
+
+        for path in self.directory.glob("*.npy"):
+            if not path.name.startswith(f"{generation}_"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass  # Still mapped elsewhere; cleaned up on a later save
+
+    def clear(self):
+        """Delete the snapshot from disk."""
+        if not self.directory.exists():
+            return
+        for path in self.directory.iterdir():
+            try:
+                path.unlink()
+            except OSError:
+                pass
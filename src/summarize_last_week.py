@@ -9,10 +9,37 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from sheets_client import SheetsClient
 from analyzer import PersonalizationAnalyzer
+from entries import entry_metrics, entry_streaks
 from whatsapp_client import WhatsAppClient
 import config
 
 
+# Entries summarized per report
+WINDOW_ENTRIES = 7
+
+
+def get_last_7_days_entries():
+    """Fetch the last 7 rows as compact entries, without building DataFrames."""
+    print("📊 Fetching data from Google Sheets...")
+    sheets_client = SheetsClient()
+    sheets_client.connect()
+
+    # Only the last rows are downloaded (located from the timestamp column)
+    last_7_days = sheets_client.get_entries(
+        fields=PersonalizationAnalyzer.REQUIRED_FIELDS, last=WINDOW_ENTRIES
+    )
+    if not last_7_days:
+        print("❌ No data found in the sheet")
+        return None
+
+    print(f"✅ Found {len(last_7_days)} entries for analysis")
+    print(
+        f"📅 Data range: {last_7_days[0].timestamp.date()} to "
+        f"{last_7_days[-1].timestamp.date()}"
+    )
+    return last_7_days
+
+
 def get_last_7_days_data():
     """Fetch the last 7 rows from the Google Sheet."""
     print("📊 Fetching data from Google Sheets...")
@@ -20,16 +47,16 @@ def get_last_7_days_data():
     sheets_client = SheetsClient()
     sheets_client.connect()
 
-    # Get all data
-    df = sheets_client.get_all_data()
+    # Get the last 7 rows (only the columns the weekly report reads); just
+    # those rows are downloaded
+    last_7_days = sheets_client.get_date_range_data(
+        fields=PersonalizationAnalyzer.REQUIRED_FIELDS, last=WINDOW_ENTRIES
+    )
 
-    if df.empty:
+    if last_7_days.empty:
         print("❌ No data found in the sheet")
         return None
 
-    # Get last 7 rows
-    last_7_days = df.tail(7).copy()
-
     print(f"✅ Found {len(last_7_days)} entries for analysis")
 
     # Show date range
@@ -41,25 +68,25 @@ def get_last_7_days_data():
     return last_7_days
 
 
-def generate_summary(df):
-    """Generate a comprehensive summary of the last 7 days."""
-    print("\n🔍 Analyzing your performance...")
-
-    analyzer = PersonalizationAnalyzer(df)
-
-    # Generate the report
-    report = analyzer.generate_weekly_report()
+def generate_summary(df=None, entries=None):
+    """
+    Generate a comprehensive summary of the last 7 days.
 
-    # Get focus areas
-    focus_areas = analyzer.get_focus_areas()
+    Args:
+        df: Entries as a DataFrame
+        entries: Entries as DailyEntry records (used instead of ``df``)
+    """
+    print("\n🔍 Analyzing your performance...")
 
-    # Add focus areas to report if any
-    if focus_areas:
-        report += "\n\n🎯 Focus Areas for Next Week:"
-        for i, area in enumerate(focus_areas, 1):
-            report += f"\n   {i}. {area}"
+    if entries is not None:
+        analyzer = PersonalizationAnalyzer(
+            metrics=entry_metrics(entries), streaks=entry_streaks(entries)
+        )
+    else:
+        analyzer = PersonalizationAnalyzer(df)
 
-    return report
+    # Report followed by the focus areas for next week
+    return analyzer.render("summary")
 
 
 def send_to_whatsapp(report):
@@ -92,15 +119,18 @@ def main():
         config.validate_config()
         print("✅ Configuration valid\n")
 
-        # Step 1: Get last 7 days data
-        df = get_last_7_days_data()
+        # Step 1: Get last 7 days data (compact records for small windows)
+        if WINDOW_ENTRIES <= config.LITE_WINDOW_DAYS:
+            entries, df = get_last_7_days_entries(), None
+        else:
+            entries, df = None, get_last_7_days_data()
 
-        if df is None or df.empty:
+        if not entries and (df is None or df.empty):
             print("\n❌ No data available. Please fill your daily form first!")
             return
 
         # Step 2: Generate summary
-        report = generate_summary(df)
+        report = generate_summary(df, entries)
 
         # Display the report
         print("\n" + "=" * 70)
@@ -0,0 +1,132 @@
+"""Week-bucketed trends of every tracked field."""
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Optional, Tuple
+from metrics import GroupedMetrics
+
+TREND_COLUMNS = ["slope", "start", "end", "change", "weeks"]
+
+
+def weekly_values(
+    df: pd.DataFrame,
+) -> Tuple[pd.DatetimeIndex, pd.DataFrame]:
+    """
+    Average answer value of every field per calendar week (Monday-Sunday).
+
+    For yes/no fields the weekly average is the share of days answered
+    "yes"; for sleep it is the average hours. Weeks without entries are
+    kept, with NaN values, so gaps do not shift later weeks.
+
+    Args:
+        df: Daily entries with a ``timestamp`` column
+
+    Returns:
+        Tuple of (Monday of each week, DataFrame of weekly values by field)
+    """
+    df = df[df["timestamp"].notna()]
+    days = df["timestamp"].to_numpy().astype("datetime64[D]")
+    if len(days) == 0:
+        return pd.DatetimeIndex([]), pd.DataFrame()
+
+    # 1970-01-01 was a Thursday; shift so weeks start on Monday
+    first_monday = days.min() - ((days.min().astype(np.int64) + 3) % 7)
+    week_codes = ((days - first_monday).astype(np.int64)) // 7
+    n_weeks = int(week_codes.max()) + 1
+
+    grouped = GroupedMetrics(df, week_codes, n_weeks)
+    values = pd.DataFrame(
+        {field: grouped.mean(field) for field in grouped.valued}
+    )
+    mondays = pd.DatetimeIndex(
+        (first_monday + np.arange(n_weeks) * 7).astype("datetime64[ns]")
+    )
+    values.index = mondays
+    return mondays, values
+
+
+def fit_slopes(values: pd.DataFrame) -> pd.DataFrame:
+    """
+    Least-squares line through every column of ``values`` at once.
+
+    Missing weeks (NaN) are left out of each column's fit; columns with
+    fewer than two weeks of data get NaN.
+
+    Args:
+        values: One row per week, one column per field
+
+    Returns:
+        DataFrame indexed by field with the weekly ``slope``, the fitted
+        value of the first (``start``) and last (``end``) week, ``change``
+        (end - start) and the number of ``weeks`` with data
+    """
+    y = values.to_numpy(dtype=float)
+    x = np.arange(len(values), dtype=float)[:, None]
+    present = ~np.isnan(y)
+    y0 = np.where(present, y, 0.0)
+
+    n = present.sum(axis=0)
+    sx = (x * present).sum(axis=0)
+    sy = y0.sum(axis=0)
+    sxx = (x**2 * present).sum(axis=0)
+    sxy = (x * y0).sum(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        denominator = n * sxx - sx**2
+        slope = np.where(
+            (n >= 2) & (denominator > 0), (n * sxy - sx * sy) / denominator, np.nan
+        )
+        intercept = (sy - slope * sx) / n
+
+    last = max(len(values) - 1, 0)
+    start = intercept
+    end = intercept + slope * last
+    return pd.DataFrame(
+        {
+            "slope": slope,
+            "start": start,
+            "end": end,
+            "change": end - start,
+            "weeks": n,
+        },
+        index=values.columns,
+    )
+
+
+def compute_trends(
+    df: pd.DataFrame,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """
+    Weekly trend of every tracked field over a window of any length.
+
+    The window is bucketed into calendar weeks in one grouped pass (see
+    :class:`metrics.GroupedMetrics`) and a line is fitted to every field's
+    weekly values in one vectorized least-squares pass, so a month, a
+    quarter or a year cost the same two passes.
+
+    Args:
+        df: Daily entries sorted by timestamp
+        start: First timestamp to include (None = from the beginning)
+        end: Last timestamp to include (None = up to the latest entry)
+
+    Returns:
+        DataFrame indexed by field with the columns of ``TREND_COLUMNS``
+        (see :func:`fit_slopes`); empty without at least one entry
+    """
+    if "timestamp" not in df.columns:
+        return pd.DataFrame(columns=TREND_COLUMNS)
+
+    timestamps = df["timestamp"]
+    lo = 0 if start is None else timestamps.searchsorted(pd.Timestamp(start))
+    hi = (
+        len(df)
+        if end is None
+        else timestamps.searchsorted(pd.Timestamp(end), side="right")
+    )
+    _, values = weekly_values(df.iloc[lo:hi])
+    if values.empty:
+        return pd.DataFrame(columns=TREND_COLUMNS)
+    return fit_slopes(values)
@@ -1,6 +1,5 @@
 """WhatsApp client for sending messages via Twilio."""
 
-from twilio.rest import Client
 from config import (
     TWILIO_ACCOUNT_SID,
     TWILIO_AUTH_TOKEN,
@@ -22,6 +21,8 @@ class WhatsAppClient:
 
     def connect(self):
         """Establish connection to Twilio."""
+        from twilio.rest import Client
+
         try:
             self.client = Client(self.account_sid, self.auth_token)
             print("✅ Connected to Twilio WhatsApp")
@@ -0,0 +1,104 @@
+"""Metrics of one window of daily entries, in plain Python."""
+
+import math
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional
+from config import ANSWER_VALUES
+
+# Sleep answers look like "7 hrs" or ">=10 hrs"
+_SLEEP_HOURS = re.compile(r"(\d+)")
+
+
+def sleep_hours(answer: Any) -> Optional[int]:
+    """Extract the number of hours from a sleep answer, if it has one."""
+    if isinstance(answer, str) and "hr" in answer:
+        match = _SLEEP_HOURS.search(answer)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def answer_value(field: str, answer: Any) -> Optional[float]:
+    """
+    Look up the numeric value of one answer.
+
+    Answers missing from ``ANSWER_VALUES`` have no value, except sleep
+    answers, whose hours are parsed from the text.
+    """
+    value = ANSWER_VALUES.get(field, {}).get(answer)
+    if value is None and field == "sleep":
+        hours = sleep_hours(answer)
+        value = float(hours) if hours is not None else None
+    return value
+
+
+class WindowMetrics:
+    """Answer counts and derived values for one window of daily entries."""
+
+    def __init__(
+        self,
+        total_days: int,
+        counts: Dict[str, Dict[Any, int]],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        means: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize metrics for a window.
+
+        Args:
+            total_days: Number of entries in the window
+            counts: Per-field answer counts (see :func:`count_answers`)
+            start: Earliest timestamp in the window
+            end: Latest timestamp in the window
+            means: Per-field average of the numeric answer values
+        """
+        self.total_days = total_days
+        self.counts = counts
+        self.start = start
+        self.end = end
+        self.means = means or {}
+
+        # Nights per number of hours, from the answer value table
+        self.sleep_nights: Dict[float, int] = {}
+        for answer, nights in counts.get("sleep", {}).items():
+            hours = answer_value("sleep", answer)
+            if hours is not None and nights:
+                self.sleep_nights[hours] = self.sleep_nights.get(hours, 0) + nights
+
+    def has(self, field: str) -> bool:
+        """Check whether the field is tracked in this window's data."""
+        return field in self.counts
+
+    def count(self, field: str, answer: Any) -> int:
+        """Return how many days the field had the given answer."""
+        return self.counts.get(field, {}).get(answer, 0)
+
+    def rate(self, field: str, answer: Any) -> float:
+        """Return the share of days (0-1) the field had the given answer."""
+        if self.total_days == 0:
+            return 0
+        return self.count(field, answer) / self.total_days
+
+    def mean(self, field: str) -> Optional[float]:
+        """Average numeric value of a field's answers (see ``ANSWER_VALUES``)."""
+        value = self.means.get(field)
+        if value is None or math.isnan(value):
+            return None
+        return value
+
+    @property
+    def avg_sleep(self) -> Optional[float]:
+        """Average hours of sleep over nights with a known answer."""
+        if "sleep" in self.means:
+            return self.mean("sleep")
+
+        nights = sum(self.sleep_nights.values())
+        if nights == 0:
+            return None
+        return sum(h * n for h, n in self.sleep_nights.items()) / nights
+
+    def sleep_nights_between(self, low: float, high: float) -> int:
+        """Count nights with ``low <= hours <= high``."""
+        return sum(n for h, n in self.sleep_nights.items() if low <= h <= high)
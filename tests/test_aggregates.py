@@ -0,0 +1,118 @@
+"""Unit tests for Alpha-X running aggregates module."""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from aggregates import RunningAggregates
+from metrics import add_value_columns, compute_metrics
+from sheets_client import encode_answers, slice_time_range
+
+
+def _history(n, seed=3):
+    """Create ``n`` days of ingested entries."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2026-01-01 21:00", periods=n, freq="D"),
+            "coding": rng.choice(["Yes", "No", None], n),
+            "sleep": rng.choice(["6 hrs", "7 hrs", "9 hrs", None], n),
+            "marriage": rng.choice(["Good", "Okayish", "Not good"], n),
+        }
+    )
+    return add_value_columns(encode_answers(df))
+
+
+def _assert_same(window, expected):
+    assert window.total_days == expected.total_days
+    assert window.counts == expected.counts
+    assert window.avg_sleep == pytest.approx(expected.avg_sleep)
+    assert window.start == expected.start and window.end == expected.end
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        (None, None),
+        ("2026-01-08", "2026-01-14 23:59"),
+        ("2026-01-20 21:00", None),
+        (None, "2026-01-03 21:00"),
+    ],
+)
+def test_windows_match_recounting(start, end):
+    """Test that windows from running totals equal recounting the rows."""
+    history = _history(40)
+    aggregates = RunningAggregates().update(history)
+
+    _assert_same(
+        aggregates.window(start, end),
+        compute_metrics(slice_time_range(history, start, end)),
+    )
+
+
+def test_incremental_update_folds_only_new_rows():
+    """Test appending rows and a previously unseen answer."""
+    history = _history(30)
+    history["coding"] = history["coding"].cat.add_categories("Rest day")
+    history.loc[29, "coding"] = "Rest day"
+
+    aggregates = RunningAggregates().update(history.iloc[:20])
+    aggregates.update(history)
+
+    assert aggregates.rows == 30
+    _assert_same(aggregates.window(last=7), compute_metrics(history.tail(7)))
+    assert aggregates.window(last=7).count("coding", "Rest day") == 1
+
+
+def test_backdated_row_rebuilds_totals():
+    """Test that a change before the counted rows triggers a rebuild."""
+    history = _history(10)
+    aggregates = RunningAggregates().update(history)
+
+    changed = history.drop(index=3).reset_index(drop=True)
+    aggregates.update(changed)
+
+    _assert_same(aggregates.window(), compute_metrics(changed))
+
+
+def test_edited_answer_rebuilds_totals():
+    """Test that an answer edited in place is not counted from stale totals."""
+    history = _history(5)
+    history["coding"] = "Yes"
+    aggregates = RunningAggregates().update(encode_answers(history))
+
+    edited = history.copy()
+    edited.loc[0, "coding"] = "No"
+    edited = encode_answers(edited)
+    aggregates.update(edited)
+
+    _assert_same(aggregates.window(), compute_metrics(edited))
+    assert aggregates.window().counts["coding"] == {"Yes": 4, "No": 1}
+
+
+def test_totals_persist_between_runs(tmp_path):
+    """Test that a new instance answers windows from the saved totals."""
+    history = _history(15)
+    RunningAggregates(tmp_path).update(history)
+
+    reloaded = RunningAggregates(tmp_path)
+    assert reloaded.rows == 15
+    _assert_same(reloaded.window(last=5), compute_metrics(history.tail(5)))
+
+
+def test_empty_window():
+    """Test a window with no entries."""
+    aggregates = RunningAggregates().update(_history(5))
+    window = aggregates.window(start="2027-01-01")
+
+    assert window.total_days == 0
+    assert window.count("coding", "Yes") == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -148,5 +148,29 @@ def test_health_metrics():
     assert health["score"] >= 80
 
 
+def test_sections_are_computed_once(sample_data):
+    """Test that report and focus areas share cached section results."""
+    analyzer = PersonalizationAnalyzer(sample_data)
+    analyzer.generate_weekly_report()
+    career = analyzer.analyze_career()
+
+    analyzer.get_focus_areas()
+
+    assert analyzer.analyze_career() is career
+
+
+def test_cache_invalidated_when_data_changes(sample_data):
+    """Test that new data is not answered from stale cached sections."""
+    analyzer = PersonalizationAnalyzer(sample_data)
+    before = analyzer.analyze_health()
+
+    analyzer.df = sample_data.head(3)
+
+    after = analyzer.analyze_health()
+    assert after is not before
+    assert analyzer.total_days == 3
+    assert after["metrics"]["workout"] == "3/3 days"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,116 @@
+"""Unit tests for Alpha-X anomalies module."""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from anomalies import ScoreDetector, ScoreMonitor, check_tenants
+from metrics import daily_scores
+
+GOOD_DAY = {
+    "coding": "Yes",
+    "day_overview": "Did hard work - enjoyed",
+    "marriage": "Good",
+    "sleep": "8 hrs",
+}
+BAD_DAY = {
+    "coding": "No",
+    "day_overview": "Procrastinated",
+    "marriage": "Not good",
+    "sleep": "5 hrs",
+}
+
+
+def make_history(days, start_day=1):
+    """Create one entry per day from a list of answer dicts."""
+    df = pd.DataFrame(days)
+    df.insert(
+        0,
+        "timestamp",
+        [pd.Timestamp(2026, 1, start_day, 21) + pd.Timedelta(days=i) for i in range(len(days))],
+    )
+    return df
+
+
+def test_daily_scores():
+    """Test the composite score of good, bad and mixed days."""
+    mixed = dict(GOOD_DAY, coding="No", sleep="6 hrs", marriage=None)
+    df = make_history([GOOD_DAY, BAD_DAY, mixed, {}])
+
+    scores = daily_scores(df)
+
+    assert scores[0] == 100
+    assert scores[1] == 0
+    # coding 0, day overview 1, sleep 0.5 (marriage unanswered)
+    assert scores[2] == pytest.approx(50)
+    assert np.isnan(scores[3])
+
+
+def test_detector_flags_drop_after_warmup():
+    """Test that a sudden low day is flagged only once there is a baseline."""
+    detector = ScoreDetector(alpha=0.2, z_threshold=2.0, min_days=7)
+
+    early = detector.update(90)
+    results = [detector.update(score) for score in [80, 90, 85, 90, 80, 85, 90]]
+    drop = detector.update(20)
+
+    assert early["anomaly"] is None
+    assert all(r["anomaly"] is None for r in results)
+    assert drop["anomaly"] == "drop"
+    assert drop["z"] < -2
+    assert detector.days == 9
+
+
+def test_monitor_flags_slump_and_resumes_from_state(tmp_path):
+    """Test a run of bad days and that reruns only fold in new entries."""
+    path = tmp_path / "sheet.json"
+    history = make_history([GOOD_DAY] * 10 + [BAD_DAY] * 3)
+
+    alerts = ScoreMonitor(path).observe(history.iloc[:10])
+    assert alerts == []
+
+    # A new run (new process) only sees the three new entries
+    alerts = ScoreMonitor(path).observe(history)
+    # The first bad days are sharp drops; by the third the baseline has
+    # moved, but the run itself is flagged
+    assert [a["anomaly"] for a in alerts] == ["drop", "drop", "slump"]
+
+    monitor = ScoreMonitor(path)
+    assert monitor.detector.days == 13
+    assert monitor.observe(history) == []
+
+
+def test_slump_of_below_normal_days():
+    """Test that several moderately bad days in a row are flagged once."""
+    detector = ScoreDetector(alpha=0.1, z_threshold=2.0, min_days=3)
+    for score in [80] * 6:
+        detector.update(score)
+
+    results = [detector.update(score) for score in [72, 72, 72, 72]]
+
+    assert [r["anomaly"] for r in results] == [None, None, "slump", None]
+
+
+def test_check_tenants_keeps_state_per_tenant(tmp_path):
+    """Test that every tenant gets its own persisted detector."""
+    histories = {
+        "alice": make_history([GOOD_DAY] * 8 + [BAD_DAY]),
+        "bob": make_history([GOOD_DAY] * 9),
+        "broken": RuntimeError("fetch failed"),
+    }
+
+    alerts = check_tenants(histories, tmp_path)
+
+    assert len(alerts["alice"]) == 1
+    assert alerts["bob"] == []
+    assert "broken" not in alerts
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["alice.json", "bob.json"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,87 @@
+"""Unit tests for Alpha-X backfill module."""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from analyzer import PersonalizationAnalyzer
+from backfill import backfill, period_keys
+from metrics import compute_grouped_metrics, compute_metrics
+
+
+@pytest.fixture
+def history():
+    """Create ten weeks of randomized daily entries."""
+    rng = np.random.default_rng(7)
+    n = 70
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-12-22", periods=n, freq="D"),
+            "coding": rng.choice(["Yes", "No", None], n),
+            "focus": rng.choice(
+                ["Good, razor sharp", "I was multi-tasking, not good focus"], n
+            ),
+            "workout": pd.Categorical(rng.choice(["Yes", "No"], n)),
+            "sleep": rng.choice(["<5 hrs", "6 hrs", "7 hrs", "8 hrs", None], n),
+            "marriage": rng.choice(["Good", "Okayish", "Not good"], n),
+            "happiness": rng.choice(
+                ["Yes, I am happy", "No, I performed bad"], n
+            ),
+        }
+    )
+
+
+def test_period_keys_use_iso_weeks_and_months():
+    """Test week and month labels, including the ISO year boundary."""
+    ts = pd.Series(pd.to_datetime(["2025-12-29", "2026-01-04", "2026-01-05"]))
+
+    assert period_keys(ts, "week").tolist() == ["2026-W01", "2026-W01", "2026-W02"]
+    assert period_keys(ts, "month").tolist() == ["2025-12", "2026-01", "2026-01"]
+    with pytest.raises(ValueError):
+        period_keys(ts, "year")
+
+
+def test_grouped_metrics_match_per_window_metrics(history):
+    """Test that one grouped pass equals computing each window separately."""
+    keys = period_keys(history["timestamp"], "week")
+    grouped = compute_grouped_metrics(history, keys)
+
+    assert len(grouped) == 10
+    for label, m in grouped.items():
+        expected = compute_metrics(history[keys == label])
+        assert m.total_days == expected.total_days
+        # Plain-text columns list every answer of the history, with 0s
+        counts = {f: {a: n for a, n in c.items() if n} for f, c in m.counts.items()}
+        assert counts == {
+            f: {a: n for a, n in c.items() if n} for f, c in expected.counts.items()
+        }
+        assert m.avg_sleep == pytest.approx(expected.avg_sleep)
+        assert m.start == expected.start and m.end == expected.end
+
+
+def test_backfill_scores_match_weekly_reports(history):
+    """Test that backfilled scores equal a report run for each week."""
+    table = backfill(history, "week")
+    keys = period_keys(history["timestamp"], "week")
+
+    assert table["period"].tolist() == list(keys.cat.categories)
+    for row in table.itertuples():
+        analyzer = PersonalizationAnalyzer(history[keys == row.period])
+        assert row.days == analyzer.total_days
+        assert row.career_score == analyzer.analyze_career()["score"]
+        assert row.health_score == analyzer.analyze_health()["score"]
+        assert row.overall_score == pytest.approx(analyzer.overall_score())
+
+
+def test_backfill_empty_history():
+    """Test that an empty history gives an empty table."""
+    assert backfill(pd.DataFrame()).empty
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
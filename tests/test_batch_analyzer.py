@@ -0,0 +1,125 @@
+"""Unit tests for Alpha-X batch analyzer module."""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from analyzer import PersonalizationAnalyzer
+from batch_analyzer import BatchAnalyzer
+
+ANSWERS = {
+    "coding": ["Yes", "No"],
+    "focus": ["Good, razor sharp", "I was multi-tasking, not good focus"],
+    "career_focus": [
+        "Good, achieved my today's goal",
+        "Neutral, gave my best",
+        "Lazy, didn't wanted to work",
+    ],
+    "protein": [">= 100g", "< 100g"],
+    "workout": ["Yes", "No"],
+    "sleep": ["<5 hrs", "6 hrs", "7 hrs", "8 hrs", "9 hrs"],
+    "sunshine": ["Yes", "No"],
+    "marriage": ["Good", "Okayish", "Not good"],
+}
+
+
+@pytest.fixture
+def users():
+    """Create a week of entries for each of 40 users with varied habits."""
+    rng = np.random.default_rng(11)
+    frames = {}
+    for i in range(40):
+        data = {"timestamp": pd.date_range("2026-01-05", periods=7)}
+        for field, answers in ANSWERS.items():
+            # Skew each user towards different answers
+            weights = rng.dirichlet(np.ones(len(answers)) * 0.5)
+            data[field] = rng.choice(answers, 7, p=weights)
+        frames[f"user{i:02d}"] = pd.DataFrame(data)
+
+    # One user does not track their relationship at all
+    frames["user00"] = frames["user00"].drop(columns="marriage")
+    return frames
+
+
+def _concat(frames):
+    return pd.concat(
+        [df.assign(user=user) for user, df in frames.items()], ignore_index=True
+    )
+
+
+def test_batch_matches_single_user_analyzers(users):
+    """Test that grouped scores equal one analyzer per user."""
+    results = BatchAnalyzer(_concat(users)).analyze()
+
+    assert list(results.index) == sorted(users)
+    for user, df in users.items():
+        analyzer = PersonalizationAnalyzer(df)
+        row = results.loc[user]
+        assert row["days"] == 7
+        assert row["career_score"] == analyzer.analyze_career()["score"]
+        assert row["health_score"] == analyzer.analyze_health()["score"]
+        assert row["marriage_score"] == analyzer.analyze_marriage()["score"]
+        assert row["overall_score"] == pytest.approx(analyzer.overall_score())
+        assert row["avg_sleep"] == pytest.approx(analyzer.metrics.avg_sleep)
+        assert row["focus_areas"] == analyzer.get_focus_areas()
+
+
+def test_group_analyzer_skips_fields_the_group_never_answers(users):
+    """Test that a user's own analyzer ignores fields only others track."""
+    batch = BatchAnalyzer(_concat(users))
+    analyzer = batch.analyzer("user00")
+    single = PersonalizationAnalyzer(users["user00"])
+
+    assert not analyzer.metrics.has("marriage")
+    assert analyzer.overall_score() == pytest.approx(single.overall_score())
+    assert analyzer.overall_score() == pytest.approx(
+        batch.analyze().loc["user00", "overall_score"]
+    )
+    assert analyzer.generate_weekly_report() == single.generate_weekly_report()
+
+
+def test_batch_groups_by_user_and_window(users):
+    """Test grouping by several key columns."""
+    df = _concat(users)
+    df["window"] = np.where(df["timestamp"].dt.day <= 7, "early", "late")
+    batch = BatchAnalyzer(df, by=["user", "window"])
+    results = batch.analyze()
+
+    assert results.loc[("user05", "early"), "days"] == 3
+    assert results.loc[("user05", "late"), "days"] == 4
+
+    single = PersonalizationAnalyzer(users["user05"].tail(4))
+    assert batch.analyzer(("user05", "late")).generate_weekly_report() == (
+        single.generate_weekly_report()
+    )
+
+
+def test_streaks_end_on_each_groups_last_entry(users):
+    """Test that groups ending on different days keep their own streaks."""
+    frames = {
+        "a": users["user01"].assign(coding="Yes").iloc[1:6],
+        "b": users["user02"].assign(coding="No"),
+    }
+    df = _concat(frames)
+    df["window"] = np.where(df["timestamp"].dt.day <= 7, "early", "late")
+    by_user = BatchAnalyzer(df).analyze()
+    by_window = BatchAnalyzer(df, by=["user", "window"])
+
+    # "a" logs a 5-day streak from the second day to a day before "b" stops
+    assert by_user.loc["a", "coding_streak"] == 5
+    assert by_user.loc["b", "coding_streak"] == 0
+
+    for user, window in [("a", "early"), ("a", "late"), ("b", "early")]:
+        rows = df[(df["user"] == user) & (df["window"] == window)]
+        single = PersonalizationAnalyzer(rows.drop(columns=["user", "window"]))
+        analyzer = by_window.analyzer((user, window))
+        assert analyzer.generate_weekly_report() == single.generate_weekly_report()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
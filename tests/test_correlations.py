@@ -0,0 +1,87 @@
+"""Unit tests for Alpha-X correlations module."""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from correlations import clear_cache, correlate, top_relationships
+
+SHARP = "Good, razor sharp"
+MULTITASK = "I was multi-tasking, not good focus"
+
+
+@pytest.fixture
+def history():
+    """Create 120 days where good sleep makes the next day's focus sharp."""
+    rng = np.random.default_rng(0)
+    n = 120
+    sleep = rng.choice(["5 hrs", "6 hrs", "7 hrs", "8 hrs"], n)
+    rested = np.isin(np.roll(sleep, 1), ["7 hrs", "8 hrs"])
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-01-01 21:00", periods=n),
+            "sleep": sleep,
+            "focus": np.where(rested, SHARP, MULTITASK),
+            "coding": rng.choice(["Yes", "No", None], n),
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_cache()
+
+
+def test_same_day_correlation_matches_pandas(history):
+    """Test pairwise-complete Pearson r against pandas."""
+    result = correlate(history)
+    numeric = pd.DataFrame(
+        {
+            "sleep": history["sleep"].str[0].astype(float),
+            "coding": history["coding"].map({"Yes": 1.0, "No": 0.0}),
+        }
+    )
+
+    assert result["correlation"].loc["sleep", "coding"] == pytest.approx(
+        numeric.corr().loc["sleep", "coding"]
+    )
+    assert result["pairs"].loc["sleep", "coding"] == numeric["coding"].notna().sum()
+
+
+def test_lag_finds_yesterdays_sleep_driving_focus(history):
+    """Test lagged correlation, conditional rate and lift."""
+    result = correlate(history, lag=1)
+
+    assert result["correlation"].loc["sleep", "focus"] > 0.8
+    assert result["conditional"].loc["sleep", "focus"] == pytest.approx(1.0)
+    assert result["lift"].loc["sleep", "focus"] > 1.5
+
+    top = top_relationships(result, limit=1)
+    assert (top[0]["cause"], top[0]["effect"]) == ("sleep", "focus")
+
+
+def test_days_are_not_paired_across_users(history):
+    """Test that lagging stays within each user's days."""
+    users = pd.concat([history.assign(user="a"), history.assign(user="b")])
+    result = correlate(users, lag=1, by="user")
+
+    assert result["pairs"].loc["sleep", "focus"] == 2 * (len(history) - 1)
+
+
+def test_results_are_cached_by_data_hash(history):
+    """Test that equal data hits the cache and changed data does not."""
+    first = correlate(history)
+    assert correlate(history.copy()) is first
+
+    changed = history.copy()
+    changed.loc[0, "coding"] = "No" if changed.loc[0, "coding"] == "Yes" else "Yes"
+    assert correlate(changed) is not first
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
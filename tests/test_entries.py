@@ -0,0 +1,161 @@
+"""Unit tests for Alpha-X entries module."""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from analyzer import PersonalizationAnalyzer
+from entries import (
+    ENTRY_FIELDS,
+    entries_from_rows,
+    entry_metrics,
+    entry_streaks,
+    locate_window,
+    select_window,
+)
+from habits import habit_streaks
+from metrics import compute_metrics
+from sheets_client import SheetsClient
+
+COLUMNS = [
+    "Timestamp",
+    "Did you code more than 1 hour ?",
+    "Workout ?",
+    "Sleep",
+    "Marriage goals ?",
+    "Some new question ?",
+]
+
+
+@pytest.fixture
+def rows():
+    """Create raw sheet rows, out of order, with blanks and a missed day."""
+    return [
+        ["01/07/2026 21:00:00", "Yes", "No", "8 hrs", "Good", "x"],
+        ["01/05/2026 21:00:00", "Yes", "Yes", "7 hrs", "Okayish", "x"],
+        ["01/06/2026 21:00:00", "No", "Yes", "", "Good", "x"],
+        ["01/09/2026 21:00:00", "Yes", "Yes", ">=10 hrs", "", "x"],
+        ["01/10/2026 21:00:00", "Yes", "No", "6 hrs", "Not good", "x"],
+        ["01/11/2026 21:00:00", "Yes", "Yes", "5 hrs", "Good", "x"],
+        ["", "Yes", "Yes", "5 hrs", "Good", "x"],
+    ]
+
+
+@pytest.fixture
+def frame(rows):
+    """The same rows as the normalized DataFrame of the pandas engine."""
+    client = SheetsClient(sheet_id="test", snapshot_dir=None, aggregates_dir=None)
+    df = client._to_dataframe(COLUMNS, [list(row) for row in rows])
+    return df[df["timestamp"].notna()].sort_values("timestamp", ignore_index=True)
+
+
+def test_entries_from_rows(rows):
+    """Test mapping, sorting, blanks and unknown columns."""
+    entries = entries_from_rows(COLUMNS, rows)
+
+    assert len(entries) == 6
+    assert [e.timestamp.day for e in entries] == [5, 6, 7, 9, 10, 11]
+    assert entries[1].coding == "No"
+    assert entries[1].sleep is None
+    # Fields the sheet does not have stay unset; slots forbid anything else
+    assert not hasattr(entries[0], "protein")
+    with pytest.raises(AttributeError):
+        entries[0].some_new_question = "x"
+    assert not hasattr(entries[0], "__dict__")
+
+
+def test_entry_metrics_match_dataframe_engine(rows, frame):
+    """Test that counts and means equal compute_metrics on the same rows."""
+    entries = entries_from_rows(COLUMNS, rows)
+    window = select_window(
+        entries, pd.Timestamp(2026, 1, 6), pd.Timestamp(2026, 1, 10, 23)
+    )
+
+    lite = entry_metrics(window)
+    expected = compute_metrics(frame.iloc[1:5])
+
+    assert lite.total_days == expected.total_days == 4
+    assert lite.start == expected.start
+    for field, counts in expected.counts.items():
+        if field not in ENTRY_FIELDS:
+            # Columns the form mapping does not know are not kept
+            assert field not in lite.counts
+            continue
+        assert lite.counts[field] == {a: n for a, n in counts.items() if n}
+    assert lite.avg_sleep == pytest.approx(expected.avg_sleep)
+    assert lite.mean("marriage") == pytest.approx(expected.mean("marriage"))
+
+
+def test_entry_streaks_match_habit_matrix(rows, frame):
+    """Test streaks over the history and a window against HabitMatrix."""
+    entries = entries_from_rows(COLUMNS, rows)
+    start, end = pd.Timestamp(2026, 1, 7), pd.Timestamp(2026, 1, 10, 23)
+
+    for window in [(None, None), (start, end)]:
+        expected = habit_streaks(frame, *window)
+        lite = pd.DataFrame(entry_streaks(entries, *window)).T
+
+        assert list(lite.index) == list(expected.index)
+        np.testing.assert_allclose(
+            lite[expected.columns].to_numpy(float), expected.to_numpy(float)
+        )
+
+
+def test_lite_analyzer_report_matches(rows, frame):
+    """Test that the weekly report is identical on both engines."""
+    entries = entries_from_rows(COLUMNS, rows)
+    lite = PersonalizationAnalyzer(
+        metrics=entry_metrics(entries), streaks=entry_streaks(entries)
+    )
+
+    assert lite.df is None
+    assert lite.generate_weekly_report() == (
+        PersonalizationAnalyzer(frame).generate_weekly_report()
+    )
+
+
+def test_unlisted_timestamp_format_is_inferred(rows):
+    """Test that timestamps in no known format are read like pandas does."""
+    import pandas as pd
+
+    slashed = [[f"2026/01/{day:02d} 21:00:00"] for day in range(5, 12)]
+    entries = entries_from_rows(["Timestamp"], slashed)
+
+    assert [entry.timestamp for entry in entries] == list(
+        pd.to_datetime([row[0] for row in slashed])
+    )
+    stamps = [row[0] for row in slashed]
+    assert locate_window(stamps, start=datetime(2026, 1, 9)) == (4, 7)
+
+
+def test_locate_window_in_raw_timestamps():
+    """Test binary search of a window in a column with blank cells."""
+    stamps = [
+        "01/05/2026 21:00:00",
+        "01/06/2026 21:00:00",
+        "",
+        "01/08/2026 21:00:00",
+        "not a date",
+        "01/10/2026 21:00:00",
+    ]
+
+    assert locate_window(stamps) == (0, 6)
+    assert locate_window(stamps, datetime(2026, 1, 6), datetime(2026, 1, 8, 21)) == (
+        1,
+        5,
+    )
+    assert locate_window(stamps, start=datetime(2026, 1, 9)) == (5, 6)
+    assert locate_window(stamps, last=2) == (4, 6)
+    assert locate_window(stamps, end=datetime(2026, 1, 6, 23), last=5) == (0, 3)
+    assert locate_window(stamps, start=datetime(2027, 1, 1)) == (6, 6)
+    assert locate_window([], last=7) == (0, 0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
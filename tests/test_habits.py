@@ -0,0 +1,75 @@
+"""Unit tests for Alpha-X habits module."""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from habits import HabitMatrix, habit_streaks
+
+
+@pytest.fixture
+def history():
+    """Create entries for Jan 1-10 with Jan 4 not logged."""
+    days = [1, 2, 3, 5, 6, 7, 8, 9, 10]
+    return pd.DataFrame(
+        {
+            "timestamp": [pd.Timestamp(2026, 1, d, 21) for d in days],
+            "coding": ["Yes", "Yes", "Yes", "Yes", "No", "Yes", "Yes", "Yes", "Yes"],
+            "workout": ["No"] * 8 + ["Yes"],
+            "marriage": ["Good"] * 9,
+        }
+    )
+
+
+def test_streaks_over_full_history(history):
+    """Test streaks, gaps and completion across the whole history."""
+    streaks = habit_streaks(history)
+
+    assert list(streaks.index) == ["coding", "workout"]
+    coding = streaks.loc["coding"]
+    assert coding["current_streak"] == 4  # Jan 7-10
+    assert coding["longest_streak"] == 4
+    assert coding["gaps"] == 2  # Unlogged Jan 4, missed Jan 6
+    assert coding["done_days"] == 8
+    assert coding["logged_days"] == 9
+    assert coding["completion_rate"] == pytest.approx(8 / 9)
+    assert streaks.loc["workout", "current_streak"] == 1
+
+
+def test_current_streak_reaches_before_window(history):
+    """Test that a window's current streak counts days before its start."""
+    streaks = habit_streaks(history, start="2026-01-09", end="2026-01-09")
+
+    assert streaks.loc["coding", "current_streak"] == 3  # Jan 7-9
+    assert streaks.loc["coding", "longest_streak"] == 1
+    assert streaks.loc["workout", "current_streak"] == 0
+
+
+def test_matrix_is_bit_packed_per_user(history):
+    """Test one packed row per (user, habit) and per-user results."""
+    users = pd.concat(
+        [history.assign(user="ann"), history.assign(user="bob", coding="No")]
+    )
+    matrix = HabitMatrix.from_history(users, by="user")
+
+    assert matrix.bits.dtype == np.uint8
+    assert matrix.bits.shape == (4, 2)  # 10 days fit in 2 bytes
+    streaks = matrix.streaks()
+    assert streaks.loc[("ann", "coding"), "current_streak"] == 4
+    assert streaks.loc[("bob", "coding"), "current_streak"] == 0
+
+
+def test_no_habits_or_timestamps():
+    """Test inputs without anything to track."""
+    assert habit_streaks(pd.DataFrame({"coding": ["Yes"]})).empty
+    empty = habit_streaks(pd.DataFrame({"timestamp": [pd.Timestamp(2026, 1, 1)]}))
+    assert empty.empty
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,91 @@
+"""Unit tests for Alpha-X import profile module."""
+
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import STARTUP_BUDGET_MS
+from import_profile import (
+    ENTRY_POINTS,
+    SRC_DIR,
+    main,
+    parse_importtime,
+    profile_import,
+)
+
+
+def test_parse_importtime():
+    """Test parsing the -X importtime report."""
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       176 |        176 |   _io",
+            "import time:      1500 |       2100 | config",
+            "unrelated line",
+        ]
+    )
+
+    modules = parse_importtime(output)
+
+    assert modules == [
+        {"name": "_io", "self_ms": 0.176, "cumulative_ms": 0.176},
+        {"name": "config", "self_ms": 1.5, "cumulative_ms": 2.1},
+    ]
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_points_defer_heavy_dependencies(module):
+    """Test that entry points import within budget, without pandas, twilio, ..."""
+    profile = profile_import(module)
+
+    assert profile["heavy"] == []
+    assert profile["total_ms"] <= STARTUP_BUDGET_MS
+
+
+def test_budget_check_fails_over_budget():
+    """Test that the CLI check fails for an entry point over its budget."""
+    assert main(["scheduler"], budget=STARTUP_BUDGET_MS)
+    assert not main(["scheduler"], budget=0)
+
+
+def test_weekly_report_from_entries_never_loads_pandas():
+    """Test that a small-window report runs end to end without pandas."""
+    script = """
+import sys
+from analyzer import PersonalizationAnalyzer
+from entries import entry_metrics, entry_streaks
+from sheets_client import SheetsClient
+
+class Worksheet:
+    def row_values(self, row):
+        return ["Timestamp", "Did you code more than 1 hour ?", "Sleep"]
+
+    def batch_get(self, ranges):
+        return [[["01/0%d/2026 21:00:00" % d, "Yes", "7 hrs"] for d in range(1, 8)]]
+
+client = SheetsClient(sheet_id="test", snapshot_dir=None, aggregates_dir=None)
+client.worksheet = Worksheet()
+entries = client.get_entries()
+analyzer = PersonalizationAnalyzer(
+    metrics=entry_metrics(entries), streaks=entry_streaks(entries)
+)
+assert "Coding" in analyzer.generate_weekly_report()
+print("pandas" in sys.modules, "numpy" in sys.modules)
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.split()[-2:] == ["False", "False"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
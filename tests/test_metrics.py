@@ -0,0 +1,100 @@
+"""Unit tests for Alpha-X metrics module."""
+
+import pytest
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from metrics import add_value_columns, compute_metrics, count_answers, sleep_hours
+
+
+@pytest.fixture
+def sample_data():
+    """Create a small window with plain and categorical answers."""
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2026-01-05", periods=5),
+            "coding": ["Yes", "No", "Yes", None, "Yes"],
+            "workout": pd.Categorical(
+                ["Yes", "Yes", "No", "Yes", "No"], categories=["Yes", "No", "Rest"]
+            ),
+            "sleep": ["7 hrs", "6 hrs", ">=10 hrs", "8 hrs", "no idea"],
+        }
+    )
+
+
+def test_count_answers_matches_value_counts(sample_data):
+    """Test that the single-pass counts agree with per-column scans."""
+    counts = count_answers(sample_data)
+
+    for field in ["coding", "workout", "sleep"]:
+        expected = sample_data[field].value_counts().to_dict()
+        assert {k: v for k, v in counts[field].items() if v} == {
+            k: v for k, v in expected.items() if v
+        }
+
+
+def test_count_answers_keeps_unused_categories(sample_data):
+    """Test that known-but-unused answers are reported as zero."""
+    counts = count_answers(sample_data)
+
+    assert counts["workout"]["Rest"] == 0
+    assert "timestamp" not in counts
+
+
+def test_window_metrics(sample_data):
+    """Test derived rates and sleep statistics."""
+    m = compute_metrics(sample_data)
+
+    assert m.total_days == 5
+    assert m.has("coding") and not m.has("marriage")
+    assert m.count("coding", "Yes") == 3
+    assert m.rate("workout", "Yes") == pytest.approx(0.6)
+    assert m.avg_sleep == pytest.approx((7 + 6 + 10 + 8) / 4)
+    assert m.sleep_nights_between(7, 8) == 2
+    assert m.start == pd.Timestamp("2026-01-05")
+
+
+def test_empty_window():
+    """Test metrics for a window without rows."""
+    m = compute_metrics(pd.DataFrame({"coding": pd.Series([], dtype=object)}))
+
+    assert m.total_days == 0
+    assert m.rate("coding", "Yes") == 0
+    assert m.avg_sleep is None
+
+
+def test_sleep_hours_parsing():
+    """Test hour extraction from sleep answers."""
+    assert sleep_hours("7 hrs") == 7
+    assert sleep_hours(">=10 hrs") == 10
+    assert sleep_hours("7") is None
+    assert sleep_hours(None) is None
+
+
+def test_value_columns_map_answers_to_numbers():
+    """Test the answer -> number table applied over whole columns."""
+    df = add_value_columns(
+        pd.DataFrame(
+            {
+                "sleep": ["7 hrs", "<5 hrs", None, "11 hrs"],
+                "happiness": ["Yes, I am happy", "No, I performed bad", None, "?"],
+            }
+        )
+    )
+
+    assert df["sleep_value"].tolist()[:2] == [7.0, 5.0]
+    assert pd.isna(df["sleep_value"][2]) and df["sleep_value"][3] == 11.0
+    assert df["happiness_value"].tolist()[:2] == [1.0, 0.0]
+    assert df["happiness_value"][2:].isna().all()
+
+    m = compute_metrics(df)
+    assert m.mean("happiness") == pytest.approx(0.5)
+    assert "sleep_value" not in m.counts
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
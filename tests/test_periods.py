@@ -0,0 +1,147 @@
+"""Tests for the period report engine."""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import config
+from aggregates import RunningAggregates
+from analyzer import PersonalizationAnalyzer, period_thresholds
+from batch_analyzer import BatchAnalyzer
+from metrics import add_value_columns
+from periods import CUSTOM, period_range, period_report
+from report import render
+from summarize_last_month import generate_detailed_monthly_summary
+
+
+@pytest.fixture
+def history():
+    """Half a year of entries, coding more and more often."""
+    n = 180
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2026-01-01 21:00", periods=n),
+            "coding": ["Yes" if i % 10 < 3 + i // 30 else "No" for i in range(n)],
+            "workout": ["Yes" if i % 3 else "No" for i in range(n)],
+            "sunshine": ["Yes" if i % 4 else "No" for i in range(n)],
+            "sleep": ["7 hrs", "8 hrs", "6 hrs"] * (n // 3),
+            "happiness": ["Yes, I am happy", "Slightly Neutral, could do better"]
+            * (n // 2),
+            "day_overview": [
+                "Did hard work - enjoyed",
+                "Procrastinated",
+                "Did hard work - enjoyed",
+            ]
+            * (n // 3),
+        }
+    )
+    return add_value_columns(df)
+
+
+def test_thresholds_scale_with_the_period(monkeypatch):
+    """Test that day counts scale with the period and can be overridden."""
+    week = period_thresholds("week")
+    assert {k: week[k] for k in config.WEEKLY_DAY_THRESHOLDS} == (
+        config.WEEKLY_DAY_THRESHOLDS
+    )
+    assert period_thresholds("month")["goal_days"] == 21
+    assert period_thresholds("year")["sunshine_days"] == 261
+    assert period_thresholds(CUSTOM, days=14)["lazy_days"] == 6
+    assert period_thresholds("month")["coding_good_rate"] == week["coding_good_rate"]
+
+    month = dict(config.REPORT_PERIODS["month"], thresholds={"goal_days": 10})
+    monkeypatch.setitem(config.REPORT_PERIODS, "month", month)
+    assert period_thresholds("month")["goal_days"] == 10
+
+    with pytest.raises(ValueError):
+        period_thresholds(CUSTOM)
+
+
+def test_period_range():
+    """Test period bounds and their errors."""
+    end = datetime(2026, 3, 31)
+    assert period_range("month", end) == (datetime(2026, 3, 1), end)
+    assert period_range(CUSTOM, end, datetime(2026, 1, 1))[0] == datetime(2026, 1, 1)
+    with pytest.raises(ValueError):
+        period_range("fortnight", end)
+    with pytest.raises(ValueError):
+        period_range(CUSTOM, end)
+
+
+@pytest.mark.parametrize("period", ["week", "month", "quarter", "year"])
+def test_every_period_shares_the_analysis(history, period):
+    """Test that each period is the analyzer run on its slice of the history."""
+    end = datetime(2026, 6, 29, 23, 59)
+    start, _ = period_range(period, end)
+    report = period_report(history, period, end=end)
+
+    window = history[(history["timestamp"] >= start) & (history["timestamp"] <= end)]
+    analyzer = PersonalizationAnalyzer(window, period=period)
+    assert report.days == len(window)
+    assert report.score == pytest.approx(analyzer.overall_score())
+    assert report.sections["health"] == analyzer.report().sections["health"]
+
+    label = config.REPORT_PERIODS[period]["label"]
+    assert render(report).startswith(f"📊 {label} Report (")
+    # Trends only for periods of two weeks or more
+    assert bool(report.sections["trends"]["insights"]) == (period != "week")
+
+
+def test_running_totals_give_the_same_report(history):
+    """Test that aggregated metrics give the same report as counting."""
+    end = datetime(2026, 6, 29, 23, 59)
+    start, _ = period_range("quarter", end)
+    totals = RunningAggregates().update(history)
+
+    assert period_report(
+        history, "quarter", end=end, metrics=totals.window(start, end)
+    ) == period_report(history, "quarter", end=end)
+
+
+def test_custom_range_and_wording(history):
+    """Test a custom range report and its period wording."""
+    report = period_report(
+        history, CUSTOM, start=datetime(2026, 2, 1), end=datetime(2026, 3, 15)
+    )
+    text = render(report, "summary")
+
+    assert text.startswith("📊 Period Report (Feb 01-Mar 14, 2026)")
+    assert "Period's Win" in text
+    assert "📆 TRENDS" in text
+    assert report.to_dict()["period"] == CUSTOM
+
+
+def test_monthly_summary_uses_the_engine(history):
+    """Test that the monthly summary is the month's report plus focus areas."""
+    month = history.iloc[-30:]
+    summary = generate_detailed_monthly_summary(month)
+
+    analyzer = PersonalizationAnalyzer(month, period="month")
+    assert summary == analyzer.render("summary")
+    assert summary.startswith("📊 Monthly Report (")
+    assert "🎯 Focus Areas for Next Month:" in summary
+    assert generate_detailed_monthly_summary(pd.DataFrame()).startswith("❌")
+
+
+def test_batch_scores_follow_the_period(history):
+    """Test that batch scoring uses the period's thresholds."""
+    months = history.assign(user="u1", month=history["timestamp"].dt.month)
+    batch = BatchAnalyzer(months, by=["user", "month"], period="month")
+    results = batch.analyze()
+
+    for (user, month), row in results.iterrows():
+        analyzer = PersonalizationAnalyzer(
+            history[history["timestamp"].dt.month == month], period="month"
+        )
+        assert row["health_score"] == analyzer.analyze_health()["score"]
+        assert row["overall_score"] == pytest.approx(analyzer.overall_score())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,122 @@
+"""Unit tests for Alpha-X request budget module."""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from quota import RequestBudget
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep just moves time forward."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = FakeResponse(status_code, headers)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_budget(clock, **kwargs):
+    return RequestBudget(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_bucket_paces_requests_to_rate(clock):
+    """Test that requests beyond the burst wait for new tokens."""
+    budget = make_budget(clock, requests_per_minute=60, burst=2)
+
+    for _ in range(4):
+        budget.acquire()
+
+    assert budget.stats()["requests"] == 4
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_throttled_call_is_retried_and_counted(clock):
+    """Test that a 429 is retried with backoff and lowers the rate."""
+    budget = make_budget(clock, requests_per_minute=60, burst=5)
+    attempts = []
+
+    def flaky():
+        attempts.append(clock.now)
+        if len(attempts) < 3:
+            raise FakeAPIError(429)
+        return "ok"
+
+    assert budget.call(flaky) == "ok"
+
+    stats = budget.stats()
+    assert len(attempts) == 3
+    assert stats["throttled"] == 2
+    assert stats["retried"] == 2
+    assert stats["requests_per_minute"] < 60
+
+
+def test_retry_after_header_is_respected(clock):
+    """Test that the server's Retry-After hint sets the minimum delay."""
+    budget = make_budget(clock, burst=5)
+    calls = []
+
+    def throttled_once():
+        calls.append(1)
+        if len(calls) == 1:
+            raise FakeAPIError(429, {"Retry-After": "7"})
+        return "ok"
+
+    budget.call(throttled_once)
+
+    assert max(clock.sleeps) >= 7
+
+
+def test_non_retryable_errors_are_raised_immediately(clock):
+    """Test that e.g. a 403 is not retried."""
+    budget = make_budget(clock)
+
+    with pytest.raises(FakeAPIError):
+        budget.call(lambda: (_ for _ in ()).throw(FakeAPIError(403)))
+
+    assert budget.stats()["retried"] == 0
+
+
+def test_gives_up_after_max_retries(clock):
+    """Test that persistent throttling eventually raises."""
+    budget = make_budget(clock, max_retries=2, burst=5)
+
+    def always_throttled():
+        raise FakeAPIError(429)
+
+    with pytest.raises(FakeAPIError):
+        budget.call(always_throttled)
+
+    stats = budget.stats()
+    assert stats["retried"] == 2
+    assert stats["failed"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
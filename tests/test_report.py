@@ -0,0 +1,110 @@
+"""Tests for the immutable report and its renderers."""
+
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from analyzer import PersonalizationAnalyzer
+from report import RENDERERS, Report, render, renderer, write_report
+
+
+@pytest.fixture
+def analyzer():
+    """Analyzer over one week of entries."""
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2026-01-05", periods=7),
+            "coding": ["Yes", "Yes", "No", "Yes", "Yes", "Yes", "No"],
+            "focus": ["Good, razor sharp"] * 2
+            + ["I was multi-tasking, not good focus"] * 5,
+            "protein": [">= 100g"] * 6 + ["< 100g"],
+            "workout": ["Yes"] * 5 + ["No"] * 2,
+            "sleep": ["7 hrs", "6 hrs", "7 hrs", "8 hrs", "6 hrs", "7 hrs", "6 hrs"],
+            "happiness": ["Yes, I am happy"] * 5
+            + ["Slightly Neutral, could do better"] * 2,
+        }
+    )
+    return PersonalizationAnalyzer(df)
+
+
+def test_report_is_computed_once_and_read_only(analyzer):
+    """Rendering reuses the cached report, which cannot be modified."""
+    report = analyzer.report()
+    analyzer.render("json")
+    analyzer.render("html")
+    assert analyzer.report() is report
+
+    with pytest.raises(AttributeError):
+        report.score = 100
+    with pytest.raises(TypeError):
+        report.sections["career"]["insights"] = ()
+    assert isinstance(report.sections["career"]["insights"], tuple)
+
+
+def test_text_renderer_is_the_weekly_report(analyzer):
+    """The text renderer gives the WhatsApp report."""
+    text = render(analyzer.report(), "text")
+    assert text == analyzer.generate_weekly_report()
+    assert text.startswith("📊 Weekly Report (Jan 05-Jan 11, 2026)")
+    assert "📋 Currently tracking: 3 goal(s)" in text
+
+
+def test_json_round_trip(analyzer):
+    """JSON output rebuilds an equal report that renders the same text."""
+    report = analyzer.report()
+    data = json.loads(render(report, "json"))
+    assert data["days"] == 7
+    assert data["score"] == pytest.approx(analyzer.overall_score())
+    assert data["focus_areas"] == analyzer.get_focus_areas()
+
+    restored = Report.from_dict(data)
+    assert restored == report
+    assert render(restored) == render(report)
+
+
+def test_html_renderer_escapes_text(analyzer):
+    """HTML output lists the insights, escaped."""
+    page = render(analyzer.report(), "html")
+    assert page.startswith('<article class="report">')
+    assert "<h2>🎯 CAREER GROWTH" in page
+    assert "&gt;= 100g" in page
+    assert ">= 100g" not in page
+
+
+def test_custom_renderer_and_unknown_format(analyzer, tmp_path):
+    """Renderers can be registered; unknown formats are rejected."""
+
+    @renderer("days")
+    def render_days(report):
+        return str(report.days)
+
+    try:
+        assert analyzer.render("days") == "7"
+    finally:
+        del RENDERERS["days"]
+
+    with pytest.raises(ValueError):
+        analyzer.render("pdf")
+
+    path = write_report(analyzer.report(), tmp_path / "week.html")
+    assert path.read_text(encoding="utf-8") == analyzer.render("html")
+    with pytest.raises(ValueError):
+        write_report(analyzer.report(), tmp_path / "week.pdf")
+
+
+def test_empty_report():
+    """Every renderer handles a window without entries."""
+    report = PersonalizationAnalyzer(pd.DataFrame()).report()
+    assert render(report) == "❌ No data available for this week"
+    assert json.loads(render(report, "json"))["start"] is None
+    assert "No data" in render(report, "html")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,659 @@
+"""Unit tests for Alpha-X sheets client module."""
+
+import json
+import re
+import pytest
+import pandas as pd
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import gspread
+import sheets_client
+from google.oauth2.service_account import Credentials
+from quota import RequestBudget
+from sheets_client import (
+    SheetsClient,
+    TimestampParser,
+    slice_time_range,
+    sort_by_timestamp,
+)
+
+
+HEADER = ["Timestamp", "Did you code more than 1 hour ?", "Workout ?", "Sleep"]
+
+
+def _column_index(letters):
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - ord("A") + 1)
+    return index
+
+
+class FakeSpreadsheet:
+    """In-memory stand-in for a gspread spreadsheet."""
+
+    def __init__(self, revision="rev-1"):
+        self.revision = revision
+
+    def get_lastUpdateTime(self):
+        return self.revision
+
+
+class FakeWorksheet:
+    """In-memory stand-in for a gspread worksheet."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.requests = []
+
+    def row_values(self, row):
+        self.requests.append(f"row {row}")
+        return list(self.rows[row - 1]) if row <= len(self.rows) else []
+
+    def batch_get(self, ranges):
+        return [self.get(range_name) for range_name in ranges]
+
+    def get(self, range_name):
+        self.requests.append(range_name)
+        match = re.fullmatch(r"([A-Z]+)(\d+):([A-Z]+)(\d*)", range_name)
+        first_col = _column_index(match.group(1)) - 1
+        last_col = _column_index(match.group(3))
+        first_row = int(match.group(2)) - 1
+        last_row = int(match.group(4)) if match.group(4) else len(self.rows)
+        return [row[first_col:last_col] for row in self.rows[first_row:last_row]]
+
+
+def _ranges(worksheet):
+    """Return requested ranges without their end row, e.g. 'A5:D'."""
+    return [re.sub(r"(:[A-Z]+)\d+$", r"\1", r) for r in worksheet.requests]
+
+
+def _make_rows(days):
+    rows = [list(HEADER)]
+    for i in range(days):
+        rows.append([f"1/{i + 5}/2026 21:00:00", "Yes", "No", "7 hrs"])
+    return rows
+
+
+@pytest.fixture(autouse=True)
+def unlimited_budget(monkeypatch):
+    """Keep the shared request budget from pacing the tests."""
+    monkeypatch.setattr(
+        sheets_client,
+        "REQUEST_BUDGET",
+        RequestBudget(requests_per_minute=1e9, burst=1_000_000),
+    )
+
+
+@pytest.fixture
+def client():
+    """Create a client backed by a fake worksheet."""
+    client = SheetsClient(snapshot_dir=None)
+    client.worksheet = FakeWorksheet(_make_rows(3))
+    return client
+
+
+def test_get_all_data_normalizes_columns(client):
+    """Test that column names are mapped and timestamps parsed."""
+    df = client.get_all_data()
+
+    assert len(df) == 3
+    assert {"timestamp", "coding", "workout", "sleep"} <= set(df.columns)
+    assert pd.api.types.is_datetime64_any_dtype(df["timestamp"])
+
+
+def test_incremental_fetch_requests_only_new_rows(client):
+    """Test that a second fetch only asks for rows below the last one seen."""
+    client.get_all_data()
+    client.worksheet.rows.append(["1/8/2026 21:00:00", "No", "Yes", "8 hrs"])
+    client.worksheet.requests.clear()
+    client.invalidate_cache()
+
+    df = client.get_all_data()
+
+    assert len(df) == 4
+    assert "A5:D" in _ranges(client.worksheet)
+    assert df["coding"].tolist() == ["Yes", "Yes", "Yes", "No"]
+
+
+def test_edited_row_triggers_full_refetch(client):
+    """Test that an answer edited in place is picked up after a new revision."""
+    client.spreadsheet = FakeSpreadsheet("rev-1")
+    client.get_all_data()
+    client.worksheet.rows[2][1] = "No"
+    client.spreadsheet.revision = "rev-2"
+    client.worksheet.requests.clear()
+    client.invalidate_cache()
+
+    df = client.get_all_data()
+
+    assert df["coding"].tolist() == ["Yes", "No", "Yes"]
+    assert "A2:D" in _ranges(client.worksheet)
+
+
+def test_deleted_row_triggers_full_refetch(client):
+    """Test that a deleted row does not hide the next appended one."""
+    client.get_all_data()
+    del client.worksheet.rows[1]
+    client.worksheet.rows.append(["1/9/2026 21:00:00", "No", "Yes", "8 hrs"])
+    client.worksheet.requests.clear()
+    client.invalidate_cache()
+
+    df = client.get_all_data()
+
+    assert df["timestamp"].dt.day.tolist() == [6, 7, 9]
+    assert "A2:D" in _ranges(client.worksheet)
+
+
+def test_weekly_run_reads_only_new_rows(client):
+    """Test that the weekly report reuses the incrementally fetched history."""
+    from main import load_week
+
+    load_week(client, weeks_ago=0)
+    client.worksheet.rows.append(["1/8/2026 21:00:00", "No", "Yes", "8 hrs"])
+    client.worksheet.requests.clear()
+    client.invalidate_cache()
+
+    load_week(client, weeks_ago=0)
+
+    assert "A5:D" in _ranges(client.worksheet)
+    assert "A2:D" not in _ranges(client.worksheet)
+
+
+def test_fetch_reports_only_rows_it_read(client, capsys):
+    """Test that a revalidation without new rows reports no fetch."""
+    client.get_all_data()
+    assert "Fetched 3 new row(s)" in capsys.readouterr().out
+    client.invalidate_cache()
+
+    client.get_all_data()
+
+    assert "Fetched" not in capsys.readouterr().out
+
+
+def test_header_change_triggers_full_refetch(client):
+    """Test that a changed header row discards the local history."""
+    client.get_all_data()
+    client.worksheet.rows[0][3] = "Sleep hours"
+    client.worksheet.requests.clear()
+    client.invalidate_cache()
+
+    df = client.get_all_data()
+
+    assert len(df) == 3
+    assert "A2:D" in _ranges(client.worksheet)
+    assert "Sleep hours" in df.columns
+
+
+def test_non_incremental_fetch_downloads_everything():
+    """Test that incremental mode can be disabled."""
+    client = SheetsClient(incremental=False, snapshot_dir=None, cache_ttl=0)
+    client.worksheet = FakeWorksheet(_make_rows(3))
+    client.get_all_data()
+    client.worksheet.requests.clear()
+
+    df = client.get_all_data()
+
+    assert len(df) == 3
+    assert "A2:D" in _ranges(client.worksheet)
+
+
+def test_cached_data_is_reused_within_ttl(client):
+    """Test that window queries inside the TTL share one fetch."""
+    client.get_all_data()
+    client.worksheet.requests.clear()
+
+    client.get_weekly_data(weeks_ago=1)
+    client.get_date_range_data(pd.Timestamp("2026-01-01"), pd.Timestamp("2026-01-31"))
+
+    assert client.worksheet.requests == []
+
+
+def test_expired_cache_checks_sheet_again(client):
+    """Test that a zero TTL revalidates on every call."""
+    client.cache_ttl = 0
+    client.get_all_data()
+    client.worksheet.requests.clear()
+
+    client.get_all_data()
+
+    assert client.worksheet.requests != []
+
+
+def test_snapshot_skips_fetch_when_revision_unchanged(tmp_path):
+    """Test that a fresh client serves an unchanged sheet from the snapshot."""
+    worksheet = FakeWorksheet(_make_rows(3))
+
+    first = SheetsClient(snapshot_dir=tmp_path)
+    first.sheet_id = "sheet-123"
+    first.spreadsheet = FakeSpreadsheet()
+    first.worksheet = worksheet
+    expected = first.get_all_data()
+
+    second = SheetsClient(snapshot_dir=tmp_path)
+    second.sheet_id = "sheet-123"
+    second.spreadsheet = FakeSpreadsheet()
+    second.worksheet = worksheet
+    worksheet.requests.clear()
+
+    df = second.get_all_data()
+
+    assert worksheet.requests == []
+    assert df["coding"].tolist() == expected["coding"].tolist()
+    assert df["timestamp"].tolist() == expected["timestamp"].tolist()
+
+
+def test_snapshot_fetches_only_tail_after_revision_change(tmp_path):
+    """Test that a changed revision only reads rows missing from the snapshot."""
+    worksheet = FakeWorksheet(_make_rows(3))
+
+    first = SheetsClient(snapshot_dir=tmp_path)
+    first.sheet_id = "sheet-123"
+    first.spreadsheet = FakeSpreadsheet("rev-1")
+    first.worksheet = worksheet
+    first.get_all_data()
+
+    worksheet.rows.append(["1/8/2026 21:00:00", "No", "Yes", "8 hrs"])
+    worksheet.requests.clear()
+
+    second = SheetsClient(snapshot_dir=tmp_path)
+    second.sheet_id = "sheet-123"
+    second.spreadsheet = FakeSpreadsheet("rev-2")
+    second.worksheet = worksheet
+    df = second.get_all_data()
+
+    assert len(df) == 4
+    assert "A5:D" in _ranges(worksheet)
+    assert df["coding"].tolist() == ["Yes", "Yes", "Yes", "No"]
+
+
+def test_snapshot_is_rebuilt_after_rows_change(tmp_path):
+    """Test that a new revision with edited rows replaces the snapshot."""
+    worksheet = FakeWorksheet(_make_rows(3))
+
+    def cold_start(revision):
+        client = SheetsClient(snapshot_dir=tmp_path)
+        client.sheet_id = "sheet-123"
+        client.spreadsheet = FakeSpreadsheet(revision)
+        client.worksheet = worksheet
+        return client.get_all_data()
+
+    cold_start("rev-1")
+    del worksheet.rows[1]
+    worksheet.rows[1][1] = "No"
+    worksheet.rows.append(["1/9/2026 21:00:00", "No", "Yes", "8 hrs"])
+
+    assert cold_start("rev-2")["coding"].tolist() == ["No", "Yes", "No"]
+
+    worksheet.requests.clear()
+    df = cold_start("rev-2")
+    assert worksheet.requests == []
+    assert df["timestamp"].dt.day.tolist() == [6, 7, 9]
+    assert df["coding"].tolist() == ["No", "Yes", "No"]
+
+
+def test_snapshot_without_row_fingerprint_is_ignored(tmp_path):
+    """Test that a snapshot whose rows cannot be checked is refetched."""
+    worksheet = FakeWorksheet(_make_rows(3))
+    client = SheetsClient(snapshot_dir=tmp_path)
+    client.sheet_id = "sheet-123"
+    client.spreadsheet = FakeSpreadsheet()
+    client.worksheet = worksheet
+    client.get_all_data()
+
+    meta_path = tmp_path / "sheet-123" / "meta.json"
+    meta = json.loads(meta_path.read_text())
+    del meta["info"]["stamps_hash"]
+    meta_path.write_text(json.dumps(meta))
+    worksheet.requests.clear()
+
+    second = SheetsClient(snapshot_dir=tmp_path)
+    second.sheet_id = "sheet-123"
+    second.spreadsheet = FakeSpreadsheet()
+    second.worksheet = worksheet
+
+    assert len(second.get_all_data()) == 3
+    assert "A2:D" in _ranges(worksheet)
+
+
+def test_window_metrics_come_from_running_totals(tmp_path):
+    """Test window metrics across runs with rows appended in between."""
+    worksheet = FakeWorksheet(_make_rows(3))
+
+    first = SheetsClient(snapshot_dir=None, aggregates_dir=tmp_path, cache_ttl=0)
+    first.sheet_id = "sheet-123"
+    first.worksheet = worksheet
+    assert first.get_window_metrics().count("coding", "Yes") == 3
+
+    worksheet.rows.append(["1/8/2026 21:00:00", "No", "Yes", "9 hrs"])
+    second = SheetsClient(snapshot_dir=None, aggregates_dir=tmp_path)
+    second.sheet_id = "sheet-123"
+    second.worksheet = worksheet
+    m = second.get_window_metrics(start=datetime(2026, 1, 7))
+
+    assert m.total_days == 2
+    assert m.count("coding", "No") == 1
+    assert m.avg_sleep == pytest.approx(8)
+
+
+def test_answers_are_integer_coded(client):
+    """Test that answers use the fixed vocabulary and keep unknown values."""
+    client.worksheet.rows[2][2] = "Rest day"
+    df = client.get_all_data()
+
+    assert isinstance(df["coding"].dtype, pd.CategoricalDtype)
+    assert list(df["coding"].cat.categories) == ["Yes", "No"]
+    assert list(df["workout"].cat.categories) == ["Yes", "No", "Rest day"]
+    assert (df["workout"] == "Rest day").sum() == 1
+
+
+def test_incremental_merge_keeps_categoricals(client):
+    """Test that new answers in a tail fetch do not decay columns to objects."""
+    client.get_all_data()
+    client.worksheet.rows.append(["1/8/2026 21:00:00", "Maybe", "Yes", "8 hrs"])
+    client.invalidate_cache()
+
+    df = client.get_all_data()
+
+    assert isinstance(df["coding"].dtype, pd.CategoricalDtype)
+    assert df["coding"].tolist() == ["Yes", "Yes", "Yes", "Maybe"]
+
+
+def test_timestamp_parser_detects_format_once():
+    """Test explicit format detection and fallback for odd values."""
+    parser = TimestampParser()
+    parsed = parser.parse(
+        pd.Series(["1/13/2026 21:00:00", "2026-01-14 08:30:00", ""])
+    )
+
+    assert parser.format == "%m/%d/%Y %H:%M:%S"
+    assert parsed.iloc[0] == pd.Timestamp("2026-01-13 21:00:00")
+    assert parsed.iloc[1] == pd.Timestamp("2026-01-14 08:30:00")
+    assert pd.isna(parsed.iloc[2])
+
+
+def test_timestamp_parser_evicts_after_lookup(monkeypatch):
+    """Test that a full cache mixing old and new values still parses."""
+    monkeypatch.setattr(TimestampParser, "MAX_SEEN", 3)
+    parser = TimestampParser()
+    a, b, c, d = (f"1/{day}/2026 21:00:00" for day in range(5, 9))
+
+    parser.parse(pd.Series([a, b]))
+    parsed = parser.parse(pd.Series([a, c, d]))
+
+    assert parsed.dt.day.tolist() == [5, 7, 8]
+    assert len(parser._seen) <= 3
+
+
+def test_projection_fetches_only_requested_columns(client):
+    """Test that requested fields map to batched column ranges."""
+    df = client.get_all_data(fields=["coding", "sleep"])
+
+    assert "A2:B" in _ranges(client.worksheet)
+    assert "D2:D" in _ranges(client.worksheet)
+    assert "C2:C" not in _ranges(client.worksheet)
+    assert set(df.columns) == {
+        "timestamp", "coding", "sleep", "coding_value", "sleep_value"
+    }
+
+
+def test_projection_widens_when_new_fields_requested(client):
+    """Test that asking for an unfetched field refetches the union."""
+    client.get_all_data(fields=["coding"])
+    client.worksheet.requests.clear()
+
+    df = client.get_all_data(fields=["workout"])
+
+    assert {"timestamp", "coding", "workout"} <= set(df.columns)
+    assert "A2:C" in _ranges(client.worksheet)
+
+    client.worksheet.requests.clear()
+    client.get_all_data(fields=["coding"])
+    assert client.worksheet.requests == []
+
+
+def test_iter_chunks_streams_bounded_blocks(client):
+    """Test that the streaming reader pages through fixed-size chunks."""
+    client.worksheet = FakeWorksheet(_make_rows(5))
+
+    chunks = list(client.iter_chunks(chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert _ranges(client.worksheet)[1:] == ["A2:D", "A4:D", "A6:D"]
+    assert all(isinstance(c["coding"].dtype, pd.CategoricalDtype) for c in chunks)
+
+
+def test_chunked_fetch_builds_full_history():
+    """Test that get_all_data reads in chunks but returns one typed frame."""
+    client = SheetsClient(snapshot_dir=None, chunk_size=2)
+    client.worksheet = FakeWorksheet(_make_rows(5))
+    client.worksheet.rows[5][1] = "Skipped"
+
+    df = client.get_all_data()
+
+    assert len(df) == 5
+    assert isinstance(df["coding"].dtype, pd.CategoricalDtype)
+    assert df["coding"].tolist() == ["Yes"] * 4 + ["Skipped"]
+
+
+def test_history_is_sorted_after_out_of_order_rows(client):
+    """Test that late-arriving rows are merged in timestamp order."""
+    client.get_all_data()
+    client.worksheet.rows.append(["1/1/2026 21:00:00", "No", "No", "5 hrs"])
+    client.invalidate_cache()
+
+    df = client.get_all_data()
+
+    assert df["timestamp"].is_monotonic_increasing
+    assert df["coding"].iloc[0] == "No"
+
+
+def test_slice_time_range_is_inclusive():
+    """Test binary-search window selection."""
+    df = sort_by_timestamp(
+        pd.DataFrame(
+            {
+                "timestamp": pd.to_datetime(
+                    ["2026-01-07", None, "2026-01-05", "2026-01-06", "2026-01-08"]
+                ),
+                "coding": ["c", "x", "a", "b", "d"],
+            }
+        )
+    )
+
+    window = slice_time_range(df, pd.Timestamp("2026-01-06"), pd.Timestamp("2026-01-07"))
+    assert window["coding"].tolist() == ["b", "c"]
+
+    assert slice_time_range(df, start=pd.Timestamp("2026-01-07"))[
+        "coding"
+    ].tolist() == ["c", "d"]
+    assert len(slice_time_range(df)) == 4
+    assert slice_time_range(df, pd.Timestamp("2027-01-01")).empty
+
+
+def test_locate_rows_reads_only_the_timestamp_column(client):
+    """Test that a window is located from column A alone."""
+    client.worksheet = FakeWorksheet(_make_rows(10))
+
+    rows = client.locate_rows(
+        pd.Timestamp("2026-01-07"), pd.Timestamp("2026-01-09 23:59")
+    )
+
+    assert rows == (4, 6)
+    assert _ranges(client.worksheet) == ["row 1", "A2:A"]
+    assert client.locate_rows(last=3) == (9, 11)
+    assert client.locate_rows(pd.Timestamp("2027-01-01")) == (12, 11)
+
+
+def test_window_fetches_only_its_rows(client):
+    """Test that date-range and last-N queries download only their rows."""
+    client.worksheet = FakeWorksheet(_make_rows(10))
+
+    df = client.get_date_range_data(
+        pd.Timestamp("2026-01-07"), pd.Timestamp("2026-01-09 23:59")
+    )
+    assert df["timestamp"].dt.day.tolist() == [7, 8, 9]
+    assert client.worksheet.requests[-1] == "A4:D6"
+
+    entries = client.get_entries(last=2)
+    assert [entry.timestamp.day for entry in entries] == [13, 14]
+    assert client.worksheet.requests[-1] == "A10:D11"
+
+    # Empty windows are located from the cached column without any request
+    client.worksheet.requests.clear()
+    assert client.get_date_range_data(pd.Timestamp("2027-01-01")).empty
+    assert client.get_entries(start=pd.Timestamp("2027-01-01")) == []
+    assert client.worksheet.requests == []
+
+
+def test_window_queries_share_one_column_read(client):
+    """Test that window queries within the TTL read the timestamps once."""
+    client.worksheet = FakeWorksheet(_make_rows(10))
+
+    for day in range(5, 10):
+        df = client.get_date_range_data(
+            pd.Timestamp(f"2026-01-{day:02d}"), pd.Timestamp(f"2026-01-{day:02d} 23:59")
+        )
+        assert df["timestamp"].dt.day.tolist() == [day]
+
+    assert _ranges(client.worksheet) == ["row 1", "A2:A"] + [
+        f"A{row}:D" for row in range(2, 7)
+    ]
+
+
+def test_window_query_updates_held_history(client):
+    """Test that a held history is refreshed instead of fetching a range."""
+    client.get_all_data()
+    client.worksheet.rows.append(["1/8/2026 21:00:00", "No", "Yes", "8 hrs"])
+    client.worksheet.requests.clear()
+    client.invalidate_cache()
+
+    df = client.get_date_range_data(pd.Timestamp("2026-01-07"))
+
+    assert df["timestamp"].dt.day.tolist() == [7, 8]
+    assert _ranges(client.worksheet) == ["row 1", "A2:A", "A5:D"]
+
+
+def test_window_without_timestamps_falls_back_to_full_fetch(client):
+    """Test that a sheet without timestamps is fetched whole."""
+    client.worksheet = FakeWorksheet([["Workout ?"], ["Yes"], ["No"], ["Yes"]])
+
+    df = client.get_date_range_data(last=2)
+
+    assert df["workout"].tolist() == ["No", "Yes"]
+
+
+class FakeCredentials:
+    """Stand-in for service-account credentials."""
+
+    def __init__(self):
+        self.token = None
+        self.expiry = None
+
+    @property
+    def expired(self):
+        return self.expiry is not None and datetime.utcnow() >= self.expiry
+
+
+class FakeSession:
+    """Stand-in for an authorized HTTP session."""
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeClient:
+    """Stand-in for an authorized gspread client."""
+
+    def __init__(self, auth):
+        self.auth = auth
+        self.session = FakeSession()
+        self.opened = 0
+
+    def open_by_key(self, key):
+        self.opened += 1
+        if key == "missing":
+            raise ValueError("Spreadsheet not found")
+        spreadsheet = FakeSpreadsheet()
+        spreadsheet.title = "Responses"
+        worksheet = FakeWorksheet(_make_rows(1))
+        worksheet.spreadsheet = spreadsheet
+        spreadsheet.get_worksheet = lambda index: worksheet
+        return spreadsheet
+
+
+@pytest.fixture
+def fake_auth(monkeypatch, tmp_path):
+    """Replace Google auth with fakes and count authorizations."""
+    calls = {"authorize": 0}
+
+    def authorize(creds):
+        calls["authorize"] += 1
+        creds.token = "token-abc"
+        creds.expiry = datetime.utcnow() + timedelta(hours=1)
+        return FakeClient(creds)
+
+    monkeypatch.setattr(
+        Credentials,
+        "from_service_account_file",
+        lambda path, scopes: FakeCredentials(),
+    )
+    monkeypatch.setattr(gspread, "authorize", authorize)
+    monkeypatch.setattr(sheets_client, "TOKEN_CACHE_DIR", tmp_path / "tokens")
+    sheets_client.clear_session_pool()
+    yield calls
+    sheets_client.clear_session_pool()
+
+
+def test_connections_share_pooled_session(fake_auth):
+    """Test that many clients reuse one authorized session and worksheet."""
+    first = SheetsClient(snapshot_dir=None)
+    second = SheetsClient(snapshot_dir=None)
+    first.sheet_id = second.sheet_id = "sheet-123"
+    first.connect()
+    second.connect()
+
+    assert fake_auth["authorize"] == 1
+    assert first.client is second.client
+    assert first.worksheet is second.worksheet
+    assert first.client.opened == 1
+
+
+def test_access_token_is_reused_across_runs(fake_auth, tmp_path):
+    """Test that a cached, unexpired token is loaded into new credentials."""
+    client = SheetsClient(snapshot_dir=None)
+    client.sheet_id = "sheet-123"
+    client.connect()
+
+    token_files = list((tmp_path / "tokens").iterdir())
+    assert len(token_files) == 1
+    assert token_files[0].stat().st_mode & 0o777 == 0o600
+
+    sheets_client.clear_session_pool()
+    creds = FakeCredentials()
+    sheets_client._load_cached_token(creds, client.credentials_path)
+    assert creds.token == "token-abc"
+
+
+def test_fetch_many_returns_frames_and_errors(fake_auth):
+    """Test concurrent multi-sheet fetching with per-sheet errors."""
+    results = sheets_client.fetch_many(
+        ["sheet-a", "sheet-b", "missing"], max_workers=2, snapshot_dir=None
+    )
+
+    assert set(results) == {"sheet-a", "sheet-b", "missing"}
+    assert len(results["sheet-a"]) == 1
+    assert len(results["sheet-b"]) == 1
+    assert isinstance(results["missing"], ValueError)
+    assert fake_auth["authorize"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""Unit tests for Alpha-X trends module."""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from metrics import add_value_columns
+from trends import compute_trends, fit_slopes, weekly_values
+
+
+def make_history(days, coding):
+    """Create daily entries for the given days of 2026."""
+    start = pd.Timestamp(2026, 1, 1, 21)
+    df = pd.DataFrame(
+        {
+            "timestamp": [start + pd.Timedelta(days=d) for d in days],
+            "coding": coding,
+            "sleep": ["7 hrs"] * len(days),
+        }
+    )
+    return add_value_columns(df)
+
+
+def test_weekly_values_bucket_calendar_weeks():
+    """Test that entries are grouped Monday-Sunday and empty weeks stay NaN."""
+    # Jan 1 2026 is a Thursday; days 0-3 fall in the week of Dec 29
+    days = [0, 1, 2, 3, 4, 5, 18]
+    df = make_history(days, ["Yes", "No", "Yes", "Yes", "Yes", "No", "Yes"])
+
+    mondays, values = weekly_values(df)
+
+    assert list(mondays) == [
+        pd.Timestamp(2025, 12, 29),
+        pd.Timestamp(2026, 1, 5),
+        pd.Timestamp(2026, 1, 12),
+        pd.Timestamp(2026, 1, 19),
+    ]
+    assert values["coding"].iloc[0] == pytest.approx(0.75)
+    assert values["coding"].iloc[1] == pytest.approx(0.5)
+    assert np.isnan(values["coding"].iloc[2])
+    assert values["coding"].iloc[3] == 1.0
+    assert (values["sleep"].dropna() == 7.0).all()
+
+
+def test_fit_slopes_matches_polyfit():
+    """Test the vectorized fit against numpy's per-column polyfit."""
+    values = pd.DataFrame(
+        {
+            "coding": [0.2, 0.4, np.nan, 0.9, 1.0],
+            "sleep": [6.0, 6.5, 7.0, 6.0, 7.5],
+            "workout": [np.nan, np.nan, 1.0, np.nan, np.nan],
+        }
+    )
+
+    trends = fit_slopes(values)
+
+    for field in ["coding", "sleep"]:
+        present = values[field].notna().to_numpy()
+        x = np.arange(len(values))[present]
+        slope, intercept = np.polyfit(x, values[field].to_numpy()[present], 1)
+        assert trends.at[field, "slope"] == pytest.approx(slope)
+        assert trends.at[field, "start"] == pytest.approx(intercept)
+        assert trends.at[field, "change"] == pytest.approx(slope * 4)
+    assert trends.at["coding", "weeks"] == 4
+    assert np.isnan(trends.at["workout", "slope"])
+
+
+def test_compute_trends_over_quarter_window():
+    """Test that a longer window and a sliced window use the same engine."""
+    # Coding gets one more day per week over 13 weeks
+    days = np.arange(91)
+    coding = ["Yes" if (d % 7) < min(d // 7, 7) else "No" for d in days]
+    df = make_history(days, coding)
+
+    quarter = compute_trends(df)
+    month = compute_trends(
+        df, start=pd.Timestamp(2026, 3, 1), end=pd.Timestamp(2026, 3, 31, 23)
+    )
+
+    assert quarter.at["coding", "weeks"] == 14
+    assert quarter.at["coding", "slope"] > 0
+    assert quarter.at["sleep", "slope"] == pytest.approx(0.0)
+    # By March every week is all "Yes", so the month is flat
+    assert month.at["coding", "slope"] == pytest.approx(0.0)
+
+
+def test_compute_trends_without_entries():
+    """Test that an empty window gives an empty table."""
+    trends = compute_trends(make_history([], []))
+
+    assert trends.empty
+    assert "slope" in trends.columns
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])